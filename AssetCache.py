@@ -0,0 +1,296 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Import statements
+import pygame
+import atexit
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+# Import the shared background writer, entries are written off the loading thread
+from BackgroundWriter import BackgroundWriter
+
+# Constants
+CACHE_DIR = 'Extras/AssetCache'             # Folder the processed images are kept in between launches
+INDEX_NAME = 'index.json'                   # File in the cache folder listing the sources and the entries built from them
+CACHE_VERSION = 1                           # Bumped whenever the entry layout changes, older caches are then thrown away
+ENTRY_MAGIC = b'FNAC'                       # First bytes of every entry file
+ENTRY_HEADER = struct.Struct('<4sHHII')     # Magic, version, padding, width, height, so the pixels start 16 bytes in
+PIXEL_FORMAT = 'BGRA'                       # Byte order of the stored pixels, the same layout convert_alpha gives the display
+
+class AssetCache(BackgroundWriter):
+    """
+    AssetCache CLASS TO KEEP FINISHED IMAGES ON DISK AS RAW PIXELS, SO LATER LAUNCHES MAP THEM IN INSTEAD OF DECODING AND SCALING
+    """
+    def __init__(self, folder=CACHE_DIR):
+        """
+        PURPOSE: DEFINES THE CACHE FOLDER, READS ITS INDEX AND PREPARES THE WRITE QUEUE
+        PARAMETER(S): folder (str): The folder the entries and the index are kept in
+        RETURN: NONE
+        """
+
+        # Entries and index snapshots are written by a thread that is only started by the first miss
+        super().__init__('AssetCache')
+
+        self.folder = folder
+        self.hashes = {}        # Content hash of each source file checked this session, keyed by path
+
+        # The index maps each source to its (modification time, size, hash) and each entry to the sources it was built from
+        self.sources = {}
+        self.entries = {}
+
+        # Every image each render resolution has asked the cache for, as (paths, tag) pairs keyed by resolution, so
+        # streaming can tell which files a launch at that resolution will still have to decode
+        self.requests = {}
+        self.readIndex()
+
+        atexit.register(self.close)
+
+    def readIndex(self):
+        """
+        PURPOSE: Load the index, starting a new cache when it is missing, damaged or from another version.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        try:
+            with open(os.path.join(self.folder, INDEX_NAME), 'r') as file:
+                index = json.load(file)
+
+            if index.get('version') == CACHE_VERSION:
+                self.sources = index['sources']
+                self.entries = index['entries']
+                self.requests = {group: {(tuple(paths), tag) for paths, tag in requests} for group, requests in index.get('requests', {}).items()}
+
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def sourceHash(self, path):
+        """
+        PURPOSE: Get the content hash of a source file, only reading the file when it changed since it was last hashed.
+        PARAMETER(S): path (str): The source file.
+        RETURN: str. Returns the hash, or None if the file can't be read.
+        """
+
+        digest = self.hashes.get(path)
+
+        if digest is not None:
+            return digest
+
+        try:
+            stat = os.stat(path)
+            known = self.sources.get(path)
+
+            if known is not None and known[0] == stat.st_mtime_ns and known[1] == stat.st_size:
+                digest = known[2]
+
+            else:
+                with open(path, 'rb') as file:
+                    digest = hashlib.sha1(file.read()).hexdigest()
+
+                # Entries built from an older version of the file can never be found again, so their space is reclaimed
+                if known is not None and known[2] != digest:
+                    self.prune(path)
+
+                self.sources[path] = [stat.st_mtime_ns, stat.st_size, digest]
+                self.queueIndex()
+
+        except OSError:
+            return None
+
+        self.hashes[path] = digest
+
+        return digest
+
+    def entryName(self, paths, tag):
+        """
+        PURPOSE: Name the entry of an image built from some source files.
+        PARAMETER(S): paths (List[str]): The source files the image is built from.
+                      tag (str): Describes how the image was built from them, such as its size and flips.
+        RETURN: str. Returns the entry's file name, which changes whenever a source does, or None if a source can't be read.
+        """
+
+        digests = [self.sourceHash(path) for path in paths]
+
+        if None in digests:
+            return None
+
+        # The paths are part of the name too, so pruning one file's entries never touches a copy of it under another name
+        return hashlib.sha1('|'.join(list(paths) + digests + [tag]).encode()).hexdigest()[:24] + '.raw'
+
+    def request(self, group, paths, tag):
+        """
+        PURPOSE: Remember that an image is needed at a render resolution, whether or not it is cached yet.
+        PARAMETER(S): group (str): The render resolution, such as '1280x720'.
+                      paths (List[str]): The source files the image is built from.
+                      tag (str): Describes how the image is built from them.
+        RETURN: None. Only a request not seen before changes the index.
+        """
+
+        requests = self.requests.setdefault(group, set())
+        key = (tuple(paths), tag)
+
+        if key not in requests:
+            requests.add(key)
+            self.queueIndex()
+
+    def ready(self, group, path):
+        """
+        PURPOSE: Check whether every image built from a source file that the render resolution asked for earlier is cached.
+        PARAMETER(S): group (str): The render resolution, such as '1280x720'.
+                      path (str): The source file.
+        RETURN: bool. Returns True only if those exact images can be mapped in, so the file never has to be decoded.
+        """
+
+        needed = [(paths, tag) for paths, tag in self.requests.get(group, ()) if path in paths]
+
+        # A file this resolution never asked for, like every file on the first launch at a new tier, must be decoded
+        return bool(needed) and all(self.entryName(paths, tag) in self.entries for paths, tag in needed)
+
+    def get(self, paths, tag):
+        """
+        PURPOSE: Map a cached image into memory, its pixels are read straight from the file as they are first drawn.
+        PARAMETER(S): paths (List[str]): The source files the image is built from.
+                      tag (str): Describes how the image was built from them.
+        RETURN: pygame.Surface. Returns the image sharing the mapped file's memory, or None if it isn't cached.
+        """
+
+        name = self.entryName(paths, tag)
+
+        if name is None or name not in self.entries:
+            return None
+
+        try:
+            with open(os.path.join(self.folder, name), 'rb') as file:
+                # A private copy-on-write mapping, drawing onto the image can never change the file
+                pixels = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+            magic, version, _, width, height = ENTRY_HEADER.unpack_from(pixels)
+
+            if magic != ENTRY_MAGIC or version != CACHE_VERSION or len(pixels) != ENTRY_HEADER.size + width * height * 4:
+                raise ValueError("Damaged cache entry")
+
+            # The surface keeps the mapping alive for as long as it is used
+            return pygame.image.frombuffer(memoryview(pixels)[ENTRY_HEADER.size:], (width, height), PIXEL_FORMAT)
+
+        except (OSError, ValueError, struct.error):
+            # Build it again and overwrite the entry
+            del self.entries[name]
+
+            return None
+
+    def put(self, paths, tag, surface):
+        """
+        PURPOSE: Queue a finished image to be stored, so the next launch can map it in.
+        PARAMETER(S): paths (List[str]): The source files the image was built from.
+                      tag (str): Describes how the image was built from them.
+                      surface (pygame.Surface): The finished image.
+        RETURN: None. The file is written by the cache's writer thread.
+        """
+
+        name = self.entryName(paths, tag)
+
+        if name is None:
+            return
+
+        # Copying the pixels out is the only part done on the calling thread
+        width, height = surface.get_size()
+        data = ENTRY_HEADER.pack(ENTRY_MAGIC, CACHE_VERSION, 0, width, height) + pygame.image.tobytes(surface, PIXEL_FORMAT)
+
+        self.entries[name] = list(paths)
+        self.queueWrite(('entry', (name, data)))
+        self.queueIndex()
+
+    def prune(self, path):
+        """
+        PURPOSE: Delete every entry built from a source file.
+        PARAMETER(S): path (str): The source file that changed.
+        RETURN: None. The files are removed by the writer thread.
+        """
+
+        for name in [name for name, sources in self.entries.items() if path in sources]:
+            del self.entries[name]
+            self.queueWrite(('remove', name))
+
+    def queueIndex(self):
+        """
+        PURPOSE: Queue a snapshot of the index to be saved, only the newest snapshot in a batch is written.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        requests = {group: [[list(paths), tag] for paths, tag in sorted(requests)] for group, requests in self.requests.items()}
+        self.queueWrite(('index', json.dumps({'version': CACHE_VERSION, 'sources': self.sources, 'entries': self.entries, 'requests': requests})))
+
+    def writeBatch(self, batch):
+        """
+        PURPOSE: Write the entries and removals of one batch, then the newest index snapshot in it.
+        PARAMETER(S): batch (List[tuple]): The (kind, value) pairs queued since the last batch, oldest first.
+        RETURN: None. A read-only or full disk only costs the speedup, the game carries on without a cache.
+        """
+
+        index = None
+
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+
+        except OSError:
+            return
+
+        # Each write is tried on its own, so one failure never keeps the rest of the batch or the index off the disk
+        for kind, value in batch:
+            try:
+                if kind == 'entry':
+                    self.writeFile(*value)
+
+                elif kind == 'remove':
+                    os.remove(os.path.join(self.folder, value))
+
+                else:
+                    index = value
+
+            except OSError:
+                pass
+
+        # The index goes last, so it never lists an entry that was written after it. An entry that failed to write is
+        # still listed, get() then finds its file missing and builds the image again
+        if index is not None:
+            try:
+                self.writeFile(INDEX_NAME, index.encode())
+
+            except OSError:
+                pass
+
+    def writeFile(self, name, data):
+        """
+        PURPOSE: Write a file in the cache folder so it is either complete or not there at all.
+        PARAMETER(S): name (str): The file name.
+                      data (bytes): The contents.
+        RETURN: None.
+        """
+
+        path = os.path.join(self.folder, name)
+
+        try:
+            with open(path + '.tmp', 'wb') as file:
+                file.write(data)
+
+            os.replace(path + '.tmp', path)
+
+        except OSError:
+            # Don't leave a half written file behind
+            try:
+                os.remove(path + '.tmp')
+
+            except OSError:
+                pass
+
+            raise
@@ -0,0 +1,345 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Import statements
+import pygame
+import asyncio
+import math
+
+# Import the sprite sheet packer, the on-disk image cache and the render resolution
+from SpriteAtlas import SpriteAtlas
+from AssetCache import AssetCache
+from Config import view
+
+# Constants
+PULSE_STEPS = 64        # Number of precomputed frames in one pulse animation cycle
+ROTATION_STEPS = 180    # Number of precomputed frames in one full rotation
+
+class AssetManager:
+    """
+    AssetManager CLASS TO LOAD EVERY IMAGE AND SOUND ONCE AND CACHE THE SCALED, FLIPPED AND ROTATED VARIANTS
+    """
+    def __init__(self):
+        """
+        PURPOSE: DEFINES THE CACHES FOR DECODED IMAGES, IMAGE VARIANTS AND SOUNDS
+        PARAMETER(S): NONE
+        RETURN: NONE
+        """
+
+        self.images = {}    # Decoded images keyed by file path
+        self.variants = {}  # Transformed images keyed by (path, size, flipX, flipY, angle)
+        self.sounds = {}    # Sounds keyed by file path
+        self.frames = {}    # Precomputed animation frame lists keyed by animation
+        self.atlases = {}   # Packed sprite sheets keyed by (paths, frame height)
+
+        # Finished images from earlier launches, mapped in from disk instead of being decoded and scaled again
+        self.cache = AssetCache()
+
+    def load(self, path):
+        """
+        PURPOSE: Decode an image file the first time it is asked for, converting it to the display format when a display exists.
+        PARAMETER(S): path (str): The image file to load.
+        RETURN: pygame.Surface. Returns the cached full-size image.
+        """
+
+        img = self.images.get(path)
+
+        if img is None:
+            # An unchanged full-size image kept on disk is already in the display format
+            img = self.cache.get([path], 'orig')
+            img = self.images[path] = img if img is not None else self.store(path, pygame.image.load(path))
+
+        return img
+
+    def cached(self, paths, tag, build):
+        """
+        PURPOSE: Get a finished image from the on-disk cache, building and storing it only when it isn't there.
+        PARAMETER(S): paths (List[str]): The image files it is built from.
+                      tag (str): Describes how it is built from them, such as its size and flips.
+                      build (callable): Makes the image when it isn't cached, taking no arguments.
+        RETURN: pygame.Surface. Returns the finished image.
+        """
+
+        self.cache.request(cacheGroup(), paths, tag)
+        img = self.cache.get(paths, tag)
+
+        if img is None:
+            img = build()
+            self.cache.put(paths, tag, img)
+
+        return img
+
+    def store(self, path, img):
+        """
+        PURPOSE: Cache a decoded image, converting it to the display format when a display exists.
+        PARAMETER(S): path (str): The image file the image was decoded from.
+                      img (pygame.Surface): The decoded image.
+        RETURN: pygame.Surface. Returns the cached image, the one already cached if the path was loaded meanwhile.
+        """
+
+        if path in self.images:
+            return self.images[path]
+
+        # Headless runs have no display to convert to, they keep the decoded format
+        if pygame.display.get_surface() is not None:
+            img = img.convert_alpha()
+
+        self.images[path] = img
+
+        return img
+
+    async def stream(self, imagePaths, soundPaths=(), progress=None):
+        """
+        PURPOSE: Load images and sounds in the background, decoding on worker threads while the frame loop keeps running.
+        PARAMETER(S): imagePaths (List[str]): Image files to load.
+                      soundPaths (List[str]): Sound files to load.
+                      progress (callable): Called with the number of files done and the total after each one, or None.
+        RETURN: None. Every file is cached once this finishes, files that fail are left for a normal load to report.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        # Files whose every image this render resolution asks for is on disk don't need decoding at all
+        images = [path for path in imagePaths if path not in self.images and not self.cache.ready(cacheGroup(), path)]
+        sounds = [path for path in soundPaths if path not in self.sounds]
+        total = len(images) + len(sounds)
+
+        # Decoding releases the GIL, so every file decodes at once while the menu keeps drawing
+        pending = [(self.store, path, loop.run_in_executor(None, pygame.image.load, path)) for path in images]
+        pending += [(self.sounds.setdefault, path, loop.run_in_executor(None, pygame.mixer.Sound, path)) for path in sounds]
+
+        for done, (cache, path, future) in enumerate(pending, 1):
+            try:
+                # Converting to the display format touches the display, so it happens back on the main thread
+                cache(path, await future)
+
+            except (pygame.error, OSError):
+                pass
+
+            if progress is not None:
+                progress(done, total)
+
+    def image(self, path, size=None, flipX=False, flipY=False, angle=0, scaled=True):
+        """
+        PURPOSE: Get an image, scaled, flipped and rotated as requested, building each variant only once.
+        PARAMETER(S): path (str): The image file to use.
+                      size (tuple): The (width, height) to scale to in design pixels, or None to keep the original size.
+                      flipX (bool): Whether to mirror the image horizontally.
+                      flipY (bool): Whether to mirror the image vertically.
+                      angle (float): Counterclockwise rotation in degrees.
+                      scaled (bool): Whether the image is for drawing, and so scaled on to the render resolution. False
+                      keeps it in design pixels, for collision masks the simulation needs at every resolution.
+        RETURN: pygame.Surface. Returns the cached image variant.
+        """
+
+        # Each render resolution gets its own variants, scaled once from the original
+        if scaled and view.scale != 1:
+            if size is None:
+                # Only the decoded file knows its own size, so the file is needed at this resolution even when the variant is cached
+                self.cache.request(cacheGroup(), [path], 'orig')
+                size = self.load(path).get_size()
+
+            size = view.px(*size)
+
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+
+        key = (path, size, flipX, flipY, angle)
+        img = self.variants.get(key)
+
+        if img is None:
+            img = self.variants[key] = self.cached([path], variantTag(size, flipX, flipY, angle), lambda: self.transform(path, size, flipX, flipY, angle))
+
+        return img
+
+    def transform(self, path, size, flipX, flipY, angle):
+        """
+        PURPOSE: Build an image variant from the decoded file.
+        PARAMETER(S): path (str): The image file to use.
+                      size (tuple): The (width, height) to scale to, or None to keep the original size.
+                      flipX (bool): Whether to mirror the image horizontally.
+                      flipY (bool): Whether to mirror the image vertically.
+                      angle (float): Counterclockwise rotation in degrees.
+        RETURN: pygame.Surface. Returns the new variant.
+        """
+
+        img = self.load(path)
+
+        if size is not None:
+            img = pygame.transform.scale(img, size)
+
+        if flipX or flipY:
+            img = pygame.transform.flip(img, flipX, flipY)
+
+        if angle:
+            img = pygame.transform.rotate(img, angle)
+
+        return img
+
+    def pulseFrames(self, path, size, base, amplitude, steps=PULSE_STEPS):
+        """
+        PURPOSE: Precompute the frames of an image pulsing in size, scale = base + amplitude * sin(phase).
+        PARAMETER(S): path (str): The image file to animate.
+                      size (tuple): The (width, height) the scale factor applies to, in design pixels.
+                      base (float): The scale factor at the middle of the pulse.
+                      amplitude (float): How far the scale factor swings either side of base.
+                      steps (int): The number of frames in one cycle.
+        RETURN: List[pygame.Surface]. Returns the cached frames, one per phase step.
+        """
+
+        size = view.px(*size)
+        key = ('pulse', path, size, base, amplitude, steps)
+        frames = self.frames.get(key)
+
+        if frames is None:
+            frames = []
+            scaled = {}  # Steps that round to the same size share a single surface
+
+            for i in range(steps):
+                scaleFactor = base + amplitude * math.sin(2 * math.pi * i / steps)
+                frameSize = (int(size[0] * scaleFactor), int(size[1] * scaleFactor))
+
+                # Kept out of the variant cache so releasing the animation frees every frame
+                if frameSize not in scaled:
+                    scaled[frameSize] = self.cached([path], variantTag(frameSize), lambda: pygame.transform.scale(self.load(path), frameSize))
+
+                frames.append(scaled[frameSize])
+
+            self.frames[key] = frames
+
+        return frames
+
+    def rotationFrames(self, name, surface, steps=ROTATION_STEPS):
+        """
+        PURPOSE: Precompute the frames of a surface spinning through a full counterclockwise turn.
+        PARAMETER(S): name (str): A unique name for the animation.
+                      surface (pygame.Surface): The upright image to rotate.
+                      steps (int): The number of frames in one turn.
+        RETURN: List[pygame.Surface]. Returns the cached frames, frame i rotated by 360 * i / steps degrees.
+        """
+
+        key = ('rotation', name, steps)
+        frames = self.frames.get(key)
+
+        if frames is None:
+            frames = self.frames[key] = [pygame.transform.rotate(surface, 360 * i / steps) for i in range(steps)]
+
+        return frames
+
+    def atlas(self, paths, height, scaled=True):
+        """
+        PURPOSE: Pack the frames of an animation, upright and flipped, into one sprite sheet, building it only once.
+        PARAMETER(S): paths (List[str]): The image files of the frames, in order.
+                      height (int): The height every frame is scaled to in design pixels, keeping the first frame's proportions.
+                      scaled (bool): Whether the sheet is for drawing, and so scaled on to the render resolution.
+        RETURN: SpriteAtlas. Returns the cached sheet.
+        """
+
+        if scaled:
+            height = view.px(height)
+
+        key = (tuple(paths), int(height))
+        atlas = self.atlases.get(key)
+
+        if atlas is None:
+            self.cache.request(cacheGroup(), paths, f'atlas{int(height)}')
+            sheet = self.cache.get(paths, f'atlas{int(height)}')
+
+            if sheet is not None:
+                atlas = self.atlases[key] = SpriteAtlas.fromSheet(sheet, len(paths))
+
+            else:
+                atlas = self.atlases[key] = SpriteAtlas([self.load(path) for path in paths], int(height))
+                self.cache.put(paths, f'atlas{int(height)}', atlas.sheet)
+
+                # The sheet holds everything the frames need, so the decoded files are let go
+                for path in paths:
+                    self.release(path)
+
+        return atlas
+
+    def release(self, path):
+        """
+        PURPOSE: Forget an image and every variant of it, so its memory is freed once nothing else holds it.
+        PARAMETER(S): path (str): The image file to release.
+        RETURN: None. The next request for the image loads it again.
+        """
+
+        self.images.pop(path, None)
+
+        for key in [key for key in self.variants if key[0] == path]:
+            del self.variants[key]
+
+    def releaseFrames(self, *names):
+        """
+        PURPOSE: Forget precomputed animations, so their frames are freed once nothing else holds them.
+        PARAMETER(S): names (str): The image paths of pulse animations or the names of rotation animations.
+        RETURN: None. The next request for an animation builds it again.
+        """
+
+        for key in [key for key in self.frames if key[1] in names]:
+            del self.frames[key]
+
+    def sound(self, path):
+        """
+        PURPOSE: Load a sound effect the first time it is asked for.
+        PARAMETER(S): path (str): The sound file to load.
+        RETURN: pygame.mixer.Sound. Returns the cached sound.
+        """
+
+        snd = self.sounds.get(path)
+
+        if snd is None:
+            snd = self.sounds[path] = pygame.mixer.Sound(path)
+
+        return snd
+
+def cacheGroup():
+    """
+    PURPOSE: Name the render resolution for the on-disk cache, each one asks it for its own set of images.
+    PARAMETER(S): None.
+    RETURN: str. Returns the render resolution, such as '1280x720'.
+    """
+
+    return f'{view.width}x{view.height}'
+
+def variantTag(size=None, flipX=False, flipY=False, angle=0):
+    """
+    PURPOSE: Describe an image variant for the on-disk cache.
+    PARAMETER(S): size (tuple): The (width, height) it is scaled to, or None for the original size.
+                  flipX (bool): Whether it is mirrored horizontally.
+                  flipY (bool): Whether it is mirrored vertically.
+                  angle (float): Its counterclockwise rotation in degrees.
+    RETURN: str. Returns a tag such as '360x258' or 'orig-flipY'.
+    """
+
+    tag = 'orig' if size is None else f'{size[0]}x{size[1]}'
+
+    if flipX:
+        tag += '-flipX'
+
+    if flipY:
+        tag += '-flipY'
+
+    if angle:
+        tag += f'-rot{angle}'
+
+    return tag
+
+def phaseFrame(frames, phase):
+    """
+    PURPOSE: Pick the precomputed frame of a looping animation closest below a phase angle.
+    PARAMETER(S): frames (List[pygame.Surface]): One animation cycle, as built by AssetManager.pulseFrames.
+                  phase (float): The animation phase in radians.
+    RETURN: pygame.Surface. Returns the frame to draw.
+    """
+
+    return frames[int(phase * len(frames) / (2 * math.pi)) % len(frames)]
+
+# Shared asset manager used by every part of the game
+assetMngr = AssetManager()
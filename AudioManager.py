@@ -0,0 +1,250 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Import statements
+import pygame
+import time
+
+# Import the shared loader, sounds are decoded once and kept with the images
+from AssetManager import assetMngr
+
+# Constants
+CHANNEL_POOLS = {'music': 2, 'ui': 2, 'sfx': 3}             # Mixer channels reserved for each category of sound
+POOL_BUSES = {'music': 'music', 'ui': 'sfx', 'sfx': 'sfx'}  # Volume bus each category of sound is mixed on
+CROSSFADE_MS = 600                                          # Length of the fade between two music tracks
+MUSIC_STOP_MS = 250                                         # Length of the fade when the music stops
+
+class SoundCue:
+    """
+    SoundCue CLASS FOR ONE SOUND EFFECT AND THE LIMITS ON HOW OFTEN IT CAN PLAY AT ONCE
+    """
+    def __init__(self, manager, sound, pool, voices, minGap):
+        """
+        PURPOSE: DEFINES THE SOUND, THE CHANNEL POOL IT PLAYS ON AND ITS VOICE LIMITS
+        PARAMETER(S): manager (AudioManager): The manager that owns the channels
+                      sound (pygame.mixer.Sound): The loaded sound, or None if it couldn't be loaded
+                      pool (str): The CHANNEL_POOLS entry it plays on
+                      voices (int): The most copies of it that may play at once
+                      minGap (float): The shortest time in seconds between two starts, quicker retriggers are dropped
+        RETURN: NONE
+        """
+
+        self.manager = manager
+        self.sound = sound
+        self.pool = pool
+        self.voices = voices
+        self.minGap = minGap
+
+    def play(self):
+        """
+        PURPOSE: Play the sound on its channel pool.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        self.manager.play(self)
+
+class AudioManager:
+    """
+    AudioManager CLASS TO PLAY PRELOADED MUSIC AND SOUND EFFECTS ON RESERVED CHANNEL POOLS MIXED THROUGH VOLUME BUSES
+    """
+    def __init__(self):
+        """
+        PURPOSE: DEFINES THE CHANNEL POOLS, THE LOADED SOUNDS AND THE VOLUME BUSES, THE MIXER IS OPENED BY init()
+        PARAMETER(S): NONE
+        RETURN: NONE
+        """
+
+        self.enabled = False    # Whether an audio device was opened, everything is silently skipped without one
+        self.channels = []      # Every mixer channel, all of them reserved for the pools
+        self.pools = {}         # Channel indices reserved for each category
+        self.playing = {}       # The cue and start time of the last sound started on each channel, keyed by index
+        self.sounds = {}        # Loaded sounds keyed by file path, None for files that couldn't be loaded
+        self.buses = {}         # Bus each loaded sound is mixed on, keyed by file path
+        self.cues = {}          # Sound effect cues keyed by file path
+
+        # Master scales everything, music and sfx scale their own sounds on top of it
+        self.volumes = {'master': 1.0, 'music': 1.0, 'sfx': 1.0}
+
+        # The music channel currently fading in or playing, the track on it and the last music channel used
+        self.musicChannel = None
+        self.musicPath = None
+        self.musicIndex = None
+
+    def init(self):
+        """
+        PURPOSE: Open the audio device and reserve the channel pools.
+        PARAMETER(S): None.
+        RETURN: None. The game plays without sound if no audio device can be opened.
+        """
+
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+
+        except pygame.error:
+            self.enabled = False
+            return
+
+        # Every channel belongs to a pool, so nothing outside the manager can take one from under a playing sound
+        pygame.mixer.set_num_channels(sum(CHANNEL_POOLS.values()))
+        pygame.mixer.set_reserved(sum(CHANNEL_POOLS.values()))
+
+        self.channels = [pygame.mixer.Channel(index) for index in range(sum(CHANNEL_POOLS.values()))]
+        first = 0
+
+        for pool, size in CHANNEL_POOLS.items():
+            self.pools[pool] = list(range(first, first + size))
+            first += size
+
+        self.enabled = True
+
+    def load(self, path, bus):
+        """
+        PURPOSE: Load a sound the first time it is asked for, remembering files that are missing or unreadable.
+        PARAMETER(S): path (str): The sound file to load.
+                      bus (str): The volume bus it is mixed on.
+        RETURN: pygame.mixer.Sound. Returns the cached sound, or None if it can't be played.
+        """
+
+        if path in self.sounds:
+            return self.sounds[path]
+
+        sound = None
+
+        if self.enabled:
+            try:
+                sound = assetMngr.sound(path)
+
+            except (pygame.error, OSError):
+                pass
+
+        # Missing files are only tried once, later requests stay silent instead of touching the disk again
+        self.sounds[path] = sound
+        self.buses[path] = bus
+
+        if sound is not None:
+            sound.set_volume(self.busVolume(bus))
+
+        return sound
+
+    def cue(self, path, pool='sfx', voices=1, minGap=0.0):
+        """
+        PURPOSE: Load a sound effect and set how it is played.
+        PARAMETER(S): path (str): The sound file to load.
+                      pool (str): The CHANNEL_POOLS entry it plays on.
+                      voices (int): The most copies of it that may play at once, the oldest copy is cut off for a new one.
+                      minGap (float): The shortest time in seconds between two starts.
+        RETURN: SoundCue. Returns the cached cue, which plays nothing if the file couldn't be loaded.
+        """
+
+        cue = self.cues.get(path)
+
+        if cue is None:
+            cue = self.cues[path] = SoundCue(self, self.load(path, POOL_BUSES[pool]), pool, voices, minGap)
+
+        return cue
+
+    def play(self, cue):
+        """
+        PURPOSE: Play a sound effect on a channel from its pool, keeping within its voice limits.
+        PARAMETER(S): cue (SoundCue): The sound effect to play.
+        RETURN: None.
+        """
+
+        if cue.sound is None:
+            return
+
+        now = time.perf_counter()
+        channels = self.pools[cue.pool]
+
+        # Copies of this cue still playing, oldest first
+        voices = sorted((self.playing[index][1], index) for index in channels
+                        if index in self.playing and self.playing[index][0] is cue and self.channels[index].get_busy())
+
+        # A retrigger right on top of the last start only makes the sound louder, so it is dropped
+        if voices and now - voices[-1][0] < cue.minGap:
+            return
+
+        if len(voices) >= cue.voices:
+            index = voices[0][1]
+
+        else:
+            # A free channel, otherwise the one playing the oldest sound in the pool
+            free = [index for index in channels if not self.channels[index].get_busy()]
+            index = free[0] if free else min(channels, key=lambda index: self.playing.get(index, (None, 0.0))[1])
+
+        self.channels[index].play(cue.sound)
+        self.playing[index] = (cue, now)
+
+    def playMusic(self, path, fadeMs=CROSSFADE_MS):
+        """
+        PURPOSE: Crossfade to a looping music track, loading it only the first time it is played.
+        PARAMETER(S): path (str): The music file to play.
+                      fadeMs (int): Length of the crossfade in milliseconds.
+        RETURN: None. A track that is already playing carries on from where it is.
+        """
+
+        if not self.enabled or (path == self.musicPath and self.musicChannel is not None and self.musicChannel.get_busy()):
+            return
+
+        sound = self.load(path, 'music')
+
+        # The outgoing track fades out on its own channel while the new one fades in on the other
+        if self.musicChannel is not None:
+            self.musicChannel.fadeout(fadeMs)
+
+        self.musicPath = path
+        self.musicChannel = None
+
+        if sound is not None:
+            # Alternate between the two music channels, the last one used may still be fading out
+            first, second = self.pools['music']
+            self.musicIndex = second if self.musicIndex == first else first
+            self.musicChannel = self.channels[self.musicIndex]
+            self.musicChannel.play(sound, loops=-1, fade_ms=fadeMs)
+
+    def stopMusic(self, fadeMs=MUSIC_STOP_MS):
+        """
+        PURPOSE: Fade out the music.
+        PARAMETER(S): fadeMs (int): Length of the fade in milliseconds.
+        RETURN: None. The next playMusic starts its track from the beginning.
+        """
+
+        if self.musicChannel is not None:
+            self.musicChannel.fadeout(fadeMs)
+
+        self.musicChannel = None
+        self.musicPath = None
+
+    def busVolume(self, bus):
+        """
+        PURPOSE: Get the volume sounds on a bus are played at.
+        PARAMETER(S): bus (str): The volume bus.
+        RETURN: float. Returns the bus volume scaled by the master volume.
+        """
+
+        return self.volumes['master'] * self.volumes[bus]
+
+    def setVolume(self, bus, volume):
+        """
+        PURPOSE: Set the volume of a bus, sounds that are already playing change straight away.
+        PARAMETER(S): bus (str): 'master', 'music' or 'sfx'.
+                      volume (float): The new volume, from 0.0 to 1.0.
+        RETURN: None.
+        """
+
+        self.volumes[bus] = min(1.0, max(0.0, float(volume)))
+
+        # Sound volumes are separate from the channel volumes the fades use, so a fade never undoes a volume change
+        for path, sound in self.sounds.items():
+            if sound is not None:
+                sound.set_volume(self.busVolume(self.buses[path]))
+
+# Shared audio manager used by every part of the game
+audioMngr = AudioManager()
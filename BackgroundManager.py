@@ -9,22 +9,19 @@ DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIG
 # Import statements
 import pygame
 
+# Import the shared asset cache
+from AssetManager import assetMngr
+
 # Star imports from other game files
 from BackgroundManager import *
 from ObstacleManager import *
 from Player import *
 
+# Shared constants
+from Config import *
+
 # Constants
-SCREEN_WIDTH, SCREEN_HEIGHT = 1920, 1080                    # 1920 x 1080 pixels
-BLACK, WHITE, RED = (0, 0, 0), (255, 255, 255), (255, 0, 0) # Define basic colors for now
-SPRITE_SCALE = 0.06                                         # Set sprite size to 6% of entire screen
-MAX_VEL = 5                                                 # Define a max velocity placeholder
-OBSTACLE_WIDTH = 111                                        # Set obstacle width to 5% of screen width
-OBSTACLE_GAP = SCREEN_HEIGHT * 0.2                          # Set obstacle gap to 20% of screen height
-OBSTACLE_SPEED = -4                                         # Move obstacles from right to left at 4px/frame
-ANIMATION_TIME = 10                                         # Set the animation time for the player to a total of 10 ms
-BUTTON_SIZE = (360, 258)                                    # Set buttons to appropriate size to increase visibility
-NUMBER_SIZE = (80, 108)                                     # Size of each number image for score drawing
+COLORKEY = (255, 0, 255)                                    # Transparent colour for layers whose pixels are fully opaque or fully clear
 
 class BackgroundManager:
     """
@@ -37,28 +34,75 @@ class BackgroundManager:
         RETURN: NONE
         """
 
-        # Load background images for the game from the "Assets/Background folder"
-        self.bgImgs = {
-            'sky': pygame.image.load('Assets/Background/sky.png').convert_alpha(),
-            'cloudsBack': pygame.image.load('Assets/Background/cloudsBack.png').convert_alpha(),
-            'cloudsFront': pygame.image.load('Assets/Background/cloudsFront.png').convert_alpha(),
-            'ground': pygame.image.load('Assets/Background/ground.png').convert_alpha()
-        }
+        # The sky never moves and is fully opaque, so it is drawn without blending
+        self.sky = assetMngr.image('Assets/Background/sky.png').convert()
+
+        # Pre-composite each scrolling layer from the "Assets/Background folder" into a double-width strip
+        self.layerKeys = ['cloudsBack', 'cloudsFront', 'ground']
+        self.strips = {}    # Strip surface of each layer
+        self.stripY = {}    # Screen row each strip starts at
+        self.stripArea = {} # Reused source rectangle of each strip's visible window
+
+        for key in self.layerKeys:
+            self.buildStrip(key, assetMngr.image(f'Assets/Background/{key}.png'))
 
         # Load x positions for the background images
         self.bgXPos = {
-            'cloudsBack': [0, SCREEN_WIDTH],
-            'cloudsFront': [0, SCREEN_WIDTH],
-            'ground': [0, SCREEN_WIDTH]
+            'cloudsBack': 0,
+            'cloudsFront': 0,
+            'ground': 0
         }
 
-        # Set movement speeds for the moving background images
+        # Set movement speeds for the moving background images, in render pixels since the layers are drawn at the render resolution
         self.bgSpeeds = {
-            'cloudsBack': -1 * SCREEN_WIDTH / 60,           # Set back clouds movement speed slower than front clouds                                       
-            'cloudsFront': -2 * SCREEN_WIDTH / 60,          # 2x as fast as the back clouds
-            'ground': OBSTACLE_SPEED * SCREEN_WIDTH / 60    # Set the ground movement speed to that of the obstacles
+            'cloudsBack': -1 * view.width / 60,                 # Set back clouds movement speed slower than front clouds                                       
+            'cloudsFront': -2 * view.width / 60,                # 2x as fast as the back clouds
+            'ground': view.px(OBSTACLE_SPEED * TICK_RATE)       # Set the ground movement speed to that of the obstacles
         }
 
+        # Length of the last update, used to interpolate rendering between updates
+        self.lastElapsedTime = 0
+
+        # Blits and pixels pushed by the last draw call, shown in the profiler overlay and recorded by the benchmark
+        self.frameBlits = 0
+        self.framePixels = 0
+
+    def buildStrip(self, key, img):
+        """
+        PURPOSE: Pre-composite a scrolling layer into a strip two screens wide, cropped to the rows it actually covers.
+        PARAMETER(S): key (str): The name of the layer.
+                      img (pygame.Surface): The full-screen layer image.
+        RETURN: None. Stores the strip, its screen row and its source rectangle for the layer.
+        """
+
+        # Only the rows holding visible pixels need to be drawn
+        bounds = img.get_bounding_rect()
+        band = img.subsurface((0, bounds.top, view.width, bounds.height))
+
+        # Layers without partially transparent pixels become opaque strips with a colour key, the rest keep per pixel alpha
+        if pygame.mask.from_surface(img, 254).count() == pygame.mask.from_surface(img, 0).count():
+            strip = pygame.Surface((view.width * 2, bounds.height)).convert()
+            strip.fill(COLORKEY)
+            strip.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        
+        else:
+            strip = pygame.Surface((view.width * 2, bounds.height), pygame.SRCALPHA).convert_alpha()
+
+        # Two copies side by side, so any scroll position is a single window into the strip.
+        # Adding onto the cleared strip copies the pixels exactly instead of blending them.
+        copyFlags = 0 if strip.get_colorkey() else pygame.BLEND_RGBA_ADD
+        strip.blit(band, (0, 0), special_flags=copyFlags)
+        strip.blit(band, (view.width, 0), special_flags=copyFlags)
+
+        # Each layer used to be drawn twice over itself every frame, bake that into the strip to keep the same look
+        if not strip.get_colorkey():
+            strip.blit(band, (0, 0))
+            strip.blit(band, (view.width, 0))
+
+        self.strips[key] = strip
+        self.stripY[key] = bounds.top
+        self.stripArea[key] = pygame.Rect(0, 0, view.width, bounds.height)
+
     def update(self, elapsedTime):
         """
         PURPOSE: Update the background positions for parallax effect based on elapsed time.
@@ -67,27 +111,35 @@ class BackgroundManager:
 
         """
         
+        self.lastElapsedTime = elapsedTime
+
         # Update background positions for a parallax effect
-        for key in self.bgXPos.keys():
+        for key in self.layerKeys:
             # Calculate new position based on speed and elapsed time, wrap around at screen edge
-            self.bgXPos[key] = [(x + self.bgSpeeds[key] * elapsedTime) % SCREEN_WIDTH for x in self.bgXPos[key]]
+            self.bgXPos[key] = (self.bgXPos[key] + self.bgSpeeds[key] * elapsedTime) % view.width
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         PURPOSE: Draw the backgrounds to the screen, layering them to create a parallax effect.
         PARAMETER(S): screen (pygame.Surface): The main game screen where backgrounds are drawn.
+                      alpha (float): How far the display is between the previous update (0) and the current one (1).
         RETURN: None. Directly draws the backgrounds onto the provided screen surface.
 
         """
 
-        # Draw the static sky background first
-        screen.blit(self.bgImgs['sky'], (0, 0))
-
-        # Loop through and draw each moving background layer
-        for key in ['cloudsBack', 'cloudsFront', 'ground']:
-            for xPos in self.bgXPos[key]:
-                # Draw current background image at its current position
-                screen.blit(self.bgImgs[key], (xPos, 0))
-                # If part of the image moves off-screen, draw it again on the opposite end
-                if xPos < SCREEN_WIDTH:
-                    screen.blit(self.bgImgs[key], (xPos - SCREEN_WIDTH, 0))
\ No newline at end of file
+        # Draw the static sky background first, it covers the whole screen
+        screen.blit(self.sky, (0, 0))
+        self.frameBlits = 1
+        self.framePixels = view.width * view.height
+
+        # Draw each moving background layer as one window into its strip
+        for key in self.layerKeys:
+            # Step the layer back by the part of the last update not yet displayed
+            xPos = (self.bgXPos[key] + self.bgSpeeds[key] * self.lastElapsedTime * (alpha - 1)) % view.width
+
+            # The layer's left edge sits at xPos on screen, so the window starts that far before the second copy
+            area = self.stripArea[key]
+            area.x = (view.width - int(xPos)) % view.width
+            screen.blit(self.strips[key], (0, self.stripY[key]), area)
+            self.frameBlits += 1
+            self.framePixels += area.width * area.height
@@ -0,0 +1,145 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Import statements
+import queue
+import threading
+
+# Constants
+CLOSE_TIMEOUT = 5.0     # Most seconds close() waits on the writer thread, each for room in the queue and for it to finish
+
+class BackgroundWriter:
+    """
+    BackgroundWriter CLASS TO BE EXTENDED BY ANYTHING THAT WRITES FILES ON A BACKGROUND THREAD, HANDING IT EVERYTHING QUEUED SO FAR AS ONE BATCH
+    """
+    def __init__(self, name, maxQueued=0):
+        """
+        PURPOSE: DEFINES THE WRITE QUEUE, THE THREAD IS ONLY STARTED BY start() OR THE FIRST WRITE
+        PARAMETER(S): name (str): The name the writer thread is given
+                      maxQueued (int): The most writes that may be waiting at once, 0 for no limit
+        RETURN: NONE
+        """
+
+        self.name = name
+
+        # Writes waiting for the writer thread, each a (kind, value) pair, None asks the thread to stop
+        self.writes = queue.Queue(maxQueued)
+        self.thread = None
+
+    def start(self):
+        """
+        PURPOSE: Start the writer thread if it isn't running.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        if self.thread is None:
+            # Daemon thread so a crash can't leave the process hanging, close() still drains it on every normal exit
+            self.thread = threading.Thread(target=self.writeLoop, name=self.name, daemon=True)
+            self.thread.start()
+
+    def queueWrite(self, write):
+        """
+        PURPOSE: Hand a write to the writer thread without waiting for room in the queue, starting the thread the first time.
+        PARAMETER(S): write (tuple): The (kind, value) pair to apply.
+        RETURN: bool. Returns False if the queue is full and the write was not queued.
+        """
+
+        self.start()
+
+        try:
+            self.writes.put_nowait(write)
+
+        except queue.Full:
+            return False
+
+        return True
+
+    def writeLoop(self):
+        """
+        PURPOSE: Writer thread body, waits for writes and applies everything queued so far as one batch.
+        PARAMETER(S): None.
+        RETURN: None. Runs until close() is called.
+        """
+
+        running = True
+
+        while running:
+            batch = [self.writes.get()]
+
+            # Take whatever else is already waiting so a burst of writes costs one round of file I/O
+            while True:
+                try:
+                    batch.append(self.writes.get_nowait())
+
+                except queue.Empty:
+                    break
+
+            running = None not in batch
+            self.writeBatch([write for write in batch if write is not None])
+
+            for _ in batch:
+                self.writes.task_done()
+
+    def writeBatch(self, batch):
+        """
+        PURPOSE: Apply one batch of writes, called on the writer thread.
+        PARAMETER(S): batch (List[tuple]): The (kind, value) pairs queued since the last batch, oldest first.
+        RETURN: None. Each subclass handles its own errors, so one failed write never stops the rest.
+        """
+
+        pass
+
+    def close(self):
+        """
+        PURPOSE: Write everything still queued and stop the writer thread, safe to call more than once.
+        PARAMETER(S): None.
+        RETURN: None. Returns once every queued write is on disk, or after CLOSE_TIMEOUT if the writer thread is stuck,
+                a later write starts a new writer thread.
+        """
+
+        if self.thread is None:
+            return
+
+        # Waits are bounded, a stuck write must not keep the game from quitting
+        if self.thread.is_alive():
+            try:
+                self.writes.put(None, timeout=CLOSE_TIMEOUT)
+                self.thread.join(CLOSE_TIMEOUT)
+
+            except queue.Full:
+                pass
+
+        # Still writing, leave the daemon thread to it rather than write the same files from two threads
+        if self.thread.is_alive():
+            return
+
+        # A writer thread that died leaves its queue behind, write what is left on this thread instead
+        self.thread = None
+        self.drain()
+
+    def drain(self):
+        """
+        PURPOSE: Apply every write still queued as one batch on the calling thread.
+        PARAMETER(S): None.
+        RETURN: None. Only used once the writer thread is gone.
+        """
+
+        batch = []
+
+        while True:
+            try:
+                batch.append(self.writes.get_nowait())
+
+            except queue.Empty:
+                break
+
+        self.writeBatch([write for write in batch if write is not None])
+
+        for _ in batch:
+            self.writes.task_done()
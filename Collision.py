@@ -0,0 +1,28 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Import statements
+import pygame
+import weakref
+
+# Collision masks keyed by the surface they were built from, dropped automatically once the surface is gone
+maskCache = weakref.WeakKeyDictionary()
+
+def getMask(surface):
+    """
+    PURPOSE: Get the pixel collision mask of a surface, building it only the first time it is asked for.
+    PARAMETER(S): surface (pygame.Surface): The image whose opaque pixels should collide.
+    RETURN: pygame.mask.Mask. Returns the cached mask for the surface.
+    """
+
+    mask = maskCache.get(surface)
+
+    if mask is None:
+        mask = maskCache[surface] = pygame.mask.from_surface(surface)
+
+    return mask
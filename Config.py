@@ -0,0 +1,73 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Constants shared by every game file. Sizes and positions are design pixels: the game is laid out and simulated on a
+# 1920 x 1080 screen whatever resolution it is drawn at, so runs play out identically on every machine
+SCREEN_WIDTH, SCREEN_HEIGHT = 1920, 1080                    # 1920 x 1080 pixels
+BLACK, WHITE, RED = (0, 0, 0), (255, 255, 255), (255, 0, 0) # Define basic colors for now
+SPRITE_SCALE = 0.06                                         # Set sprite size to 6% of entire screen
+MAX_VEL = 5                                                 # Define a max velocity placeholder
+OBSTACLE_WIDTH = 111                                        # Set obstacle width to 5% of screen width
+OBSTACLE_GAP = SCREEN_HEIGHT * 0.2                          # Set obstacle gap to 20% of screen height
+OBSTACLE_SPEED = -4                                         # Move obstacles from right to left at 4px/tick
+BUTTON_SIZE = (360, 258)                                    # Set buttons to appropriate size to increase visibility
+NUMBER_SIZE = (80, 108)                                     # Size of each number image for score drawing
+TICK_RATE = 60                                              # Fixed number of simulation ticks per second
+TICK_TIME = 1 / TICK_RATE                                   # Length of one simulation tick in seconds
+FRAME_RATE = 60                                             # Display frame rate cap, 0 renders uncapped
+
+# Resolutions the game can render at, the finished frame is scaled to fill the window once when it is presented
+RESOLUTION_TIERS = {'720p': (1280, 720), '1080p': (1920, 1080), '1440p': (2560, 1440), '2160p': (3840, 2160)}
+DEFAULT_RESOLUTION = '1080p'
+
+class View:
+    """
+    View CLASS TO MAP DESIGN PIXELS ONTO THE RESOLUTION THE GAME IS RENDERED AT
+    """
+    def __init__(self):
+        """
+        PURPOSE: DEFINES THE RENDER RESOLUTION, STARTING AT THE DESIGN RESOLUTION
+        PARAMETER(S): NONE
+        RETURN: NONE
+        """
+
+        self.setResolution((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def setResolution(self, size):
+        """
+        PURPOSE: Change the resolution the game is rendered at, done once before any image is loaded.
+        PARAMETER(S): size (tuple): The (width, height) of the render target, in the design aspect ratio.
+        RETURN: None.
+        """
+
+        self.width, self.height = self.size = (int(size[0]), int(size[1]))
+        self.scale = self.height / SCREEN_HEIGHT  # Render pixels per design pixel
+
+    def px(self, *values):
+        """
+        PURPOSE: Convert design pixels to render pixels.
+        PARAMETER(S): values (float): One or more lengths or coordinates in design pixels.
+        RETURN: float or tuple. Returns the single value scaled, or a tuple of the values scaled.
+        """
+
+        if len(values) == 1:
+            return values[0] * self.scale
+
+        return tuple(value * self.scale for value in values)
+
+    def fontSize(self, size):
+        """
+        PURPOSE: Convert a font size in design pixels to the whole point size fonts are opened at.
+        PARAMETER(S): size (int): The font size at the design resolution.
+        RETURN: int. Returns the font size at the render resolution.
+        """
+
+        return max(1, round(size * self.scale))
+
+# Shared view used by every module
+view = View()
@@ -0,0 +1,79 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Import statements
+import pygame
+from collections import OrderedDict
+
+# Constants
+TEXT_CACHE_BYTES = 8 * 1024 * 1024  # Most pixel memory the rendered text cache may hold before evicting
+
+class FontManager:
+    """
+    FontManager CLASS TO RESOLVE EACH FONT ONCE AND CACHE RENDERED TEXT IN A BOUNDED LEAST RECENTLY USED CACHE
+    """
+    def __init__(self, maxBytes=TEXT_CACHE_BYTES):
+        """
+        PURPOSE: DEFINES THE FONT REGISTRY AND THE RENDERED TEXT CACHE
+        PARAMETER(S): maxBytes (int): The pixel memory budget of the text cache
+        RETURN: NONE
+        """
+
+        self.fonts = {}             # Fonts keyed by (family, size, bold, italic)
+        self.texts = OrderedDict()  # Rendered text keyed by (text, font, colour, antialias), least recently used first
+        self.textBytes = 0          # Pixel memory currently held by the text cache
+        self.maxBytes = maxBytes
+
+    def font(self, family, size, bold=False, italic=False):
+        """
+        PURPOSE: Get a system font, looking it up and opening it only the first time it is asked for.
+        PARAMETER(S): family (str): The system font family name.
+                      size (int): The font size.
+                      bold (bool): Whether to use the bold style.
+                      italic (bool): Whether to use the italic style.
+        RETURN: pygame.font.Font. Returns the cached font.
+        """
+
+        key = (family, size, bold, italic)
+        font = self.fonts.get(key)
+
+        if font is None:
+            font = self.fonts[key] = pygame.font.SysFont(family, size, bold, italic)
+
+        return font
+
+    def render(self, text, font, colour, antialias=True):
+        """
+        PURPOSE: Render a line of text, reusing the surface from the last time the same text was drawn the same way.
+        PARAMETER(S): text (str): The text to render.
+                      font (pygame.font.Font): A font from FontManager.font.
+                      colour (tuple): The RGB text colour.
+                      antialias (bool): Whether to smooth the text edges.
+        RETURN: pygame.Surface. Returns the cached rendered text.
+        """
+
+        key = (text, font, colour, antialias)
+        surface = self.texts.get(key)
+
+        if surface is not None:
+            self.texts.move_to_end(key)  # Mark as most recently used
+
+            return surface
+
+        surface = self.texts[key] = font.render(text, antialias, colour)
+        self.textBytes += surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+        # Drop the least recently used text until the cache is back within budget, always keeping the newest entry
+        while self.textBytes > self.maxBytes and len(self.texts) > 1:
+            _, oldSurface = self.texts.popitem(last=False)
+            self.textBytes -= oldSurface.get_width() * oldSurface.get_height() * oldSurface.get_bytesize()
+
+        return surface
+
+# Shared font manager used by every part of the game
+fontMngr = FontManager()
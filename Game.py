@@ -9,786 +9,491 @@ DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIG
 # Import statements
 import pygame
 import sys
-import math
-import json
 import os
+import time
 import asyncio
 
 # Star imports from other game files
 from BackgroundManager import *
 from ObstacleManager import *
 from Player import *
-
-# Initialize pygame and some mixer settings
-pygame.init()
-pygame.mixer.init()
-pygame.mixer.music.set_volume(1)  
+from Simulation import *
+from AssetManager import assetMngr
+from FontManager import fontMngr
+from AudioManager import audioMngr
+from Renderer import Renderer
+from ScoreStore import ScoreStore
+from PersistenceWriter import PersistenceWriter, loadSettings
+from Replay import Replay
+from Profiler import profiler
+from SceneManager import SceneManager
+from Scenes import *
+
+# Shared constants
+from Config import *
 
 # Constants
-SCREEN_WIDTH, SCREEN_HEIGHT = 1920, 1080                    # 1920 x 1080 pixels
-BLACK, WHITE, RED = (0, 0, 0), (255, 255, 255), (255, 0, 0) # Define basic colors for now
-SPRITE_SCALE = 0.06                                         # Set sprite size to 6% of entire screen
-MAX_VEL = 5                                                 # Define a max velocity placeholder
-OBSTACLE_WIDTH = 111                                        # Set obstacle width to 5% of screen width
-OBSTACLE_GAP = SCREEN_HEIGHT * 0.2                          # Set obstacle gap to 20% of screen height
-OBSTACLE_SPEED = -4                                         # Move obstacles from right to left at 4px/frame
-ANIMATION_TIME = 10                                         # Set the animation time for the player to a total of 10 ms
-BUTTON_SIZE = (360, 258)                                    # Set buttons to appropriate size to increase visibility
-NUMBER_SIZE = (80, 108)                                     # Size of each number image for score drawing
+MAX_FRAME_TIME = 0.25                                       # Longest frame time fed to the simulation in one go
+
+# File the player's settings are kept in between sessions
+SETTINGS_PATH = 'Extras/settings.json'
+REPLAY_DIR = 'Extras/Replays'  # Every finished run is saved here so high scores and bugs can be re-simulated
+TRACE_DIR = 'Extras/Traces'    # Profiler trace captures are saved here
+PROFILER_KEY = pygame.K_F3     # Shows or hides the profiler overlay
+CAPTURE_KEY = pygame.K_F4      # Starts or stops a trace capture
+OVERLAY_REFRESH = 15           # Frames between redraws of the profiler overlay's text
+
+# Images and sounds only needed once the player leaves the start menu, streamed in while the menu is showing
+STREAMED_IMAGES = SPRITE_PATHS + [f'Assets/Background/{name}.png' for name in ['sky', 'cloudsBack', 'cloudsFront', 'ground', 'treeObstacle']] \
+                  + NUMBER_PATHS + [f'Assets/Buttons/{name}.png' for name in ['retryButton', 'homeButton', 'trophy', 'backButton', 'muteButton', 'unmuteButton', 'volOn', 'volOff']]
+STREAMED_SOUNDS = ['Assets/Music/death.wav', 'Assets/Music/point.wav', 'Assets/Music/gameMusic.wav']
+MENU_MUSIC = 'Assets/Music/menuMusic.wav'
+GAME_MUSIC = 'Assets/Music/gameMusic.wav'
+
+def initPygame():
+    """
+    PURPOSE: Initialize pygame and the audio device, done when the game starts rather than when this file is imported.
+    PARAMETER(S): None.
+    RETURN: None. The game runs silently if there is no audio device.
+    """
+
+    pygame.init()
+    audioMngr.init()
 
 class Game:
     
-    def __init__(self):
+    def __init__(self, launchTime=None, resolution=None, fullscreen=False):
         """
-        PURPOSE: Initialize the game, setting up the screen, game elements, and state flags.
-        PARAMETER(S): None. Sets up the game environment using predefined settings and assets.
-        RETURN: None. Constructs a Game object with initialized properties.
+        PURPOSE: Initialize the game, setting up the screen, the start menu and state flags.
+        PARAMETER(S): launchTime (float): perf_counter time the program started at, startup times are measured from it.
+                      Defaults to now.
+                      resolution (str): The RESOLUTION_TIERS entry to render at, None uses DEFAULT_RESOLUTION.
+                      fullscreen (bool): Whether to fill the whole display instead of opening a window.
+        RETURN: None. Constructs a Game object ready to show the start menu, the rest of its assets load once it runs.
         """
         
-        # Set display with given size
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Startup timing, seconds from launch to the first presented frame and until every asset was loaded
+        self.launchTime = time.perf_counter() if launchTime is None else launchTime
+        self.firstFrameTime = None
+        self.loadedTime = None
+
+        # Restore the settings saved in an earlier session, if there are any
+        self.settings = loadSettings(SETTINGS_PATH)
+
+        # Everything is drawn at the render resolution, slower machines pick a lower one to push fewer pixels
+        self.resolution = resolution or DEFAULT_RESOLUTION
+
+        if self.resolution not in RESOLUTION_TIERS:
+            self.resolution = DEFAULT_RESOLUTION
+
+        view.setResolution(RESOLUTION_TIERS[self.resolution])
+
+        # Set display with given size. Unless the frame already matches a window of the design size, SDL stretches it
+        # to the window or the display once as it is presented, and maps mouse positions back to render pixels
+        initPygame()
+        scaledFlags = pygame.SCALED if fullscreen or view.size != (SCREEN_WIDTH, SCREEN_HEIGHT) else 0
+        self.screen = pygame.display.set_mode(view.size, scaledFlags | (pygame.FULLSCREEN if fullscreen else 0))
         
-        # Start clock
-        self.clock = pygame.time.Clock()
+        # Frame pacing, when the current frame started and how long the last one took in seconds
+        self.frameStart = time.perf_counter()
+        self.frameTime = 0.0
+
+        # Present frames through the renderer, which only pushes changed areas of static screens
+        self.renderer = Renderer(self.screen)
 
         # Initialize game state flags
         self.running = True # Flag to toggle running state
-        self.inStartMenu = True # Flag to set start menu UI
-        self.inSettings = False  # Flag to toggle settings UI
-        self.inGame = False # Flag to toggle gameplay
-        self.showGameOverScreen = False # Flag to toggle game over screen
-
-        # Call other classes' instances
-        self.player = Player() 
-        self.obstacleMngr = ObstacleManager()
-        self.bgMngr = BackgroundManager()
-        
-        # Initialize score as 0
-        self.score = 0
-        
-        # Set main UI font
-        self.font = pygame.font.SysFont('firacodenerdfontpropomed', 28)
 
-        # Load buttons to be displayed
-        self.loadButtons()
+        # The simulation and background are built once their images have streamed in, see loadGameplayAssets
+        self.sim = None
+        self.bgMngr = None
 
-        # Animation phases for buttons
-        self.startButtonAnimPhase = 0
-        self.homeButtonAnimPhase = 0
-        self.settingsButtonAnimPhase = 0
-        self.retryButtonAnimPhase = 0
+        # Fixed timestep state, real time not yet simulated
+        self.tickAccumulator = 0.0
 
         # Set up logic for score tracking and displaying
-        self.numberImgs = self.loadNumberImages()
-        self.scoreRecordsPath = 'Extras/scoreRecords.json' # Store scores in json file
-        self.bestScore = self.getBestScore()
-
-        # Initialize and set up all in game music and sound effects
-        self.playMenuMusic()  # Play menu music when the game object is initialized
-        self.hoverSound = pygame.mixer.Sound('Assets/Music/hover.wav')  # Load hover sound
-        self.selectSound = pygame.mixer.Sound('Assets/Music/select.wav')  # Load select sound
-        self.deathSound = pygame.mixer.Sound('Assets/Music/death.wav')  # Load the death sound
-        self.pointSound = pygame.mixer.Sound('Assets/Music/point.wav')
+        self.scoreStore = ScoreStore('Extras') # Store scores in an append-only log with a small index
+        self.bestScore = self.scoreStore.best
+        self.percentBeaten = None  # Share of earlier runs the last game beat, None before any runs exist
+
+        # Scores and settings are written on a background thread so the frame loop never waits on the disk
+        self.writer = PersistenceWriter(self.scoreStore, SETTINGS_PATH)
+
+        # Initialize and set up the menu sound effects shared by every screen, gameplay sounds are streamed in
+        self.hoverSound = audioMngr.cue('Assets/Music/hover.wav', 'ui')  # Load hover sound
+        self.selectSound = audioMngr.cue('Assets/Music/select.wav', 'ui')  # Load select sound
         self.isMuted = False  # Mute state
-        self.hoverSoundPlayed = False  # Flag to track if the hover sound has been played
-        self.selectSoundPlayed = False # Flag to track if select sound has been played
-        self.gameMusicStarted = False  # Flag to track if game music has been started
-        self.backHoverSoundPlayed = False # Flag to track if back hover sound has been played
-        self.volumeSliderRects = []
-        self.volume = 0.5  # Default volume level
-        self.muteButtonImg = pygame.transform.scale(pygame.image.load('Assets/Buttons/muteButton.png').convert_alpha(), (100, 100))
-        self.unmuteButtonImg = pygame.transform.scale(pygame.image.load('Assets/Buttons/unmuteButton.png').convert_alpha(), (100, 100))
-        self.volumeButtonImg = self.unmuteButtonImg  # Start with unmute image
-        self.volumeButtonRect = self.unmuteButtonImg.get_rect(topright=(SCREEN_WIDTH - 100, 350))
-        self.initVolumeSlider()
-        self.volumeTextFont = pygame.font.SysFont('firacodenerdfontpropomed', 36) 
-        self.volumeText = self.volumeTextFont.render('Game Volume', True, WHITE)
-
-        # Set up logic to display home and back buttons
-        self.homeButtonImg = pygame.transform.scale(pygame.image.load('Assets/Buttons/homeButton.png').convert_alpha(), (BUTTON_SIZE[0]/1.5, BUTTON_SIZE[1]/1.5))
-        self.homeButtonRect = self.homeButtonImg.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + BUTTON_SIZE[1] * 1.5))
-        self.backButtonImg = pygame.transform.scale(pygame.image.load('Assets/Buttons/backButton.png').convert_alpha(), (BUTTON_SIZE[0]/2.5, BUTTON_SIZE[1]/2.5)) 
-        self.backButtonRect = self.backButtonImg.get_rect(topleft=(10, 10))  # Position it at the top left
-
-        # Logic to display trophies on game over screen when high score beat
-        self.trophyImg = pygame.image.load('Assets/Buttons/trophy.png').convert_alpha()
-        self.trophyImg = pygame.transform.scale(self.trophyImg, (100, 100))
-
-        # Flag to track score recording to prevent duplicate score entries
-        self.scoreRecorded = False 
-
-        # Initialize "FLIP" text animation variables
-        self.flipTextRotation = 0
-        self.flipTextLastUpdate = pygame.time.get_ticks()
-        self.pauseAfterFlip = False
-        self.pauseDuration = 2000  # Pause for 2 seconds
-        self.flipPauseStartTime = 0
-        self.flipAnimate = True  # Control the animation activation
-
-    def loadNumberImages(self):
-        """
-        PURPOSE: Load and scale number images used for score display.
-        PARAMETER(S): None. Loads images from predefined file paths.
-        RETURN: List[pygame.Surface]. Returns a list of loaded and scaled number images.
-        """
-        
-        # Load images for numbers 0-9 for score display.
-        numberPaths = ['zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
-        
-        return [pygame.transform.scale(pygame.image.load(f'Assets/Numbers/{name}.png').convert_alpha(), NUMBER_SIZE) for name in numberPaths]
+        self.volume = 0.5  # Default master volume level
+        self.unmutedVolume = 0.5  # Master volume restored when the game is unmuted
+
+        # Restore the volumes saved in an earlier session, if there are any
+        if 'volume' in self.settings:
+            self.volume = float(self.settings['volume'])
+
+        audioMngr.setVolume('master', self.volume)
+
+        for bus in ['music', 'sfx']:
+            if f'{bus}Volume' in self.settings:
+                audioMngr.setVolume(bus, self.settings[f'{bus}Volume'])
+
+        # Every screen is a scene, made once and reused, the top of the stack gets each frame. Each scene keeps its own
+        # images, input handling and animation state, the game only keeps what they share.
+        self.startMenuScene = StartMenuScene(self)
+        self.settingsScene = SettingsScene(self)
+        self.tutorialScene = TutorialScene(self)
+        self.gameScene = GameScene(self)
+        self.gameOverScene = GameOverScene(self)
+        self.replayScene = ReplayScene(self)
+
+        # Everything the start menu doesn't draw is built from streamed assets by these steps, in order
+        self.loadSteps = [self.loadGameplayAssets, self.gameScene.loadAssets, self.gameOverScene.loadAssets, self.settingsScene.loadAssets]
+        self.loadProgress = 0.0  # Share of the streamed files loaded so far
+
+        # Profiler overlay, made of the text last drawn and how many frames ago it was drawn
+        self.profilerFont = fontMngr.font('firacodenerdfontpropomed', view.fontSize(20))
+        self.showProfiler = False
+        self.profilerOverlay = None
+        self.profilerOverlayAge = 0
+
+        self.scenes = SceneManager()
+        self.scenes.push(self.startMenuScene)  # Builds the menu animations and plays the menu music
 
-    def loadButtons(self):
+    @property
+    def player(self):
         """
-        PURPOSE: Load and scale button images used in the game menus.
-        PARAMETER(S): None. Loads images from predefined file paths.
-        RETURN: None. Initializes button images and their bounding rectangles.
+        PURPOSE: Expose the player of the current simulated run.
+        PARAMETER(S): None.
+        RETURN: Player. Returns the simulation's player.
         """
         
-        # Load and scale images for UI buttons.
-        self.startButtonImg = pygame.transform.scale(pygame.image.load('Assets/Buttons/startButton.png').convert_alpha(), BUTTON_SIZE)
-        self.settingsButtonImg = pygame.transform.scale(pygame.image.load('Assets/Buttons/settingsButton.png').convert_alpha(), BUTTON_SIZE)
-        self.retryButtonImg = pygame.transform.scale(pygame.image.load('Assets/Buttons/retryButton.png').convert_alpha(), BUTTON_SIZE)
-        
-        # Define button positions.
-        self.startButtonRect = self.startButtonImg.get_rect(center=(SCREEN_WIDTH/2 - BUTTON_SIZE[0]/2 - 45, SCREEN_HEIGHT/2))
-        self.settingsButtonRect = self.settingsButtonImg.get_rect(center=(SCREEN_WIDTH/2 + BUTTON_SIZE[0]/2 + 45, SCREEN_HEIGHT/2))
-        self.retryButtonRect = self.retryButtonImg.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 100))
+        return self.sim.player
 
-    def updateScoreRecord(self, currentScore):
+    @property
+    def obstacleMngr(self):
         """
-        PURPOSE: Update the file containing the score records with the current game session score.
-        PARAMETER(S): currentScore (int): The score achieved in the current game session.
-        RETURN: None. Updates or creates the score record file with the new score.
+        PURPOSE: Expose the obstacle manager of the current simulated run.
+        PARAMETER(S): None.
+        RETURN: ObstacleManager. Returns the simulation's obstacle manager.
         """
         
-        try:
-        
-            # Save the current game score to a file.
-            if not os.path.exists('Extras'):
-                os.makedirs('Extras')  # Ensure the directory exists.
-            
-            if os.path.exists(self.scoreRecordsPath):
-                with open(self.scoreRecordsPath, 'r') as file:
-                    scores = json.load(file)  # Load existing scores.
-            
-            else:
-                scores = []  # Start a new score list if the file doesn't exist.
-            
-            scores.append(currentScore)  # Add the current score.
-            
-            # Write the updated scores back to the file.
-            with open(self.scoreRecordsPath, 'w') as file:
-                json.dump(scores, file)
-        
-        # Error message if unsuccessful
-        except Exception as e:
-            print(f"Error updating score record: {e}")
+        return self.sim.obstacleMngr
 
-    def getBestScore(self):
+    @property
+    def score(self):
         """
-        PURPOSE: Retrieve the highest score from the score records.
-        PARAMETER(S): None. Reads the score record file if it exists.
-        RETURN: int. Returns the highest score recorded; returns 0 if no records exist.
+        PURPOSE: Expose the score of the current simulated run.
+        PARAMETER(S): None.
+        RETURN: int. Returns the simulation's score.
         """
-
-        try:
-        
-            # Load the highest score from the score records file.
-            if os.path.exists(self.scoreRecordsPath):
-                with open(self.scoreRecordsPath, 'r') as file:
-                    scores = json.load(file)
-    
-                return max(scores)  # Return the highest score.
-    
-            return 0  # Return 0 if no scores are recorded yet.
         
-        except Exception as e:
-            print(f"Error reading best score: {e}")
-        
-            return 0
+        return self.sim.score
 
-    def drawAnimatedScore(self, score, yPosition, animationPhase):
+    def loadGameplayAssets(self):
         """
-        PURPOSE: Draw the current score with animation effects.
-        PARAMETER(S): score (int): The current score to display.
-                      yPosition (int): The vertical position on the screen to draw the score.
-                      animationPhase (float): The phase of the animation for dynamic effect.
-        RETURN: None. Draws the animated score on the screen.
+        PURPOSE: Build the simulation and the scrolling background.
+        PARAMETER(S): None.
+        RETURN: None. The simulation owns the player, obstacles and score.
         """
         
-        # Draw the current score with an animation effect.
-        scoreStr = str(score)  # Convert score to string for individual digit processing.
-        totalWidth = NUMBER_SIZE[0] * len(scoreStr)  # Calculate total width needed for the score.
-        startX = SCREEN_WIDTH / 2 - totalWidth / 2  # Calculate starting X position.
-
-        # Calculate scale factor for animation effect.
-        scaleFactor = 1.05 + 0.05 * math.sin(animationPhase)
-
-        for i, digit in enumerate(scoreStr):
-            # Scale each digit image.
-            animSize = (int(NUMBER_SIZE[0] * scaleFactor), int(NUMBER_SIZE[1] * scaleFactor))
-            animImg = pygame.transform.scale(self.numberImgs[int(digit)], animSize)
-            animRect = animImg.get_rect(center=(startX + i * NUMBER_SIZE[0] + NUMBER_SIZE[0] // 2, yPosition))
-            self.screen.blit(animImg, animRect)  # Draw animated digit.
+        self.sim = Simulation()
+        self.bgMngr = BackgroundManager()
 
-    def runGameOverScreen(self):
+    async def streamAssets(self):
         """
-        PURPOSE: Display the game over screen, including options to retry or return to the main menu, and shows the final score and best score.
-        PARAMETER(S): None. Uses the game's current state and score information.
-        RETURN: None. Handles user input and transitions between game states based on selection.
+        PURPOSE: Load every asset the start menu doesn't need in the background, while the menu is already running.
+        PARAMETER(S): None.
+        RETURN: None. Runs as a task on the main loop until every load step is done.
         """
-    
-        self.screen.fill(BLACK)
-        mx, my = pygame.mouse.get_pos()
-
-        s = pygame.Surface((800, 600), pygame.SRCALPHA)   # Semi-transparent overlay
-        s.fill((0, 0, 0, 180))
-        self.screen.blit(s, (SCREEN_WIDTH / 2 - 400, SCREEN_HEIGHT / 2 - 300))
-
-        # Determine if a new high score has been set
-        if self.score >= self.bestScore:
-            self.bestScore = self.score
-            message = "NEW HIGH SCORE!"
-            color = (0, 255, 0)  # Gold color for the high score message
-            
-        else:
-            message = "You Died!"
-            color = RED
-
-        font = pygame.font.SysFont("firacodenerdfontpropomed", 78)
-        text = font.render(message, True, color)
-        textRect = text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 400))
-        self.screen.blit(text, textRect)
-
-        # Display trophies on both sides of the message if a new high score has been set
-        if self.score >= self.bestScore:
-            trophyLeftRect = self.trophyImg.get_rect(midright=(textRect.left - 20, textRect.centery))
-            trophyRightRect = self.trophyImg.get_rect(midleft=(textRect.right + 20, textRect.centery))
-            self.screen.blit(self.trophyImg, trophyLeftRect)
-            self.screen.blit(self.trophyImg, trophyRightRect)
+        
+        imagePaths = STREAMED_IMAGES + ([TUTORIAL_IMAGE] if self.getBestScore() == 0 else [])
+        await assetMngr.stream(imagePaths, STREAMED_SOUNDS, self.setLoadProgress)
 
-        homeButtonYOffset = self.retryButtonRect.bottom + 50  # 50 pixels below the retry button
+        # The decoded files are cached, so each step only scales and builds masks, one step per pass of the loop
+        while self.loadSteps:
+            self.loadSteps.pop(0)()
 
-        # Logic for animating and positioning the retry button
-        if self.retryButtonRect.collidepoint((mx, my)):
+            await asyncio.sleep(0)
 
-            if not self.hoverSoundPlayed:
-                self.hoverSound.play()
-                self.hoverSoundPlayed = True
+        self.finishLoading()
 
-            self.screen.blit(self.retryButtonImg, self.retryButtonRect)
+    def setLoadProgress(self, done, total):
+        """
+        PURPOSE: Progress hook for streamed assets.
+        PARAMETER(S): done (int): Files loaded so far.
+                      total (int): Files being loaded.
+        RETURN: None. Updates the share shown by the start menu's loading bar.
+        """
         
-        elif self.homeButtonRect.collidepoint((mx, my)):
-
-            if not self.hoverSoundPlayed:
-                self.hoverSound.play()
-                self.hoverSoundPlayed = True
+        self.loadProgress = done / total if total else 1.0
 
-            self.screen.blit(self.homeButtonImg, self.homeButtonRect.move(0, homeButtonYOffset - self.homeButtonRect.top))
+    def finishLoading(self):
+        """
+        PURPOSE: Make sure every asset is loaded, loading whatever hasn't streamed in yet right away.
+        PARAMETER(S): None. Called before any screen other than the start menu is shown.
+        RETURN: None. Records how long after launch loading finished.
+        """
         
-        else:
-            scaleFactorRetry = 1.15 + 0.10 * math.sin(self.retryButtonAnimPhase)
-            animButtonRetry = pygame.transform.scale(self.retryButtonImg, (int(BUTTON_SIZE[0] * scaleFactorRetry), int(BUTTON_SIZE[1] * scaleFactorRetry)))
-            animRectRetry = animButtonRetry.get_rect(center=self.retryButtonRect.center)
-
-            self.screen.blit(animButtonRetry, animRectRetry)
-            self.retryButtonAnimPhase += 0.015
-            self.hoverSoundPlayed = False  # Reset flag when not hovering
-    
-            scaleFactorHome = 1.05 + 0.05 * math.sin(self.homeButtonAnimPhase)  # Smaller scale factor for home button
-            animButtonHome = pygame.transform.scale(self.homeButtonImg, (int(self.homeButtonImg.get_width() * scaleFactorHome), int(self.homeButtonImg.get_height() * scaleFactorHome)))
-            animRectHome = animButtonHome.get_rect(center=(self.homeButtonRect.centerx, homeButtonYOffset + self.homeButtonImg.get_height() / 2))
-
-            self.screen.blit(animButtonHome, animRectHome)
-            self.homeButtonAnimPhase += 0.015
-
-        # Display the animated score on the game over screen.
-        self.drawAnimatedScore(self.score, SCREEN_HEIGHT / 2 - 250, self.retryButtonAnimPhase - 1)
-
-        # Display the best score text.
-        bestScoreStr = f"Best Score: {self.bestScore}"
-        bestScoreText = self.font.render(bestScoreStr, True, WHITE)
-       
-        self.screen.blit(bestScoreText, (SCREEN_WIDTH / 2 - bestScoreText.get_width() / 2, SCREEN_HEIGHT / 2 - 150))
-
-        # Handle user input on the game over screen.
-        for event in pygame.event.get():
-
-            if event.type == pygame.QUIT:
-                self.running = False
-                self.showGameOverScreen = False
-
-            elif event.type == pygame.MOUSEBUTTONDOWN:
+        while self.loadSteps:
+            self.loadSteps.pop(0)()
 
-                if self.retryButtonRect.collidepoint((mx, my)):
-                    self.selectSound.play()
-                    self.restartGame()  # Restart the game when retry is clicked.
+        if self.loadedTime is None:
+            self.loadProgress = 1.0
+            self.loadedTime = time.perf_counter() - self.launchTime
 
-                    self.inGame = True
-                    self.inStartMenu = False
-
-                    self.playGameMusic()  # Play the game music again.
+    def updateScoreRecord(self, currentScore):
+        """
+        PURPOSE: Update the score records with the current game session score.
+        PARAMETER(S): currentScore (int): The score achieved in the current game session.
+        RETURN: None. Adds the score to the in-memory analytics and queues it for the writer thread, which appends it
+                to the score log.
+        """
+        
+        with profiler.span('scoreRecord'):
+            # Rank the run against the earlier ones before it joins them, straight from the in-memory analytics, which
+            # already include runs still waiting to be written.
+            if self.scoreStore.count:
+                self.percentBeaten = self.scoreStore.analytics.percentileRank(currentScore)
 
-                elif self.homeButtonRect.collidepoint((mx, my)):
-                    self.selectSound.play()
-                    self.restartGame()  # Go back to the start menu when home is clicked.
+            else:
+                self.percentBeaten = None
 
-                    self.gameMusicStarted = False
-                    self.showGameOverScreen = False
-                    self.inStartMenu = True
-                    self.inGame = False
+            # Hand the score to the writer thread, nothing touches the disk on this frame.
+            self.writer.saveScore(currentScore)
+            self.bestScore = max(self.bestScore, currentScore)
 
-                    self.playMenuMusic()  # Play the menu music.
+    def getBestScore(self):
+        """
+        PURPOSE: Retrieve the highest score from the score records.
+        PARAMETER(S): None. Uses the best score kept in memory, which includes scores still waiting to be written.
+        RETURN: int. Returns the highest score recorded; returns 0 if no records exist.
+        """
 
-        pygame.display.flip()  # Update the full display Surface to the screen.
+        return self.bestScore
 
-    def restartGame(self):
+    def resetTimestep(self):
         """
-        PURPOSE: Reset the game to its initial state, ready for a new session.
-        PARAMETER(S): None. Resets game elements and score.
-        RETURN: None. Prepares the game for a new session without exiting to the menu.
+        PURPOSE: Restart the fixed timestep so time spent outside gameplay is not simulated.
+        PARAMETER(S): None.
+        RETURN: None. Clears the tick accumulator.
         """
         
-        # Reset the game for a new play session.
-        self.player = Player()  # Reset player.
-        self.obstacleMngr = ObstacleManager()  # Reset obstacles.
-        self.score = 0  # Reset score.
-        
-        self.showGameOverScreen = False
-        self.inStartMenu = False
-        self.inGame = True
-        self.scoreRecorded = False  # Allow score recording for the new session.
-        
-        if self.inGame == True:
-            self.playGameMusic()  # Play game music.
-            self.gameMusicStarted = True  # Prevent future calls.
-
+        self.tickAccumulator = 0.0
+        self.frameStart = time.perf_counter()  # Loading the scene doesn't count towards the first frame's length.
 
     def playMenuMusic(self):
         """
-        PURPOSE: Load and play background music for the menu.
-        PARAMETER(S): None. Selects and plays specified music tracks.
-        RETURN: None. Starts playing the selected background music loop.
+        PURPOSE: Crossfade to the menu's background music.
+        PARAMETER(S): None.
+        RETURN: None. Starts the menu music loop, loading it only the first time.
         """
         
-        pygame.mixer.music.load('Assets/Music/menuMusic.wav')  # Load the menu music
-        pygame.mixer.music.play(-1)  # Play the music in a loop
+        audioMngr.playMusic(MENU_MUSIC)
     
     def playGameMusic(self):
         """
-        PURPOSE: Load and play background music for the game session.
-        PARAMETER(S): None. Selects and plays specified music tracks.
-        RETURN: None. Starts playing the selected background music loop.
+        PURPOSE: Crossfade to the game session's background music.
+        PARAMETER(S): None.
+        RETURN: None. Starts the game music loop, which is streamed in with the gameplay assets.
         """
         
-        pygame.mixer.music.load('Assets/Music/gameMusic.wav')  # Load the menu music
-        pygame.mixer.music.play(-1)  # Play the music in a loop 
+        audioMngr.playMusic(GAME_MUSIC)
     
     def toggleMute(self):
         """
-        PURPOSE: Toggle the game's mute state, adjusting volume and updating the mute button image.
+        PURPOSE: Toggle the game's mute state.
         PARAMETER(S): None. Changes the volume to 0 or restores it based on the current state.
-        RETURN: None. Modifies the game's volume and updates the mute button's appearance.
+        RETURN: None. Modifies the game's volume, which the settings screen's mute button shows.
         """
         
         # Toggle the mute state of the game.
         if self.volume > 0:
-            self.volume = 0  # Mute the game.
-            self.volumeButtonImg = self.muteButtonImg
+            self.unmutedVolume = self.volume  # Remember the level to come back to.
+            self.setVolume(0)  # Mute the game.
        
         else:
-            self.volume = 0.5  # Unmute the game and set volume to 50%.
-            self.volumeButtonImg = self.unmuteButtonImg
-       
-        pygame.mixer.music.set_volume(self.volume)  # Apply the volume change.
+            self.setVolume(self.unmutedVolume)  # Unmute the game at the level it had.
 
-    def initVolumeSlider(self):
+    def setVolume(self, volume, bus='master'):
         """
-        PURPOSE: Initialize the graphical representation and functionality of the volume slider in the settings menu.
-        PARAMETER(S): None. Sets up the positions and sizes of volume slider components.
-        RETURN: None. Creates volume slider rectangles and assigns them to a list.
+        PURPOSE: Adjust the game's volume based on user input from the settings UI.
+        PARAMETER(S): volume (float): The new volume level, ranging from 0.0 to 1.0.
+                      bus (str): 'master' for the whole game, or 'music' or 'sfx' for just the music or sound effects.
+        RETURN: None. Updates the bus volume, and the master volume the settings screen shows.
         """
         
-        # Initialize the volume slider for the settings menu.
-        sliderXStart = self.volumeButtonRect.right - 1450  # Position starting X.
-        sliderY = self.volumeButtonRect.bottom - 75  # Position Y aligned with mute button.
-        rectWidth, rectHeight = 120, self.volumeButtonRect.height / 2  # Slider dimensions.
-        spacing = 10  # Space between slider segments.
+        audioMngr.setVolume(bus, volume)
 
-        # Load slider images.
-        self.volOnImg = pygame.image.load('Assets/Buttons/volOn.png').convert_alpha()
-        self.volOffImg = pygame.image.load('Assets/Buttons/volOff.png').convert_alpha()
+        # The slider and mute button show the master volume.
+        if bus == 'master':
+            self.volume = volume
 
-        # Create slider segments.
-        for i in range(10):
-            x = sliderXStart + i * (rectWidth + spacing)
-            rect = pygame.Rect(x, sliderY, rectWidth, rectHeight)
-            self.volumeSliderRects.append(rect)  # Add segment to the list.
+        self.saveSettings()
 
+    def saveSettings(self):
+        """
+        PURPOSE: Save the player's settings so they carry over to the next session.
+        PARAMETER(S): None. Uses the current bus volumes.
+        RETURN: None. Queues the settings for the writer thread.
+        """
+
+        # Keys this version doesn't know about are written back as they were read
+        self.settings['volume'] = self.volume
+        self.settings['musicVolume'] = audioMngr.volumes['music']
+        self.settings['sfxVolume'] = audioMngr.volumes['sfx']
+        self.writer.saveSettings(dict(self.settings))
 
-    def drawVolumeSlider(self):
+    def saveReplay(self):
         """
-        PURPOSE: Draw the volume slider and its current level on the settings screen.
-        PARAMETER(S): None. Utilizes the current volume level and slider setup.
-        RETURN: None. Draws the slider and its current setting visually on the screen.
+        PURPOSE: Queue the finished run to be saved as a replay.
+        PARAMETER(S): None.
+        RETURN: None. The replay is written by the background writer, named after when the run ended and its score.
         """
         
-        # Draw the volume slider and highlight segments based on the current volume.
-        for i, rect in enumerate(self.volumeSliderRects):
-            if i < self.volume * 10:
-                self.screen.blit(pygame.transform.scale(self.volOnImg, (rect.width, rect.height)), (rect.x, rect.y))
-            
-            else:
-                self.screen.blit(pygame.transform.scale(self.volOffImg, (rect.width, rect.height)), (rect.x, rect.y))
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{self.sim.seed:08x}-{self.score}.rpl"
+        self.writer.saveReplay(os.path.join(REPLAY_DIR, name), Replay.fromSimulation(self.sim).encode())
 
-    def drawSettingsUI(self):
+    def playReplay(self, replay, speed=1.0):
         """
-        PURPOSE: Draw and manage the settings UI, allowing the user to adjust volume and access other settings.
-        PARAMETER(S): None. Handles user input and visual representation of settings.
-        RETURN: None. Updates the game's settings based on user interactions.
+        PURPOSE: Play back a recorded run on screen.
+        PARAMETER(S): replay (Replay): The run to play back.
+                      speed (float): How many times faster than real time to play it.
+        RETURN: None. Switches to the replay scene.
         """
         
-        # Display and manage the settings menu interface.
-        while self.inSettings:
-            for event in pygame.event.get():
-                
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    pos = pygame.mouse.get_pos()
-                
-                    # Check if a volume slider rectangle is clicked.
-                    for i, rect in enumerate(self.volumeSliderRects):
-                        if rect.collidepoint(pos):
-                            self.setVolume((i + 1) / 10.0)  # Adjust volume based on click.
-                
-                            break
-                
-                    # Check if the mute button is clicked.
-                    if self.volumeButtonRect.collidepoint(pos):
-                        self.toggleMute()
-                
-                    # Check if the back button is clicked.
-                    elif self.backButtonRect.collidepoint(pos):
-                        self.selectSound.play()
-                        self.inSettings = False
-                        self.inStartMenu = True
-                
-                # Allow exiting settings with ESC key.
-                elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                    self.inSettings = False
-                    self.inStartMenu = True
-
-            # Redraw the settings UI.
-            self.screen.fill(BLACK)
-            mx, my = pygame.mouse.get_pos()
-            
-            # Highlight the back button on hover.
-            if self.backButtonRect.collidepoint((mx, my)):
-                if not self.backHoverSoundPlayed:
-                    self.hoverSound.play()
-                    self.backHoverSoundPlayed = True
-            
-            else:
-                self.backHoverSoundPlayed = False
-            self.screen.blit(self.backButtonImg, self.backButtonRect)
+        self.replayScene.setReplay(replay, speed)
+        self.scenes.switch(self.replayScene)
 
-            # Draw the "Settings" title.
-            settingsFont = pygame.font.SysFont("firacodenerdfontpropomed", 72)
-            settingsText = settingsFont.render("Settings", True, WHITE)
-            self.screen.blit(settingsText, (self.screen.get_width() / 2 - settingsText.get_width() / 2, 20))
-
-            # Draw the volume text and slider.
-            volumeTextPos = (self.volumeSliderRects[0].left - 275, (self.volumeSliderRects[0].centery - self.volumeTextFont.get_height() // 2))
-            self.screen.blit(self.volumeText, volumeTextPos)
-            self.drawVolumeSlider()
-            self.screen.blit(self.volumeButtonImg, self.volumeButtonRect)
-
-            pygame.display.flip()  # Update the full display Surface to the screen.
-
-
-    def setVolume(self, volume):
+    def pollEvents(self):
         """
-        PURPOSE: Adjust the game's volume based on user input from the settings UI.
-        PARAMETER(S): volume (float): The new volume level, ranging from 0.0 to 1.0.
-        RETURN: None. Updates the game's volume and the mute button's appearance.
+        PURPOSE: Get this frame's input events, handling the profiler's keys on every screen.
+        PARAMETER(S): None.
+        RETURN: List[pygame.event.Event]. Returns the events for the current scene, without the profiler's key presses.
         """
         
-        # Adjust the game's volume and update the mute button's appearance.
-        self.volume = volume
-        pygame.mixer.music.set_volume(self.volume)
+        events = []
+
+        # Every profiler key press in the batch is handled in order, so two presses in one frame toggle twice
+        for event in pygame.event.get():
         
-        if volume > 0:
-            self.volumeButtonImg = self.unmuteButtonImg
+            if event.type == pygame.KEYDOWN and event.key == PROFILER_KEY:
+                self.toggleProfiler()
         
-        else:
-            self.volumeButtonImg = self.muteButtonImg
+            elif event.type == pygame.KEYDOWN and event.key == CAPTURE_KEY:
+                self.toggleCapture()
 
-    def animateFlipText(self):
+            else:
+                events.append(event)
+
+        return events
+
+    def toggleProfiler(self):
         """
-        PURPOSE: Add the game title to the main menu UI and animates the "FLIP" text to 
-                 rotate continuously.
+        PURPOSE: Show or hide the profiler overlay, timing frames only while it is shown or a capture is running.
         PARAMETER(S): None.
         RETURN: None.
         """
         
-        currTime = pygame.time.get_ticks()
-        
-        if not self.pauseAfterFlip:
-            # Rotate the text if not in pause
-            if currTime - self.flipTextLastUpdate > 2:  # Update every 2ms for smoother animation
-                self.flipTextRotation += 2 # Rotation speed = 2 degrees per iteration
-        
-                if self.flipTextRotation >= 360:
-                    self.flipTextRotation = 0
-                    self.pauseAfterFlip = True
-                    self.flipPauseStartTime = currTime
-        
-                self.flipTextLastUpdate = currTime
-        
-        else:
-            # Pause after complete rotation
-            if currTime - self.flipPauseStartTime >= self.pauseDuration:
-                self.pauseAfterFlip = False  # End pause
-
-        # Create "FLIP" text
-        font = pygame.font.SysFont('Calibri', 90, True, True)
-        
-        flipText = font.render("FLIP", True, WHITE)
-        flipTextRect = flipText.get_rect(center=(SCREEN_WIDTH / 2 - 100, SCREEN_HEIGHT / 4))
-        
-        rotatedFlipText = pygame.transform.rotate(flipText, self.flipTextRotation)
-        rotatedFlipTextRect = rotatedFlipText.get_rect(center=flipTextRect.center)
-        
-        self.screen.blit(rotatedFlipText, rotatedFlipTextRect)
+        self.showProfiler = not self.showProfiler
+        self.profilerOverlay = None
+        profiler.setEnabled(self.showProfiler or profiler.capturing)
+        self.renderer.beginFull()  # Redraw the whole screen so a static screen doesn't keep the old overlay.
 
-    def runStartMenu(self):
+    def toggleCapture(self):
         """
-        PURPOSE: Display the start menu and handle user interactions, including starting the game or accessing settings.
-        PARAMETER(S): None. Manages transitions based on user input.
-        RETURN: None. Directs the game to the appropriate state based on menu selections.
+        PURPOSE: Start a trace capture, or stop the running one and save it as a Chrome trace.
+        PARAMETER(S): None.
+        RETURN: None. The trace is written by the background writer.
         """
         
-        # Display the start menu and handle interactions.
-        self.screen.fill(BLACK)
-        mx, my = pygame.mouse.get_pos()
-        
-        if self.inSettings:
-            self.drawSettingsUI()
-        
-        else:
-        
-            # Handle button hover and click effects for start and settings buttons.
-            if self.startButtonRect.collidepoint((mx, my)):
-        
-                if not self.hoverSoundPlayed:
-                    self.hoverSound.play()
-                    self.hoverSoundPlayed = True
-        
-                self.screen.blit(self.startButtonImg, self.startButtonRect)
-        
-            elif self.settingsButtonRect.collidepoint((mx, my)):
-        
-                if not self.hoverSoundPlayed:
-                    self.hoverSound.play()
-                    self.hoverSoundPlayed = True
-        
-                self.screen.blit(self.settingsButtonImg, self.settingsButtonRect)
-        
-            else:
-                # Animate buttons if not hovered.
-                self.hoverSoundPlayed = False
-                scaleFactor = 1.10 + 0.05 * math.sin(self.startButtonAnimPhase)
-                animButton = pygame.transform.scale(self.startButtonImg, (int(BUTTON_SIZE[0] * scaleFactor), int(BUTTON_SIZE[1] * scaleFactor)))
-                animRect = animButton.get_rect(center=self.startButtonRect.center)
-                self.screen.blit(animButton, animRect)
-                self.startButtonAnimPhase += 0.015
-
-                scaleFactorB = 1.10 + 0.05 * math.sin(self.settingsButtonAnimPhase)
-                animButtonB = pygame.transform.scale(self.settingsButtonImg, (int(BUTTON_SIZE[0] * scaleFactorB), int(BUTTON_SIZE[1] * scaleFactorB)))
-                animRectB = animButtonB.get_rect(center=self.settingsButtonRect.center)
-                self.screen.blit(animButtonB, animRectB)
-                self.settingsButtonAnimPhase += 0.015
-
-            # Render and animate "FLIP" text
-            if self.flipAnimate:
-                self.animateFlipText()
-
-            # Render "NINJA" text statically
-            font = pygame.font.SysFont('Calibri', 90, True, True)
-            ninja_text = font.render("NINJA", True, WHITE)
-            ninja_text_rect = ninja_text.get_rect(center=(SCREEN_WIDTH / 2 + 100, SCREEN_HEIGHT / 4))
-            self.screen.blit(ninja_text, ninja_text_rect)
-
-            # Handle menu interactions.
-            for event in pygame.event.get():
-        
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    self.inStartMenu = False
-        
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-        
-                    if self.startButtonRect.collidepoint((mx, my)):
-                        self.selectSound.play()
-        
-                        if self.getBestScore() == 0:
-                            self.runTutorial()  # Show tutorial for new players.
-        
-                        else:
-                            self.inGame = True
-                            self.inStartMenu = False
-        
-                        if not self.gameMusicStarted:
-                            self.playGameMusic()  # Start game music.
-                            self.gameMusicStarted = True
-        
-                    elif self.settingsButtonRect.collidepoint((mx, my)):
-                        self.selectSound.play()
-                        self.selectSoundPlayed = True
-                        self.inSettings = True  # Open settings menu.
-        
-                    else:
-                        self.selectSoundPlayed = False
+        if not profiler.capturing:
+            profiler.startCapture()
+
+            return
 
-            pygame.display.flip()  # Update the full display Surface to the screen.
+        events = profiler.stopCapture()
+        profiler.setEnabled(self.showProfiler)
+        self.writer.saveTrace(os.path.join(TRACE_DIR, f"trace-{time.strftime('%Y%m%d-%H%M%S')}.json"), events)
 
-    def drawScore(self):
+    def drawProfilerOverlay(self):
         """
-        PURPOSE: Draw the current game score on the screen.
-        PARAMETER(S): None. Uses the game's current score to display.
-        RETURN: None. Renders the score on the game screen using number images.
+        PURPOSE: Draw the frame rate, frame time percentiles and per-phase breakdown over the finished frame.
+        PARAMETER(S): None.
+        RETURN: None. Pushes the overlay's area of the screen to the display.
         """
         
-        # Display the current score on the screen using number images.
-        scoreStr = str(self.score)  # Convert score to string.
-        totalWidth = NUMBER_SIZE[0] * len(scoreStr)  # Total width needed.
-        startX = SCREEN_WIDTH / 2 - totalWidth / 2  # Calculate starting X position.
-        
-        for i, digit in enumerate(scoreStr):
-            self.screen.blit(self.numberImgs[int(digit)], (startX + i * NUMBER_SIZE[0], 10))
+        # Rebuilding the text every frame would cost more than most phases, so it is refreshed a few times a second.
+        if self.profilerOverlay is None or self.profilerOverlayAge >= OVERLAY_REFRESH:
+            stats = profiler.stats()
+            lines = [f"FPS {stats['fps']:6.1f}{'  REC' if profiler.capturing else ''}",
+                     f"p50 {stats['p50']:6.2f} ms  p99 {stats['p99']:6.2f} ms"]
+            lines += [f"{name:<16}{ms:6.2f} ms" for name, ms in stats['phases']]
+
+            # The background's blits and pixels of the last frame it was drawn in, once it has loaded
+            if self.bgMngr is not None:
+                lines += [f"{'bg blits':<16}{self.bgMngr.frameBlits:6d}",
+                          f"{'bg pixels':<16}{self.bgMngr.framePixels / 1e6:6.2f} MP"]
+
+            # Text changes every refresh, so it is rendered directly rather than through the shared text cache.
+            texts = [self.profilerFont.render(line, True, WHITE) for line in lines]
+            lineHeight = self.profilerFont.get_linesize()
+
+            self.profilerOverlay = pygame.Surface((max(text.get_width() for text in texts) + 20, lineHeight * len(texts) + 20))
+            self.profilerOverlay.set_alpha(200)
 
-    def runTutorial(self):
+            for i, text in enumerate(texts):
+                self.profilerOverlay.blit(text, (10, 10 + i * lineHeight))
+
+            self.profilerOverlayAge = 0
+
+        self.profilerOverlayAge += 1
+        rect = self.screen.blit(self.profilerOverlay, self.profilerOverlay.get_rect(topright=(view.width - 10, 10)))
+        pygame.display.update(rect)
+
+    async def nextFrame(self):
         """
-        PURPOSE: Run a tutorial session for new players, introducing game mechanics like gravity flipping.
-        PARAMETER(S): None. Guides the player through initial gameplay concepts.
-        RETURN: None. Initiates the game session after the tutorial is completed or skipped.
+        PURPOSE: Wait for the next frame, handing the idle part of the frame to the event loop's other tasks.
+        PARAMETER(S): None. Paces frames to FRAME_RATE, or only yields once when it is 0.
+        RETURN: None. Measures how long the finished frame took, capped at MAX_FRAME_TIME.
         """
         
-        # Run a tutorial for first-time players.
-        tutorialDone = False
-        promptShown = False
-        
-        self.player = Player()  # Reset player.
-        self.obstacleMngr = ObstacleManager()  # Reset obstacles.
-        
-        while not tutorialDone and self.running:
-        
-            for event in pygame.event.get():
-        
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    tutorialDone = True
-        
-                if event.type == pygame.KEYDOWN:
-        
-                    if event.key == pygame.K_SPACE:
-        
-                        if not promptShown:
-                            promptShown = True  # Hide prompt after first gravity flip.
-                            self.player.flipGravity()
+        # Sleep off the rest of the frame instead of blocking, so background tasks and browser event loops keep running.
+        if FRAME_RATE:
+            await asyncio.sleep(max(0.0, 1 / FRAME_RATE - (time.perf_counter() - self.frameStart)))
         
-                        else:
-                            tutorialDone = True  # End tutorial on second space press.
-        
-                    if event.key == pygame.K_ESCAPE:
-                        tutorialDone = True  # Allow exiting the tutorial with ESC.
-
-            self.screen.fill(BLACK)  # Clear screen for drawing.
-            self.bgMngr.draw(self.screen)  # Draw the background.
-        
-            if not promptShown:
-                # Display the spacebar prompt for gravity flipping.
-                spaceBarImg = pygame.image.load('Assets/Buttons/spaceBar.png').convert_alpha()
-                spaceBarImg = pygame.transform.scale(spaceBarImg, (400, 300))
-                self.screen.blit(spaceBarImg, (SCREEN_WIDTH / 2 - 200, SCREEN_HEIGHT / 2 - 150))
-        
-            else:
-                # Regular gameplay during the tutorial.
-                self.player.update()
-                self.obstacleMngr.update()
-                self.player.draw(self.screen)
-                self.obstacleMngr.draw(self.screen)
-
-            pygame.display.flip()  # Update the full display Surface to the screen.
-            self.clock.tick(60)  # Limit the frame rate to 60 frames per second.
+        else:
+            await asyncio.sleep(0)
 
-        self.inGame = True  # Start the main game after the tutorial.
-        self.inStartMenu = False
+        # Cap the frame time so a long stall can't snowball into endless catch-up ticks.
+        now = time.perf_counter()
+        self.frameTime = min(now - self.frameStart, MAX_FRAME_TIME)
+        self.frameStart = now
 
     async def run(self):
         """
-        PURPOSE: Main game loop that handles updates, drawing, and state transitions.
+        PURPOSE: Main game loop that hands each frame to the current scene.
         PARAMETER(S): None. Coordinates game updates, drawing, and input handling.
         RETURN: None. Maintains the game loop until the game is exited.
         """
         
-        # Main game loop.
-        while self.running:
-        
-            if self.inStartMenu:
-                self.runStartMenu()  # Display the start menu.
-        
-            elif self.showGameOverScreen:
-                self.runGameOverScreen()  # Display the game over screen.
-        
-            else:
-                elapsedTime = self.clock.get_time() / 1000  # Time since last frame.
-
-                for event in pygame.event.get():
-        
-                    if event.type == pygame.QUIT:
-                        self.running = False
-        
-                    if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                        self.player.flipGravity()  # Flip gravity on space press.
-
-                # Update game components.
-                self.player.update()
-                self.bgMngr.update(elapsedTime)
-                self.obstacleMngr.update()
+        # Everything past the start menu loads in the background while the menu is running.
+        loader = asyncio.get_running_loop().create_task(self.streamAssets())
 
-                # Update and display the score.
-                previous_score = self.score
-                self.score = self.obstacleMngr.updateScore(self.player.spriteRect, self.score)
-        
-                if self.score > previous_score:
-                    self.pointSound.play()  # Play sound on score update.
-
-                self.screen.fill(BLACK)  # Clear screen for drawing.
-                self.bgMngr.draw(self.screen)  # Draw the background.
-                self.player.draw(self.screen)  # Draw the player.
-                self.obstacleMngr.draw(self.screen)  # Draw obstacles.
+        # Main game loop, the current scene handles exactly one frame per pass and never blocks.
+        while self.running:
+            profiler.beginFrame()
+            self.scenes.runFrame()
 
-                self.drawScore()  # Display the score.
+            if self.firstFrameTime is None:
+                self.firstFrameTime = time.perf_counter() - self.launchTime
 
-                pygame.display.flip()  # Update the full display Surface to the screen.
+            if self.showProfiler:
+                self.drawProfilerOverlay()
 
-                # Check for collisions and handle game over state.
-                if self.obstacleMngr.checkCollision(self.player.spriteRect) or (self.player.spriteRect.top <= 0 or self.player.spriteRect.bottom >= SCREEN_HEIGHT):
-        
-                    if not self.scoreRecorded:  # Record score once per game session.
-                        self.updateScoreRecord(self.score)
-                        self.scoreRecorded = True
-        
-                    self.deathSound.play()  # Play death sound.
-                    pygame.mixer.music.stop()  # Stop game music.
-                    self.showGameOverScreen = True  # Show game over screen.
+            profiler.endFrame()
 
-                self.clock.tick(60)  # Limit the frame rate to 60 frames per second.
-                await asyncio.sleep(0)
+            await self.nextFrame()
 
+        loader.cancel()  # Stop streaming if the game is closed before it finishes.
+        self.writer.close()  # Finish writing any queued scores and settings.
         pygame.quit()  # Quit pygame when the game loop ends.
         sys.exit()  # Exit the program.
\ No newline at end of file
@@ -7,59 +7,115 @@ DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIG
 """
 
 # Import statements
-import pygame
 import random
+from array import array
+
+# Import the shared asset and collision mask caches
+from AssetManager import assetMngr
+from Collision import getMask
+from Renderer import BlitBatch
 
 # Star imports from other game files
 from BackgroundManager import *
 from ObstacleManager import *
 from Player import *
 
+# Shared constants
+from Config import *
+
 # Constants
-SCREEN_WIDTH, SCREEN_HEIGHT = 1920, 1080                    # 1920 x 1080 pixels
-BLACK, WHITE, RED = (0, 0, 0), (255, 255, 255), (255, 0, 0) # Define basic colors for now
-SPRITE_SCALE = 0.06                                         # Set sprite size to 6% of entire screen
-MAX_VEL = 5                                                 # Define a max velocity placeholder
-OBSTACLE_WIDTH = 111                                        # Set obstacle width to 5% of screen width
-OBSTACLE_GAP = SCREEN_HEIGHT * 0.2                          # Set obstacle gap to 20% of screen height
-OBSTACLE_SPEED = -4                                         # Move obstacles from right to left at 4px/frame
-ANIMATION_TIME = 10                                         # Set the animation time for the player to a total of 10 ms
-BUTTON_SIZE = (360, 258)                                    # Set buttons to appropriate size to increase visibility
-NUMBER_SIZE = (80, 108)                                     # Size of each number image for score drawing
+OBSTACLE_CAPACITY = 16                                      # Initial obstacle pair slots in the store, doubled whenever it fills up
 
 class ObstacleManager:
     
     def __init__(self):
     
-        self.obstacles = []  # List to hold obstacles
-        self.obstacleID = 0  # Unique ID for each obstacle pair
-    
-        # Load the obstacle image (tree) from assets
-        self.original_img = pygame.image.load('Assets/Background/treeObstacle.png').convert_alpha()
+        # Load the obstacle image (tree) from assets, top obstacles share a single flipped copy of it
+        self.original_img = assetMngr.image('Assets/Background/treeObstacle.png', scaled=False)
+        self.flipped_img = assetMngr.image('Assets/Background/treeObstacle.png', flipY=True, scaled=False)
+
+        # Copies drawn at the render resolution, the design sized ones above are only used for collisions
+        self.original_sprite = assetMngr.image('Assets/Background/treeObstacle.png')
+        self.flipped_sprite = assetMngr.image('Assets/Background/treeObstacle.png', flipY=True)
+        self.batch = BlitBatch()  # Both sprites of every pair, drawn with a single blits call
+
+        # Pixel masks for both orientations, and the full image size used by the broad phase
+        self.original_mask = getMask(self.original_img)
+        self.flipped_mask = getMask(self.flipped_img)
+        self.img_width = self.original_img.get_width()
+        self.img_height = self.original_img.get_height()
         self.obstacle_gap = OBSTACLE_GAP  # Vertical space between top and bottom obstacles
 
+        # Obstacle pairs live in a ring buffer of parallel columns, oldest pair at self.head
+        self.head = 0   # Slot of the oldest pair still on screen
+        self.count = 0  # Number of pairs currently stored
+        self.allocateColumns(OBSTACLE_CAPACITY)
+
+        # Each obstacle field draws its gaps from its own generator, so a run can be replayed from its seed
+        self.rng = random.Random()
+
+        # Start with an empty obstacle field
+        self.reset()
+
+    def reset(self, seed=None):
+        """
+        PURPOSE: Clear the obstacle field for a new run, keeping the allocated pair slots for reuse.
+        PARAMETER(S): seed (int): Seed for the gap positions of the run, None picks an unpredictable one.
+        RETURN: None. Empties the ring buffer and resets the scroll offset, score cursor, pair IDs and generator.
+        """
+        
+        self.rng.seed(seed)
+        self.head = 0
+        self.count = 0
+        self.obstacleID = 0  # Unique ID for each obstacle pair
+
+        # Pairs are scored in spawn order, this counts the stored pairs from self.head that are already scored
+        self.scoredCount = 0
+
+        # Pair x values are stored relative to a shared scroll offset, so moving every obstacle is a single addition
+        self.scrollX = 0
+
+    def allocateColumns(self, capacity):
+        """
+        PURPOSE: Create the pair columns, carrying over any stored pairs in order starting at slot 0.
+        PARAMETER(S): capacity (int): The number of pair slots to allocate, must be a power of two.
+        RETURN: None. Replaces the pair columns in place.
+        """
+        
+        xs, gapTops = array('d', [0.0]) * capacity, array('d', [0.0]) * capacity
+        ids, passed = array('l', [0]) * capacity, array('b', [0]) * capacity
+        
+        # Copy live pairs across when growing an existing store
+        for i in range(self.count):
+            slot = (self.head + i) & self.mask
+            xs[i], gapTops[i] = self.pairX[slot], self.pairGapTop[slot]
+            ids[i], passed[i] = self.pairIDs[slot], self.pairPassed[slot]
+        
+        self.pairX, self.pairGapTop, self.pairIDs, self.pairPassed = xs, gapTops, ids, passed
+        self.capacity = capacity
+        self.mask = capacity - 1
+        self.head = 0
+
     def addObstacle(self):
         """
-        PURPOSE: Add a new obstacle at a random position to the game, managing top and bottom obstacles.
-        PARAMETER(S): None. Generates obstacles and their positions based on predefined settings.
-        RETURN: None. Adds newly created obstacles to the obstacle list.
+        PURPOSE: Add a new obstacle pair at a random position to the game, one obstacle above the gap and one below.
+        PARAMETER(S): None. Generates the gap position based on predefined settings.
+        RETURN: None. Adds the new pair to the obstacle store.
         """
         
         # Randomly set the gap's start position
-        gap_top = random.randint(int(SCREEN_HEIGHT * 0.2), int(SCREEN_HEIGHT * 0.8 - self.obstacle_gap))
-        gap_bottom = gap_top + self.obstacle_gap
-        
-        # Flip the top obstacle image for visual consistency
-        top_obstacle_img = pygame.transform.flip(self.original_img, False, True)
-        top_obstacle_y = gap_top - top_obstacle_img.get_height()
+        gap_top = self.rng.randint(int(SCREEN_HEIGHT * 0.2), int(SCREEN_HEIGHT * 0.8 - self.obstacle_gap))
         
-        # Bottom obstacle uses the original image
-        bottom_obstacle_img = self.original_img
-        bottom_obstacle_y = gap_bottom
+        if self.count == self.capacity:
+            self.allocateColumns(self.capacity * 2)
         
-        # Add both obstacles to the list with a unique ID and a passed flag
-        self.obstacles.append({'x': SCREEN_WIDTH, 'y': top_obstacle_y, 'img': top_obstacle_img, 'id': self.obstacleID, 'passed': False})
-        self.obstacles.append({'x': SCREEN_WIDTH, 'y': bottom_obstacle_y, 'img': bottom_obstacle_img, 'id': self.obstacleID, 'passed': False})
+        # Store the pair in the next free slot with a unique ID, the top and bottom obstacles follow from the gap
+        slot = (self.head + self.count) & self.mask
+        self.pairX[slot] = SCREEN_WIDTH - self.scrollX
+        self.pairGapTop[slot] = gap_top
+        self.pairIDs[slot] = self.obstacleID
+        self.pairPassed[slot] = False
+        self.count += 1
         self.obstacleID += 1  # Increment ID for the next pair
 
     def update(self):
@@ -69,58 +125,117 @@ class ObstacleManager:
         RETURN: None. Updates obstacles' positions and possibly adds new obstacles.
         """
         # Add new obstacles if needed
-        if not self.obstacles or self.obstacles[-1]['x'] < SCREEN_WIDTH * 0.75:
+        if not self.count or self.pairX[(self.head + self.count - 1) & self.mask] + self.scrollX < SCREEN_WIDTH * 0.75:
             self.addObstacle()
 
         # Move obstacles to the left
-        for obstacle in self.obstacles:
-            obstacle['x'] += OBSTACLE_SPEED
+        self.scrollX += OBSTACLE_SPEED
 
-        # Remove obstacles that have moved out of the frame
-        self.obstacles = [ob for ob in self.obstacles if ob['x'] + OBSTACLE_WIDTH > 0]
+        # Remove pairs that have moved out of the frame, they always leave from the oldest end
+        while self.count and self.pairX[self.head] + self.scrollX + OBSTACLE_WIDTH <= 0:
+            self.head = (self.head + 1) & self.mask
+            self.count -= 1
+            self.scoredCount = max(self.scoredCount - 1, 0)
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         PURPOSE: Draw all obstacles on the screen at their current positions.
         PARAMETER(S): screen (pygame.Surface): The main game screen where obstacles are drawn.
+                      alpha (float): How far the display is between the previous tick (0) and the current one (1).
         RETURN: None. Directly draws all obstacles onto the provided screen surface.
         """
         
-        # Draw all obstacles on the screen
-        for obstacle in self.obstacles:
-            screen.blit(obstacle['img'], (obstacle['x'], obstacle['y']))
+        # Every obstacle moved by the same amount last tick, so step them all back by the unrendered part
+        offset = self.scrollX + OBSTACLE_SPEED * (alpha - 1)
+
+        # Draw both obstacles of every pair on the screen, the flipped one hangs above the gap.
+        # Positions are in design pixels, scaled to the render resolution as they are drawn
+        scale = view.scale
+        batch = self.batch
+        batch.resize(2 * self.count)
+
+        for i in range(self.count):
+            slot = (self.head + i) & self.mask
+            x, gap_top = (self.pairX[slot] + offset) * scale, self.pairGapTop[slot]
+            batch.set(2 * i, self.flipped_sprite, x, (gap_top - self.img_height) * scale)
+            batch.set(2 * i + 1, self.original_sprite, x, (gap_top + self.obstacle_gap) * scale)
+
+        batch.draw(screen)
 
-    def checkCollision(self, playerRect):
+    def checkCollision(self, playerRect, playerMask):
         """
-        PURPOSE: Check if the player has collided with any of the obstacles.
+        PURPOSE: Check if the player has collided with any of the obstacles, down to the pixel.
         PARAMETER(S): playerRect (pygame.Rect): The bounding rectangle of the player's sprite for collision detection.
+                      playerMask (pygame.mask.Mask): The collision mask of the player's current sprite.
         RETURN: Boolean. Returns True if a collision is detected, False otherwise.
         """
     
-        # Check for collisions between the player and any obstacle
-        for obstacle in self.obstacles:
-            obstacle_rect = pygame.Rect(obstacle['x'], obstacle['y'], OBSTACLE_WIDTH, obstacle['img'].get_height())
+        # Pairs are sorted by x, so sweep along them and only test the ones overlapping the player's column
+        for i in range(self.count):
+            slot = (self.head + i) & self.mask
+            x = self.pairX[slot] + self.scrollX
          
-            if playerRect.colliderect(obstacle_rect):
-                return True  # Collision detected
+            if x + self.img_width <= playerRect.left:
+                continue  # Already behind the player
+         
+            if x >= playerRect.right:
+                break  # This and every later pair is still ahead of the player
+        
+            # The player can only touch the top obstacle above the gap or the bottom one below it
+            gap_top = self.pairGapTop[slot]
+        
+            if playerRect.top < gap_top:
+                top_y = gap_top - self.img_height
+        
+                if playerMask.overlap(self.flipped_mask, (int(x) - playerRect.x, int(top_y) - playerRect.y)):
+                    return True  # Collision detected
+        
+            if playerRect.bottom > gap_top + self.obstacle_gap:
+                bottom_y = gap_top + self.obstacle_gap
+        
+                if playerMask.overlap(self.original_mask, (int(x) - playerRect.x, int(bottom_y) - playerRect.y)):
+                    return True  # Collision detected
         
         return False  # No collision
 
+    def nextGap(self, playerRect):
+        """
+        PURPOSE: Find the gap of the closest obstacle pair the player has not yet cleared.
+        PARAMETER(S): playerRect (pygame.Rect): The bounding rectangle of the player's sprite.
+        RETURN: Tuple (int, int) or None. Returns the top and bottom y of the gap, or None if no pair is ahead.
+        """
+        
+        # Pairs are stored in spawn order
+        for i in range(self.count):
+            slot = (self.head + i) & self.mask
+        
+            if self.pairX[slot] + self.scrollX + OBSTACLE_WIDTH >= playerRect.left:
+                gap_top = self.pairGapTop[slot]
+        
+                return gap_top, gap_top + self.obstacle_gap
+        
+        return None
+
     def updateScore(self, playerRect, score):
         """
-        PURPOSE: Update the game score based on obstacles passed by the player.
+        PURPOSE: Update the game score based on obstacle pairs passed by the player.
         PARAMETER(S): playerRect (pygame.Rect): The bounding rectangle of the player's sprite for scoring checks.
                       score (int): The current score of the game.
         RETURN: int. Returns the updated score after checking passed obstacles.
         """
         
-        # Increment score if the player passes an obstacle without colliding
-        for obstacle in self.obstacles:
-            if not obstacle['passed'] and playerRect.right > obstacle['x'] + OBSTACLE_WIDTH:
-                obstacle['passed'] = True
+        # Pairs count as passed once the player's right edge is beyond them
+        passedX = playerRect.right - self.scrollX - OBSTACLE_WIDTH
+        
+        # Pairs are passed in spawn order, so only the next unscored pair needs checking
+        while self.scoredCount < self.count:
+            slot = (self.head + self.scoredCount) & self.mask
+        
+            if passedX <= self.pairX[slot]:
+                break  # The next pair is still ahead, and so is every pair after it
         
-                # Ensure both top and bottom parts of the obstacle were passed
-                if all(o['passed'] for o in self.obstacles if o['id'] == obstacle['id']):
-                    score += 1  # Increase score
+            self.pairPassed[slot] = True
+            self.scoredCount += 1
+            score += 1  # Increase score
         
-        return score  # Return the updated score
\ No newline at end of file
+        return score  # Return the updated score
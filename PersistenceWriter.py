@@ -0,0 +1,204 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Import statements
+import atexit
+import json
+import os
+import threading
+
+# Import the shared profiler and the trace writer
+from Profiler import profiler, writeTrace
+from BackgroundWriter import BackgroundWriter
+
+# Constants
+WRITE_QUEUE_SIZE = 64   # Most writes that may wait for the writer thread, callers never wait for room
+
+def loadSettings(path):
+    """
+    PURPOSE: Read the saved settings, falling back to none when the file is missing or damaged.
+    PARAMETER(S): path (str): The settings file.
+    RETURN: dict. Returns the saved settings, empty if there are none.
+    """
+
+    try:
+        with open(path, 'r') as file:
+            settings = json.load(file)
+
+        return settings if isinstance(settings, dict) else {}
+
+    except (OSError, ValueError):
+        return {}
+
+class PersistenceWriter(BackgroundWriter):
+    """
+    PersistenceWriter CLASS TO WRITE SCORES, SETTINGS, REPLAYS AND TRACES ON A BACKGROUND THREAD, KEEPING FILE I/O OFF THE FRAME LOOP
+    """
+    def __init__(self, scoreStore, settingsPath, maxQueued=WRITE_QUEUE_SIZE):
+        """
+        PURPOSE: DEFINES THE WRITE QUEUE AND STARTS THE WRITER THREAD
+        PARAMETER(S): scoreStore (ScoreStore): The store finished games are added to
+                      settingsPath (str): The file settings are saved to
+                      maxQueued (int): The most writes that may be waiting at once
+        RETURN: NONE
+        """
+
+        super().__init__('PersistenceWriter', maxQueued)
+
+        self.scoreStore = scoreStore
+        self.settingsPath = settingsPath
+
+        # Writes kept outside the queue, taken by the writer thread with every batch: the newest settings,
+        # which replace each other rather than queueing up, and scores that arrived while the queue was full
+        self.lock = threading.Lock()
+        self.pendingSettings = None
+        self.overflowScores = []
+
+        self.start()
+        atexit.register(self.close)
+
+    def saveScore(self, score):
+        """
+        PURPOSE: Add a finished game's score to the score store's analytics and queue it to be appended to the log.
+        PARAMETER(S): score (int): The score achieved in the finished game.
+        RETURN: None. Never waits, a score that doesn't fit in the queue is kept aside for the next batch instead.
+        """
+
+        # The analytics only ever change on the calling thread, so reading them never races the writer. The writer
+        # gets a snapshot to save in the index alongside the log line instead
+        self.scoreStore.record(int(score))
+        write = (int(score), self.scoreStore.analytics.state())
+
+        if not self.queueWrite(('score', write)):
+            with self.lock:
+                self.overflowScores.append(write)
+
+            # Make sure a batch runs after the score was set aside, a full queue already guarantees one
+            self.queueWrite(('wake', None))
+
+    def saveSettings(self, settings):
+        """
+        PURPOSE: Queue the current settings to be saved, replacing any older settings still waiting.
+        PARAMETER(S): settings (dict): The settings to save.
+        RETURN: None. Never waits, however many times the settings change before they are written.
+        """
+
+        with self.lock:
+            waiting = self.pendingSettings is not None
+            self.pendingSettings = dict(settings)
+
+        # Settings already waiting are picked up by a batch that is on its way, so only the first change wakes the thread
+        if not waiting:
+            self.queueWrite(('wake', None))
+
+    def saveReplay(self, path, data):
+        """
+        PURPOSE: Queue an encoded replay to be written to its own file.
+        PARAMETER(S): path (str): The file to write, its folder is made if it doesn't exist.
+                      data (bytes): The encoded replay.
+        RETURN: None. Never waits, the replay is dropped if the queue is full.
+        """
+
+        if not self.queueWrite(('replay', (path, bytes(data)))):
+            print(f"Error saving replay: too many writes waiting, {path} was not saved")
+
+    def saveTrace(self, path, events):
+        """
+        PURPOSE: Queue a profiler capture to be saved as a Chrome trace.
+        PARAMETER(S): path (str): The file to write, its folder is made if it doesn't exist.
+                      events (List[tuple]): Spans from Profiler.stopCapture.
+        RETURN: None. Never waits, the trace is dropped if the queue is full.
+        """
+
+        if not self.queueWrite(('trace', (path, events))):
+            print(f"Error saving trace: too many writes waiting, {path} was not saved")
+
+    def writeBatch(self, batch):
+        """
+        PURPOSE: Sort one batch of writes by kind and write them, with the newest settings and any scores set aside.
+        PARAMETER(S): batch (List[tuple]): The (kind, value) pairs queued since the last batch, oldest first.
+        RETURN: None.
+        """
+
+        scores = []
+        replays = []
+        traces = []
+
+        for kind, value in batch:
+            if kind == 'score':
+                scores.append(value)
+
+            elif kind == 'replay':
+                replays.append(value)
+
+            elif kind == 'trace':
+                traces.append(value)
+
+        # Scores set aside while the queue was full come after the queued ones that filled it
+        with self.lock:
+            scores += self.overflowScores
+            self.overflowScores = []
+            settings, self.pendingSettings = self.pendingSettings, None
+
+        with profiler.span('writer.flush'):
+            self.flush(scores, settings, replays, traces)
+
+    def flush(self, scores, settings, replays=(), traces=()):
+        """
+        PURPOSE: Write one batch of scores, the newest settings and any replays and traces to disk.
+        PARAMETER(S): scores (List[Tuple[int, dict]]): Scores to append, oldest first, each with its analytics snapshot.
+                      settings (dict): Settings to save, or None if they haven't changed.
+                      replays (List[Tuple[str, bytes]]): Replay files to write and their contents.
+                      traces (List[Tuple[str, List[tuple]]]): Trace files to write and their captured spans.
+        RETURN: None. Prints an error for any write that fails.
+        """
+
+        if scores:
+            try:
+                # The newest snapshot covers every score before it, all of which are in this batch or already written
+                state = max((state for _, state in scores), key=lambda state: state['count'])
+                self.scoreStore.append([score for score, _ in scores], state)
+
+            # Error message if unsuccessful
+            except Exception as e:
+                print(f"Error updating score record: {e}")
+
+        if settings is not None:
+            try:
+                # Write under a temporary name and swap it in so the settings file is never half written
+                tempPath = self.settingsPath + '.tmp'
+
+                with open(tempPath, 'w') as file:
+                    json.dump(settings, file)
+                    file.flush()
+                    os.fsync(file.fileno())
+
+                os.replace(tempPath, self.settingsPath)
+
+            # Error message if unsuccessful
+            except Exception as e:
+                print(f"Error saving settings: {e}")
+
+        for path, data in replays:
+            try:
+                os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+                with open(path, 'wb') as file:
+                    file.write(data)
+
+            # Error message if unsuccessful
+            except Exception as e:
+                print(f"Error saving replay: {e}")
+
+        for path, events in traces:
+            try:
+                writeTrace(path, events)
+
+            # Error message if unsuccessful
+            except Exception as e:
+                print(f"Error saving trace: {e}")
@@ -6,25 +6,22 @@ DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIG
              LAST TIME.
 """
 
-# Import statements
-import pygame
+# Import the shared asset and collision mask caches, and the animation timeline
+from AssetManager import assetMngr
+from Collision import getMask
+from SpriteAtlas import Timeline
 
 # Star imports from other game files
 from BackgroundManager import *
 from ObstacleManager import *
 from Player import *
 
-# Constants
-SCREEN_WIDTH, SCREEN_HEIGHT = 1920, 1080                    # 1920 x 1080 pixels
-BLACK, WHITE, RED = (0, 0, 0), (255, 255, 255), (255, 0, 0) # Define basic colors for now
-SPRITE_SCALE = 0.06                                         # Set sprite size to 6% of entire screen
-MAX_VEL = 5                                                 # Define a max velocity placeholder
-OBSTACLE_WIDTH = 111                                        # Set obstacle width to 5% of screen width
-OBSTACLE_GAP = SCREEN_HEIGHT * 0.2                          # Set obstacle gap to 20% of screen height
-OBSTACLE_SPEED = -4                                         # Move obstacles from right to left at 4px/frame
-ANIMATION_TIME = 10                                         # Set the animation time for the player to a total of 10 ms
-BUTTON_SIZE = (360, 258)                                    # Set buttons to appropriate size to increase visibility
-NUMBER_SIZE = (80, 108)                                     # Size of each number image for score drawing
+# Shared constants
+from Config import *
+
+# Image files of the running animation, in order
+SPRITE_PATHS = [f'Assets/Sprites/ninjaRun{i}.png' for i in range(1, 12)]
+RUN_CYCLE_FPS = 60  # Frames of the running animation shown per second of simulated time
 
 class Player:
     """
@@ -37,36 +34,56 @@ class Player:
         RETURN: NONE
         """
         
-        # Load running animation images
-        self.spriteImgs = [pygame.image.load(f'Assets/Sprites/ninjaRun{i}.png') for i in range(1, 12)]
+        # Running animation frames and flipped versions for when gravity is inverted, packed once into one sprite sheet
+        self.atlas = assetMngr.atlas(SPRITE_PATHS, SCREEN_HEIGHT * SPRITE_SCALE)
+        
+        # Collisions always happen in design pixels, so the masks come from a design sized sheet, the same one unless
+        # the game renders at another resolution
+        self.maskAtlas = assetMngr.atlas(SPRITE_PATHS, SCREEN_HEIGHT * SPRITE_SCALE, scaled=False)
+        
+        # Collision mask of every frame in both orientations, built up front
+        self.spriteMasks = [getMask(img) for img in self.maskAtlas.frames]
+        self.spriteMasksFlipped = [getMask(img) for img in self.maskAtlas.flippedFrames]
+
+        # The running animation plays at a fixed speed in simulated time, whatever the tick or frame rate
+        self.runCycle = Timeline(len(SPRITE_PATHS), RUN_CYCLE_FPS)
+        
+        # Player rectangle, velocity and acceleration, reused by every run
+        self.spriteRect = self.maskAtlas.frames[0].get_rect()
+        self.playerVel = [0, 0]
+        self.playerAcc = [0, 0.5]
         
-        # Create flipped versions for when gravity is inverted
-        self.spriteImgsFlipped = [pygame.transform.flip(img, False, True) for img in self.spriteImgs]
+        # Flag for gravity direction
+        self.gravFlipped = False
         
-        # Calculate scaled dimensions for the sprite
-        scaledSpriteHeight = int(SCREEN_HEIGHT * SPRITE_SCALE)
-        scaledSpriteWidth = int(self.spriteImgs[0].get_width() * scaledSpriteHeight / self.spriteImgs[0].get_height())
+        # Put the player at the start of a run
+        self.reset()
+
+    def reset(self):
+        """
+        PURPOSE: Put the player back at the start of a run, reusing its frames, masks and rectangle.
+        PARAMETER(S): None.
+        RETURN: None. Resets the player's position, motion, gravity and animation in place.
+
+        """
         
-        # Apply scaling to both sprite sets
-        self.spriteImgs = [pygame.transform.scale(img, (scaledSpriteWidth, scaledSpriteHeight)) for img in self.spriteImgs]
-        self.spriteImgsFlipped = [pygame.transform.scale(img, (scaledSpriteWidth, scaledSpriteHeight)) for img in self.spriteImgsFlipped]
+        # Restore normal gravity and the upright sprite set
+        if self.gravFlipped:
+            self.flipGravity()
         
         # Initialize animation state
+        self.animTicks = 0  # Ticks the running animation has played for, counted exactly so runs stay deterministic
         self.currSprite = 0
-        self.spriteImg = self.spriteImgs[self.currSprite]
+        self.selectSprite()
         
         # Position the player sprite
-        self.spriteRect = self.spriteImg.get_rect(topleft=(SCREEN_WIDTH * 0.1, SCREEN_HEIGHT // 2 - scaledSpriteHeight // 2))
-        
-        # Initialize velocity and acceleration
-        self.playerVel = [0, 0]
-        self.playerAcc = [0, 0.5]
+        self.spriteRect.topleft = (SCREEN_WIDTH * 0.1, SCREEN_HEIGHT // 2 - self.spriteRect.height // 2)
         
-        # Flag for gravity direction
-        self.gravFlipped = False
+        # Initialize velocity
+        self.playerVel[0] = self.playerVel[1] = 0
         
-        # Timing for animation updates
-        self.lastUpdate = pygame.time.get_ticks()
+        # Position at the start of the last tick, used to interpolate rendering between ticks
+        self.prevY = self.spriteRect.y
 
     def update(self):
         """
@@ -76,16 +93,48 @@ class Player:
 
         """
         
-        # Track time for sprite animation frame updates
-        now = pygame.time.get_ticks()
+        # Advance the running animation by one tick, then the physics
+        self.updateAnimation()
+        self.updatePhysics()
+
+    def updateAnimation(self, ticks=1):
+        """
+        PURPOSE: Advance the player's running animation along its timeline.
+        PARAMETER(S): ticks (int): Simulation ticks elapsed since the last call.
+        RETURN: None. Modifies the player's sprite index in place.
+
+        """
         
-        if now - self.lastUpdate > ANIMATION_TIME:
-            self.lastUpdate = now
+        # The frame follows from the time played, so it can't drift however the ticks arrive
+        self.animTicks += ticks
+        frame = self.runCycle.frameAt(self.animTicks / TICK_RATE)
+
+        if frame != self.currSprite:
+            self.currSprite = frame
+            self.selectSprite()
+
+    def selectSprite(self):
+        """
+        PURPOSE: Point the player's image and mask at the current frame in the current gravity direction.
+        PARAMETER(S): None.
+        RETURN: None.
+
+        """
         
-            # Cycle through sprite images for animation
-            self.currSprite = (self.currSprite + 1) % len(self.spriteImgs)
-            self.spriteImg = self.spriteImgs[self.currSprite]
+        self.spriteImg = self.atlas.frame(self.currSprite, self.gravFlipped)
+        self.spriteMask = (self.spriteMasksFlipped if self.gravFlipped else self.spriteMasks)[self.currSprite]
+
+    def updatePhysics(self):
+        """
+        PURPOSE: Apply gravity to the player's velocity and move the player, keeping it inside the screen.
+        PARAMETER(S): None. Uses the object's current velocity and acceleration.
+        RETURN: None. Modifies the player's position and velocity in place.
+
+        """
         
+        # Remember where this tick started for render interpolation
+        self.prevY = self.spriteRect.y
+
         # Apply acceleration to velocity
         self.playerVel[1] += self.playerAcc[1]
         
@@ -104,16 +153,17 @@ class Player:
             self.spriteRect.bottom = SCREEN_HEIGHT
             self.playerVel[1] = 0
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         PURPOSE: Draw the player's current sprite at its current position.
         PARAMETER(S): screen (pygame.Surface): The main game screen where the player sprite is drawn.
+                      alpha (float): How far the display is between the previous tick (0) and the current one (1).
         RETURN: None. Directly draws the player's sprite onto the provided screen surface.
 
         """
         
-        # Draw sprite at current position
-        screen.blit(self.spriteImg, self.spriteRect)
+        # Draw sprite between its previous and current position, scaled from design pixels to the render resolution
+        screen.blit(self.spriteImg, view.px(self.spriteRect.x, self.prevY + (self.spriteRect.y - self.prevY) * alpha))
 
     def flipGravity(self):
         """
@@ -127,6 +177,5 @@ class Player:
         self.gravFlipped = not self.gravFlipped
         self.playerAcc[1] = -self.playerAcc[1]
 
-        # Swap sprite sets to reflect gravity flip
-        self.spriteImgs, self.spriteImgsFlipped = self.spriteImgsFlipped, self.spriteImgs
-        self.spriteImg = self.spriteImgs[self.currSprite]
\ No newline at end of file
+        # Show the upside down frame to reflect gravity flip
+        self.selectSprite()
\ No newline at end of file
@@ -0,0 +1,270 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Import statements
+import json
+import os
+import threading
+import time
+from array import array
+from contextlib import nullcontext
+
+# Constants
+PROFILE_HISTORY = 300           # Number of most recent frames kept for the statistics, 5 seconds at 60 FPS
+MAX_TRACE_EVENTS = 1000000      # Most spans a single trace capture holds before it stops recording
+NULL_SPAN = nullcontext()       # Shared span handed out while profiling is off, entering it does nothing
+
+class Span:
+    """
+    Span CLASS TO TIME ONE NAMED PHASE EACH TIME IT IS ENTERED, REUSED EVERY FRAME SO TIMING ALLOCATES NOTHING
+    """
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        """
+        PURPOSE: DEFINES THE PHASE BEING TIMED
+        PARAMETER(S): profiler (Profiler): The profiler the timings are reported to
+                      name (str): The name of the phase
+        RETURN: NONE
+        """
+
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        """
+        PURPOSE: Start timing the phase.
+        PARAMETER(S): None.
+        RETURN: Span. Returns itself.
+        """
+
+        self.start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *exc):
+        """
+        PURPOSE: Stop timing the phase and report it, even if the phase raised.
+        PARAMETER(S): exc (tuple): The exception raised inside the phase, if any.
+        RETURN: bool. Returns False so exceptions carry on.
+        """
+
+        self.profiler.record(self.name, self.start, time.perf_counter())
+
+        return False
+
+class Profiler:
+    """
+    Profiler CLASS TO TIME NAMED PHASES OF EACH FRAME, KEEP THE LAST FRAMES' TIMINGS AND CAPTURE TRACES
+    """
+    def __init__(self, historySize=PROFILE_HISTORY):
+        """
+        PURPOSE: DEFINES THE FRAME HISTORY RING BUFFERS, STARTING WITH PROFILING OFF
+        PARAMETER(S): historySize (int): The number of most recent frames kept
+        RETURN: NONE
+        """
+
+        self.enabled = False            # Spans are only timed while this is set
+        self.capturing = False          # Spans are also kept as trace events while this is set
+        self.mainThread = threading.get_ident()
+
+        self.spans = {}                 # Reusable span of each phase name
+
+        # Ring buffers of the last frames: time spent working, time between frame starts and each phase's time
+        self.historySize = historySize
+        self.workTimes = array('d', [0.0]) * historySize
+        self.intervals = array('d', [0.0]) * historySize
+        self.phaseHistory = [None] * historySize
+        self.frameIndex = 0             # Slot the next finished frame goes into
+        self.frameCount = 0             # Number of slots holding a frame
+
+        # State of the frame in progress
+        self.frameBegin = 0.0
+        self.lastInterval = 0.0
+        self.phases = {}
+
+        # Spans recorded by the current capture, as (name, start, end, thread) tuples
+        self.events = []
+
+    def setEnabled(self, enabled):
+        """
+        PURPOSE: Turn span timing on or off, the history is cleared when it is turned on.
+        PARAMETER(S): enabled (bool): Whether to time spans.
+        RETURN: None.
+        """
+
+        if enabled and not self.enabled:
+            self.frameIndex = self.frameCount = 0
+            self.frameBegin = 0.0
+
+        self.enabled = enabled
+
+    def span(self, name):
+        """
+        PURPOSE: Get the timer of a named phase, to be used in a with statement around the phase.
+        PARAMETER(S): name (str): The name of the phase.
+        RETURN: Span. Returns the phase's reusable span, or a span that does nothing while profiling is off.
+        """
+
+        if not self.enabled:
+            return NULL_SPAN
+
+        span = self.spans.get(name)
+
+        if span is None:
+            span = self.spans[name] = Span(self, name)
+
+        return span
+
+    def record(self, name, start, end):
+        """
+        PURPOSE: Add a finished span to the current frame's breakdown and to the capture.
+        PARAMETER(S): name (str): The name of the phase.
+                      start (float): When the phase started, in perf_counter seconds.
+                      end (float): When the phase ended, in perf_counter seconds.
+        RETURN: None.
+        """
+
+        thread = threading.get_ident()
+
+        # Other threads don't hold up the frame, so they only appear in traces
+        if thread == self.mainThread:
+            self.phases[name] = self.phases.get(name, 0.0) + end - start
+
+        if self.capturing:
+            self.events.append((name, start, end, thread))
+
+            if len(self.events) >= MAX_TRACE_EVENTS:
+                self.capturing = False
+
+    def beginFrame(self):
+        """
+        PURPOSE: Mark the start of a frame.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+
+        if self.frameBegin:
+            self.lastInterval = now - self.frameBegin
+
+        self.frameBegin = now
+        self.phases = {}
+
+    def endFrame(self):
+        """
+        PURPOSE: Mark the end of a frame's work, storing its timings in the history.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        if not self.enabled or not self.frameBegin:
+            return
+
+        now = time.perf_counter()
+        i = self.frameIndex
+
+        self.workTimes[i] = now - self.frameBegin
+        self.intervals[i] = self.lastInterval
+        self.phaseHistory[i] = self.phases
+
+        self.frameIndex = (i + 1) % self.historySize
+        self.frameCount = min(self.frameCount + 1, self.historySize)
+
+        if self.capturing:
+            self.events.append(('frame', self.frameBegin, now, self.mainThread))
+
+    def stats(self):
+        """
+        PURPOSE: Summarise the frames in the history.
+        PARAMETER(S): None.
+        RETURN: dict. Returns the frame rate, the median and 99th percentile frame work time in milliseconds, and the
+                average milliseconds per frame of every phase, slowest first.
+        """
+
+        n = self.frameCount
+
+        if n == 0:
+            return {'fps': 0.0, 'p50': 0.0, 'p99': 0.0, 'phases': []}
+
+        work = sorted(self.workTimes[:n])
+        intervals = [t for t in self.intervals[:n] if t > 0]
+
+        totals = {}
+
+        for phases in self.phaseHistory[:n]:
+            for name, seconds in phases.items():
+                totals[name] = totals.get(name, 0.0) + seconds
+
+        return {'fps': len(intervals) / sum(intervals) if intervals else 0.0,
+                'p50': work[n // 2] * 1000,
+                'p99': work[min(n - 1, int(n * 0.99))] * 1000,
+                'phases': sorted(((name, total * 1000 / n) for name, total in totals.items()), key=lambda phase: -phase[1])}
+
+    def startCapture(self):
+        """
+        PURPOSE: Start keeping every span for a trace, turning profiling on if it is off.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        self.events = []
+        self.capturing = True
+        self.setEnabled(True)
+
+    def stopCapture(self):
+        """
+        PURPOSE: Stop the current capture.
+        PARAMETER(S): None.
+        RETURN: List[tuple]. Returns the captured spans, ready for writeTrace.
+        """
+
+        events, self.events = self.events, []
+        self.capturing = False
+
+        return events
+
+def writeTrace(path, events):
+    """
+    PURPOSE: Save captured spans in the Chrome trace event format, which chrome://tracing and Perfetto can open.
+    PARAMETER(S): path (str): The file to write, its folder is made if it doesn't exist.
+                  events (List[tuple]): Spans from Profiler.stopCapture.
+    RETURN: None.
+    """
+
+    pid = os.getpid()
+    start = min((event[1] for event in events), default=0.0)
+    threads = {}
+
+    trace = []
+
+    for name, begin, end, thread in events:
+        tid = threads.setdefault(thread, len(threads))
+
+        # Complete events, times in microseconds from the first span
+        trace.append({'name': name, 'cat': 'frame' if name == 'frame' else 'phase', 'ph': 'X', 'pid': pid, 'tid': tid,
+                      'ts': (begin - start) * 1e6, 'dur': (end - begin) * 1e6})
+
+    # Name the threads so the main loop and the writer thread are told apart
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+
+    for thread, tid in threads.items():
+        trace.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': names.get(thread, str(thread))}})
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    with open(path, 'w') as file:
+        json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, file)
+
+# Shared instance used by every module
+profiler = Profiler()
@@ -0,0 +1,164 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Import statements
+import pygame
+
+# Import the shared profiler
+from Profiler import profiler
+
+class Renderer:
+    """
+    Renderer CLASS TO PRESENT FRAMES, ONLY PUSHING THE CHANGED PARTS OF THE SCREEN WHEN MOST OF IT IS STATIC
+    """
+    def __init__(self, screen, useDirtyRects=True):
+        """
+        PURPOSE: DEFINES THE CACHED BACKGROUND AND THE DIRTY RECTANGLE LISTS
+        PARAMETER(S): screen (pygame.Surface): The display surface
+                      useDirtyRects (bool): Whether static screens push only changed rectangles, False always flips
+        RETURN: NONE
+        """
+
+        self.screen = screen
+        self.useDirtyRects = useDirtyRects
+
+        # Composited static layers of the current screen, rebuilt only when its key changes
+        self.background = pygame.Surface(screen.get_size()).convert()
+        self.backgroundKey = None
+
+        # Rectangles drawn over the background this frame and last frame
+        self.dirtyRects = []
+        self.prevRects = []
+
+        # Set when the whole frame has to be pushed, either on a new screen or when scrolling layers cover everything
+        self.fullFrame = True
+
+    def beginStatic(self, key, drawBackground):
+        """
+        PURPOSE: Start a frame of a mostly static screen, compositing its static layers only when they change.
+        PARAMETER(S): key (hashable): Identifies the static content, a new key rebuilds the background.
+                      drawBackground (callable): Called with a surface to draw the static layers onto.
+        RETURN: None. Leaves the screen showing the background with last frame's sprites erased.
+        """
+
+        if key != self.backgroundKey or not self.useDirtyRects:
+            drawBackground(self.background)
+            self.backgroundKey = key
+            self.screen.blit(self.background, (0, 0))
+            self.fullFrame = True
+
+        else:
+            # Erase last frame's sprites by restoring the background underneath them
+            for rect in self.prevRects:
+                self.screen.blit(self.background, rect, rect)
+
+    def beginFull(self):
+        """
+        PURPOSE: Start a frame where scrolling layers cover the whole screen, so everything is redrawn and flipped.
+        PARAMETER(S): None.
+        RETURN: None. Marks the frame for a full flip and forgets the cached background.
+        """
+
+        self.backgroundKey = None
+        self.fullFrame = True
+
+    def blit(self, surface, dest, area=None):
+        """
+        PURPOSE: Draw a sprite over the background and remember the area it covered.
+        PARAMETER(S): surface (pygame.Surface): The sprite to draw.
+                      dest (tuple or pygame.Rect): Where to draw it on the screen.
+                      area (tuple or pygame.Rect): The part of the sprite to draw, None draws all of it.
+        RETURN: pygame.Rect. Returns the area of the screen that changed.
+        """
+
+        rect = self.screen.blit(surface, dest, area)
+        self.dirtyRects.append(rect)
+
+        return rect
+
+    def blits(self, batch):
+        """
+        PURPOSE: Draw a batch of sprites over the background with one call and remember the areas they covered.
+        PARAMETER(S): batch (BlitBatch): The sprites to draw.
+        RETURN: None.
+        """
+
+        self.dirtyRects += self.screen.blits(batch.items)
+
+    def present(self):
+        """
+        PURPOSE: Push the frame to the display, limited to the changed rectangles whenever possible.
+        PARAMETER(S): None.
+        RETURN: None. Updates the display and rolls the dirty rectangle lists over to the next frame.
+        """
+
+        with profiler.span('present'):
+            if self.fullFrame:
+                pygame.display.flip()
+
+            else:
+                # Both where sprites were and where they are now have changed
+                pygame.display.update(self.prevRects + self.dirtyRects)
+
+        self.prevRects, self.dirtyRects = self.dirtyRects, self.prevRects
+        self.dirtyRects.clear()
+        self.fullFrame = False
+
+class BlitBatch:
+    """
+    BlitBatch CLASS TO DRAW MANY SPRITES WITH ONE Surface.blits CALL, REUSING ITS (SURFACE, POSITION) ENTRIES EVERY FRAME
+    """
+    def __init__(self):
+        """
+        PURPOSE: DEFINES THE ENTRIES DRAWN AND THE SPARE ENTRIES KEPT FOR WHEN THE BATCH GROWS AGAIN
+        PARAMETER(S): NONE
+        RETURN: NONE
+        """
+
+        self.items = []     # [surface, [x, y]] entries in drawing order, updated in place
+        self.spare = []     # Entries dropped by resize, reused instead of allocating new ones
+
+    def resize(self, count):
+        """
+        PURPOSE: Set the number of sprites in the batch, keeping the entries that are already there.
+        PARAMETER(S): count (int): The number of sprites to draw.
+        RETURN: None. New entries must be set before the batch is drawn.
+        """
+
+        items = self.items
+
+        while len(items) < count:
+            items.append(self.spare.pop() if self.spare else [None, [0, 0]])
+
+        while len(items) > count:
+            self.spare.append(items.pop())
+
+    def set(self, index, surface, x, y):
+        """
+        PURPOSE: Change the sprite drawn by an entry and where it is drawn.
+        PARAMETER(S): index (int): The entry to change.
+                      surface (pygame.Surface): The sprite to draw.
+                      x (float): The left edge on the target surface.
+                      y (float): The top edge on the target surface.
+        RETURN: None.
+        """
+
+        item = self.items[index]
+        item[0] = surface
+        position = item[1]
+        position[0] = x
+        position[1] = y
+
+    def draw(self, target):
+        """
+        PURPOSE: Draw every sprite in the batch.
+        PARAMETER(S): target (pygame.Surface): The surface to draw onto.
+        RETURN: None.
+        """
+
+        target.blits(self.items, False)
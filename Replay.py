@@ -0,0 +1,194 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Import statements
+import struct
+from array import array
+
+# Constants
+REPLAY_MAGIC = b'FNRP'      # First bytes of every replay file
+REPLAY_VERSION = 1          # Bumped whenever the simulation changes in a way that breaks old replays
+HEADER = struct.Struct('<4sBBQ')  # Magic, version, flags, seed
+
+def writeVarint(out, value):
+    """
+    PURPOSE: Append an unsigned integer using 7 bits per byte, so small numbers take a single byte.
+    PARAMETER(S): out (bytearray): The buffer to append to.
+                  value (int): The non-negative integer to write.
+    RETURN: None. Extends the buffer.
+    """
+
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    out.append(value)
+
+def readVarint(data, pos):
+    """
+    PURPOSE: Read an unsigned integer written by writeVarint.
+    PARAMETER(S): data (bytes): The encoded replay.
+                  pos (int): Where the integer starts.
+    RETURN: Tuple[int, int]. Returns the integer and the position just after it.
+    """
+
+    value = shift = 0
+
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+
+        if byte < 0x80:
+            return value, pos
+
+        shift += 7
+
+class Replay:
+    """
+    Replay CLASS TO HOLD ONE RUN AS ITS OBSTACLE SEED AND THE TICKS ON WHICH GRAVITY WAS FLIPPED
+    """
+    def __init__(self, seed, flipFrames, frames, score, dead):
+        """
+        PURPOSE: DEFINES THE RECORDED RUN
+        PARAMETER(S): seed (int): The seed the run's obstacles were placed with
+                      flipFrames (Sequence[int]): The ticks gravity was flipped on, in order
+                      frames (int): How many ticks the run lasted
+                      score (int): The run's final score
+                      dead (bool): Whether the run ended in a collision rather than being cut short
+        RETURN: NONE
+        """
+
+        self.seed = seed
+        self.flipFrames = array('L', flipFrames)
+        self.frames = frames
+        self.score = score
+        self.dead = dead
+
+    @classmethod
+    def fromSimulation(cls, sim):
+        """
+        PURPOSE: Record the run a simulation has played so far.
+        PARAMETER(S): sim (Simulation): The simulation to record.
+        RETURN: Replay. Returns the recorded run.
+        """
+
+        return cls(sim.seed, sim.flipFrames, sim.frame, sim.score, sim.dead)
+
+    def encode(self):
+        """
+        PURPOSE: Pack the run into the binary replay format: a fixed header, then varints for the length, the score
+                 and the gaps between flips.
+        PARAMETER(S): None.
+        RETURN: bytes. Returns the encoded replay.
+        """
+
+        out = bytearray(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, int(self.dead), self.seed))
+        writeVarint(out, self.frames)
+        writeVarint(out, self.score)
+        writeVarint(out, len(self.flipFrames))
+
+        # Flips are stored as the ticks since the previous flip, which are small and mostly fit in one byte
+        previous = 0
+
+        for frame in self.flipFrames:
+            writeVarint(out, frame - previous)
+            previous = frame
+
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, data):
+        """
+        PURPOSE: Unpack a replay written by encode.
+        PARAMETER(S): data (bytes): The encoded replay.
+        RETURN: Replay. Returns the recorded run, raising ValueError if the data isn't a replay this version can play.
+        """
+
+        if len(data) < HEADER.size:
+            raise ValueError("Replay is truncated")
+
+        magic, version, flags, seed = HEADER.unpack_from(data)
+
+        if magic != REPLAY_MAGIC:
+            raise ValueError("Not a replay file")
+
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Replay version {version} can't be played by version {REPLAY_VERSION}")
+
+        try:
+            pos = HEADER.size
+            frames, pos = readVarint(data, pos)
+            score, pos = readVarint(data, pos)
+            flipCount, pos = readVarint(data, pos)
+
+            flipFrames = array('L')
+            frame = 0
+
+            for _ in range(flipCount):
+                delta, pos = readVarint(data, pos)
+                frame += delta
+                flipFrames.append(frame)
+
+        except IndexError:
+            raise ValueError("Replay is truncated")
+
+        return cls(seed, flipFrames, frames, score, bool(flags & 1))
+
+    def save(self, path):
+        """
+        PURPOSE: Write the replay to a file.
+        PARAMETER(S): path (str): The file to write.
+        RETURN: None.
+        """
+
+        with open(path, 'wb') as file:
+            file.write(self.encode())
+
+    @classmethod
+    def load(cls, path):
+        """
+        PURPOSE: Read a replay from a file.
+        PARAMETER(S): path (str): The file to read.
+        RETURN: Replay. Returns the recorded run.
+        """
+
+        with open(path, 'rb') as file:
+            return cls.decode(file.read())
+
+    def policy(self):
+        """
+        PURPOSE: Build a policy that flips gravity on exactly the recorded ticks.
+        PARAMETER(S): None.
+        RETURN: callable. Returns a policy usable with Simulation.run, good for one pass over the run.
+        """
+
+        flips = iter(self.flipFrames)
+        nextFlip = [next(flips, None)]
+
+        def flipNow(sim):
+            if sim.frame == nextFlip[0]:
+                nextFlip[0] = next(flips, None)
+
+                return True
+
+            return False
+
+        return flipNow
+
+    def verify(self, sim):
+        """
+        PURPOSE: Re-simulate the run as fast as possible and check it ends exactly as recorded.
+        PARAMETER(S): sim (Simulation): The simulation to replay on, it is reset first.
+        RETURN: bool. Returns True if the re-simulated run lasted as long, scored the same and ended the same way.
+        """
+
+        sim.reset(self.seed)
+        sim.run(self.policy(), self.frames)
+
+        return sim.frame == self.frames and sim.score == self.score and sim.dead == self.dead
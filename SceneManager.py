@@ -0,0 +1,136 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Import the shared profiler
+from Profiler import profiler
+
+class Scene:
+    """
+    Scene CLASS TO BE EXTENDED BY EVERY SCREEN OF THE GAME, GIVING IT HOOKS FOR ITS LIFETIME AND ITS FRAMES
+    """
+    def __init__(self, game):
+        """
+        PURPOSE: DEFINES THE GAME THE SCENE BELONGS TO
+        PARAMETER(S): game (Game): The game whose state and resources the scene uses
+        RETURN: NONE
+        """
+
+        self.game = game
+
+    def enter(self):
+        """
+        PURPOSE: Called when the scene is pushed, preloads whatever its frames need.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        pass
+
+    def exit(self):
+        """
+        PURPOSE: Called when the scene is popped or switched away from, releases what enter loaded.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        pass
+
+    def update(self):
+        """
+        PURPOSE: Handle one frame of input and logic, including any transition to another scene.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        pass
+
+    def render(self):
+        """
+        PURPOSE: Draw one frame of the scene and present it.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        pass
+
+class SceneManager:
+    """
+    SceneManager CLASS TO KEEP A STACK OF SCENES, THE TOP ONE RECEIVING EVERY FRAME
+    """
+    def __init__(self):
+        """
+        PURPOSE: DEFINES AN EMPTY SCENE STACK
+        PARAMETER(S): NONE
+        RETURN: NONE
+        """
+
+        self.stack = []  # Active scenes, the top one last
+
+    @property
+    def current(self):
+        """
+        PURPOSE: The scene receiving frames.
+        PARAMETER(S): None.
+        RETURN: Scene. Returns the top scene, or None if the stack is empty.
+        """
+
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene):
+        """
+        PURPOSE: Open a scene over the current one, which stays loaded underneath.
+        PARAMETER(S): scene (Scene): The scene to open.
+        RETURN: None. Enters the scene.
+        """
+
+        self.stack.append(scene)
+        scene.enter()
+
+    def pop(self):
+        """
+        PURPOSE: Close the top scene, handing frames back to the one underneath.
+        PARAMETER(S): None.
+        RETURN: Scene. Returns the closed scene.
+        """
+
+        scene = self.stack.pop()
+        scene.exit()
+
+        return scene
+
+    def switch(self, scene):
+        """
+        PURPOSE: Close every open scene and start a new one.
+        PARAMETER(S): scene (Scene): The scene to start.
+        RETURN: None. Exits the old scenes from the top down, then enters the new one.
+        """
+
+        while self.stack:
+            self.pop()
+
+        self.push(scene)
+
+    def runFrame(self):
+        """
+        PURPOSE: Run one frame of the top scene.
+        PARAMETER(S): None.
+        RETURN: None. Renders the scene too unless its update closed it.
+        """
+
+        scene = self.current
+
+        if scene is None:
+            return
+
+        with profiler.span('update'):
+            scene.update()
+
+        # A scene that switched away during its update has released its resources, the next scene draws next frame
+        if scene in self.stack:
+            with profiler.span('render'):
+                scene.render()
@@ -0,0 +1,1031 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Import statements
+import pygame
+import math
+
+# Import the shared managers, every screen loads and draws through them
+from SceneManager import Scene
+from AssetManager import assetMngr, phaseFrame
+from FontManager import fontMngr
+from AudioManager import audioMngr
+from Renderer import BlitBatch
+from Profiler import profiler
+
+# Shared constants
+from Config import *
+
+# Image files for the digits 0-9
+NUMBER_PATHS = [f'Assets/Numbers/{name}.png' for name in ['zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']]
+TUTORIAL_IMAGE = 'Assets/Buttons/spaceBar.png'
+
+class StartMenuScene(Scene):
+    """
+    StartMenuScene CLASS FOR THE TITLE SCREEN WITH THE START AND SETTINGS BUTTONS
+    """
+    def __init__(self, game):
+        """
+        PURPOSE: DEFINES THE MENU BUTTONS, THE TITLE AND THE STATE OF THEIR ANIMATIONS
+        PARAMETER(S): game (Game): The game whose state and resources the scene uses
+        RETURN: NONE
+        """
+
+        super().__init__(game)
+
+        self.titleFont = fontMngr.font('Calibri', view.fontSize(90), True, True)  # "FLIP NINJA" title
+
+        # Load and scale images for the start menu buttons.
+        self.startButtonImg = assetMngr.image('Assets/Buttons/startButton.png', BUTTON_SIZE)
+        self.settingsButtonImg = assetMngr.image('Assets/Buttons/settingsButton.png', BUTTON_SIZE)
+
+        # Define button positions, laid out in design pixels and placed at the render resolution.
+        self.startButtonRect = self.startButtonImg.get_rect(center=view.px(SCREEN_WIDTH/2 - BUTTON_SIZE[0]/2 - 45, SCREEN_HEIGHT/2))
+        self.settingsButtonRect = self.settingsButtonImg.get_rect(center=view.px(SCREEN_WIDTH/2 + BUTTON_SIZE[0]/2 + 45, SCREEN_HEIGHT/2))
+
+        # Animation phases for buttons, their frames are only built while the menu is showing
+        self.startButtonAnimPhase = 0
+        self.settingsButtonAnimPhase = 0
+        self.startButtonFrames = None
+        self.settingsButtonFrames = None
+
+        self.hoverSoundPlayed = False  # Flag to track if the hover sound has been played
+        self.selectSoundPlayed = False # Flag to track if select sound has been played
+
+        # Initialize "FLIP" text animation variables
+        self.flipTextFrames = None
+        self.flipTextRotation = 0
+        self.flipTextLastUpdate = pygame.time.get_ticks()
+        self.pauseAfterFlip = False
+        self.pauseDuration = 2000  # Pause for 2 seconds
+        self.flipPauseStartTime = 0
+        self.flipAnimate = True  # Control the animation activation
+
+        # Bar showing how much of the game has streamed in
+        self.loadBarImg = pygame.Surface(view.px(SCREEN_WIDTH // 3, 6))
+        self.loadBarImg.fill(WHITE)
+
+    def enter(self):
+        """
+        PURPOSE: Precompute every frame of the menu animations so the menu only blits cached surfaces, and start the
+                 menu music.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        # Pulsing buttons, scale factor = base + amplitude * sin(phase).
+        self.startButtonFrames = assetMngr.pulseFrames('Assets/Buttons/startButton.png', BUTTON_SIZE, 1.10, 0.05)
+        self.settingsButtonFrames = assetMngr.pulseFrames('Assets/Buttons/settingsButton.png', BUTTON_SIZE, 1.10, 0.05)
+
+        # Spinning "FLIP" title, one frame per 2 degree rotation step.
+        flipText = fontMngr.render("FLIP", self.titleFont, WHITE)
+        self.flipTextFrames = assetMngr.rotationFrames('flipTitle', flipText)
+
+        self.game.playMenuMusic()
+
+    def exit(self):
+        """
+        PURPOSE: Release the menu animations, nothing else draws them.
+        PARAMETER(S): None.
+        RETURN: None. Drops the frame lists here and in the asset manager.
+        """
+
+        self.startButtonFrames = self.settingsButtonFrames = self.flipTextFrames = None
+        assetMngr.releaseFrames('Assets/Buttons/startButton.png', 'Assets/Buttons/settingsButton.png', 'flipTitle')
+
+    def update(self):
+        """
+        PURPOSE: Handle one frame of input on the start menu, including starting the game or accessing settings.
+        PARAMETER(S): None. Manages transitions based on user input.
+        RETURN: None. Directs the game to the appropriate scene based on menu selections.
+        """
+
+        game = self.game
+        mx, my = pygame.mouse.get_pos()
+
+        # Handle menu interactions.
+        for event in game.pollEvents():
+
+            if event.type == pygame.QUIT:
+                game.running = False
+
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+
+                if self.startButtonRect.collidepoint((mx, my)):
+                    game.selectSound.play()
+
+                    if game.getBestScore() == 0:
+                        game.scenes.switch(game.tutorialScene)  # Show tutorial for new players, the game music starts once it ends.
+
+                    else:
+                        game.scenes.switch(game.gameScene)  # Start the game and its music.
+
+                    return
+
+                elif self.settingsButtonRect.collidepoint((mx, my)):
+                    game.selectSound.play()
+                    self.selectSoundPlayed = True
+                    game.scenes.push(game.settingsScene)  # Open settings menu over the start menu.
+
+                    return
+
+                else:
+                    self.selectSoundPlayed = False
+
+    def render(self):
+        """
+        PURPOSE: Draw one frame of the start menu with its animated buttons and title.
+        PARAMETER(S): None. Uses the mouse position for the hover effects.
+        RETURN: None. Presents the frame.
+        """
+
+        renderer = self.game.renderer
+        mx, my = pygame.mouse.get_pos()
+
+        # The background and "NINJA" never change, only the buttons and "FLIP" are redrawn each frame.
+        renderer.beginStatic('startMenu', self.drawBackground)
+
+        # Handle button hover effects for start and settings buttons.
+        if self.startButtonRect.collidepoint((mx, my)):
+
+            if not self.hoverSoundPlayed:
+                self.game.hoverSound.play()
+                self.hoverSoundPlayed = True
+
+            renderer.blit(self.startButtonImg, self.startButtonRect)
+
+        elif self.settingsButtonRect.collidepoint((mx, my)):
+
+            if not self.hoverSoundPlayed:
+                self.game.hoverSound.play()
+                self.hoverSoundPlayed = True
+
+            renderer.blit(self.settingsButtonImg, self.settingsButtonRect)
+
+        else:
+            # Animate buttons if not hovered.
+            self.hoverSoundPlayed = False
+            animButton = phaseFrame(self.startButtonFrames, self.startButtonAnimPhase)
+            animRect = animButton.get_rect(center=self.startButtonRect.center)
+            renderer.blit(animButton, animRect)
+            self.startButtonAnimPhase += 0.015
+
+            animButtonB = phaseFrame(self.settingsButtonFrames, self.settingsButtonAnimPhase)
+            animRectB = animButtonB.get_rect(center=self.settingsButtonRect.center)
+            renderer.blit(animButtonB, animRectB)
+            self.settingsButtonAnimPhase += 0.015
+
+        # Render and animate "FLIP" text
+        if self.flipAnimate:
+            self.animateFlipText()
+
+        # Show how much of the game has streamed in until it is ready.
+        if self.game.loadedTime is None:
+            loadBarRect = self.loadBarImg.get_rect(midbottom=view.px(SCREEN_WIDTH / 2, SCREEN_HEIGHT - 40))
+            renderer.blit(self.loadBarImg, loadBarRect, (0, 0, int(loadBarRect.width * self.game.loadProgress), loadBarRect.height))
+
+        renderer.present()  # Push the changed areas of the screen to the display.
+
+    def drawBackground(self, surface):
+        """
+        PURPOSE: Draw the static layers of the start menu: the background and the "NINJA" half of the title.
+        PARAMETER(S): surface (pygame.Surface): The surface to draw onto.
+        RETURN: None. Draws the static layers onto the given surface.
+        """
+
+        surface.fill(BLACK)
+
+        # Render "NINJA" text statically
+        ninja_text = fontMngr.render("NINJA", self.titleFont, WHITE)
+        ninja_text_rect = ninja_text.get_rect(center=view.px(SCREEN_WIDTH / 2 + 100, SCREEN_HEIGHT / 4))
+        surface.blit(ninja_text, ninja_text_rect)
+
+    def animateFlipText(self):
+        """
+        PURPOSE: Add the game title to the main menu UI and animates the "FLIP" text to
+                 rotate continuously.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        currTime = pygame.time.get_ticks()
+
+        if not self.pauseAfterFlip:
+            # Rotate the text if not in pause
+            if currTime - self.flipTextLastUpdate > 2:  # Update every 2ms for smoother animation
+                self.flipTextRotation += 2 # Rotation speed = 2 degrees per iteration
+
+                if self.flipTextRotation >= 360:
+                    self.flipTextRotation = 0
+                    self.pauseAfterFlip = True
+                    self.flipPauseStartTime = currTime
+
+                self.flipTextLastUpdate = currTime
+
+        else:
+            # Pause after complete rotation
+            if currTime - self.flipPauseStartTime >= self.pauseDuration:
+                self.pauseAfterFlip = False  # End pause
+
+        # Pick the precomputed "FLIP" frame for the current rotation, 2 degrees per frame
+        rotatedFlipText = self.flipTextFrames[self.flipTextRotation // 2]
+        rotatedFlipTextRect = rotatedFlipText.get_rect(center=view.px(SCREEN_WIDTH / 2 - 100, SCREEN_HEIGHT / 4))
+
+        self.game.renderer.blit(rotatedFlipText, rotatedFlipTextRect)
+
+class SettingsScene(Scene):
+    """
+    SettingsScene CLASS FOR THE SETTINGS SCREEN, OPENED OVER THE START MENU
+    """
+    def __init__(self, game):
+        """
+        PURPOSE: DEFINES THE SETTINGS TEXT, THE BUTTONS AND THE VOLUME SLIDER ARE BUILT ONCE THEIR IMAGES HAVE STREAMED IN
+        PARAMETER(S): game (Game): The game whose state and resources the scene uses
+        RETURN: NONE
+        """
+
+        super().__init__(game)
+
+        self.settingsFont = fontMngr.font('firacodenerdfontpropomed', view.fontSize(72))  # Settings title
+        self.volumeTextFont = fontMngr.font('firacodenerdfontpropomed', view.fontSize(36))
+        self.volumeText = fontMngr.render('Game Volume', self.volumeTextFont, WHITE)
+
+        self.backHoverSoundPlayed = False # Flag to track if back hover sound has been played
+        self.volumeSliderRects = []
+
+    def loadAssets(self):
+        """
+        PURPOSE: Load the settings screen's buttons and volume slider.
+        PARAMETER(S): None.
+        RETURN: None. Initializes the images and their bounding rectangles.
+        """
+
+        self.muteButtonImg = assetMngr.image('Assets/Buttons/muteButton.png', (100, 100))
+        self.unmuteButtonImg = assetMngr.image('Assets/Buttons/unmuteButton.png', (100, 100))
+        self.volumeButtonRect = self.unmuteButtonImg.get_rect(topright=view.px(SCREEN_WIDTH - 100, 350))
+        self.initVolumeSlider()
+
+        self.backButtonImg = assetMngr.image('Assets/Buttons/backButton.png', (BUTTON_SIZE[0]/2.5, BUTTON_SIZE[1]/2.5))
+        self.backButtonRect = self.backButtonImg.get_rect(topleft=view.px(10, 10))  # Position it at the top left
+
+    def initVolumeSlider(self):
+        """
+        PURPOSE: Initialize the graphical representation and functionality of the volume slider in the settings menu.
+        PARAMETER(S): None. Sets up the positions and sizes of volume slider components.
+        RETURN: None. Creates volume slider rectangles and assigns them to a list.
+        """
+
+        # Initialize the volume slider for the settings menu.
+        sliderXStart = self.volumeButtonRect.right - view.px(1450)  # Position starting X.
+        sliderY = self.volumeButtonRect.bottom - view.px(75)  # Position Y aligned with mute button.
+        rectWidth, rectHeight = view.px(120), self.volumeButtonRect.height / 2  # Slider dimensions.
+        spacing = view.px(10)  # Space between slider segments.
+
+        # Create slider segments.
+        for i in range(10):
+            x = sliderXStart + i * (rectWidth + spacing)
+            rect = pygame.Rect(x, sliderY, rectWidth, rectHeight)
+            self.volumeSliderRects.append(rect)  # Add segment to the list.
+
+        # Load slider images, scaled once to the size of a segment, which is already at the render resolution.
+        segmentSize = self.volumeSliderRects[0].size
+        self.volOnImg = assetMngr.image('Assets/Buttons/volOn.png', segmentSize, scaled=False)
+        self.volOffImg = assetMngr.image('Assets/Buttons/volOff.png', segmentSize, scaled=False)
+        self.volumeSliderBatch = BlitBatch()
+        self.volumeSliderBatch.resize(10)
+
+    def enter(self):
+        """
+        PURPOSE: Finish loading the settings buttons if they haven't streamed in yet.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        self.game.finishLoading()
+
+    def update(self):
+        """
+        PURPOSE: Handle one frame of input on the settings UI, allowing the user to adjust volume and access other settings.
+        PARAMETER(S): None. Handles user input on the settings screen.
+        RETURN: None. Updates the game's settings based on user interactions.
+        """
+
+        game = self.game
+
+        # Handle one frame of the settings menu interface.
+        for event in game.pollEvents():
+
+            if event.type == pygame.QUIT:
+                # Leave through the main loop so queued writes are flushed before exiting.
+                game.running = False
+
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                pos = pygame.mouse.get_pos()
+
+                # Check if a volume slider rectangle is clicked.
+                for i, rect in enumerate(self.volumeSliderRects):
+                    if rect.collidepoint(pos):
+                        game.setVolume((i + 1) / 10.0)  # Adjust volume based on click.
+
+                        break
+
+                # Check if the mute button is clicked.
+                if self.volumeButtonRect.collidepoint(pos):
+                    game.toggleMute()
+
+                # Check if the back button is clicked.
+                elif self.backButtonRect.collidepoint(pos):
+                    game.selectSound.play()
+                    game.scenes.pop()  # Close settings, returning to the start menu underneath.
+
+                    return
+
+            # Allow exiting settings with ESC key.
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                game.scenes.pop()
+
+                return
+
+    def render(self):
+        """
+        PURPOSE: Draw one frame of the settings UI, which only changes when the volume does.
+        PARAMETER(S): None. Uses the current volume and mouse position.
+        RETURN: None. Presents the frame.
+        """
+
+        mx, my = pygame.mouse.get_pos()
+
+        # Play the hover sound when the back button is first hovered.
+        if self.backButtonRect.collidepoint((mx, my)):
+            if not self.backHoverSoundPlayed:
+                self.game.hoverSound.play()
+                self.backHoverSoundPlayed = True
+
+        else:
+            self.backHoverSoundPlayed = False
+
+        self.game.renderer.beginStatic(('settings', self.game.volume), self.drawBackground)
+        self.game.renderer.present()  # Push the changed areas of the screen to the display.
+
+    def drawBackground(self, surface):
+        """
+        PURPOSE: Draw the settings screen: the back button, the title, the volume slider and the mute button.
+        PARAMETER(S): surface (pygame.Surface): The surface to draw onto.
+        RETURN: None. Draws the settings screen onto the given surface.
+        """
+
+        surface.fill(BLACK)
+        surface.blit(self.backButtonImg, self.backButtonRect)
+
+        # Draw the "Settings" title.
+        settingsText = fontMngr.render("Settings", self.settingsFont, WHITE)
+        surface.blit(settingsText, (surface.get_width() / 2 - settingsText.get_width() / 2, view.px(20)))
+
+        # Draw the volume text and slider.
+        volumeTextPos = (self.volumeSliderRects[0].left - view.px(275), (self.volumeSliderRects[0].centery - self.volumeTextFont.get_height() // 2))
+        surface.blit(self.volumeText, volumeTextPos)
+        self.drawVolumeSlider(surface)
+
+        # The mute button shows whether the game is muted.
+        surface.blit(self.unmuteButtonImg if self.game.volume > 0 else self.muteButtonImg, self.volumeButtonRect)
+
+    def drawVolumeSlider(self, surface):
+        """
+        PURPOSE: Draw the volume slider and its current level on the settings screen.
+        PARAMETER(S): surface (pygame.Surface): The surface to draw onto. Utilizes the current volume level and slider setup.
+        RETURN: None. Draws the slider and its current setting visually on the surface.
+        """
+
+        # Draw the volume slider and highlight segments based on the current volume.
+        for i, rect in enumerate(self.volumeSliderRects):
+            self.volumeSliderBatch.set(i, self.volOnImg if i < self.game.volume * 10 else self.volOffImg, rect.x, rect.y)
+
+        self.volumeSliderBatch.draw(surface)
+
+class TutorialScene(Scene):
+    """
+    TutorialScene CLASS FOR THE FIRST RUN TUTORIAL THAT LEADS STRAIGHT INTO THE GAME
+    """
+    def __init__(self, game):
+        """
+        PURPOSE: DEFINES THE SPACEBAR PROMPT, WHICH IS ONLY LOADED WHILE THE TUTORIAL IS SHOWING
+        PARAMETER(S): game (Game): The game whose state and resources the scene uses
+        RETURN: NONE
+        """
+
+        super().__init__(game)
+
+        self.spaceBarImg = None
+        self.promptShown = False  # Whether the spacebar prompt has been answered
+
+    def enter(self):
+        """
+        PURPOSE: Finish loading the game, then reset the run and load the spacebar prompt.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        self.game.finishLoading()
+        self.game.sim.reset()  # Reset player, obstacles and score.
+        self.promptShown = False
+        self.spaceBarImg = assetMngr.image(TUTORIAL_IMAGE, (400, 300))
+
+    def exit(self):
+        """
+        PURPOSE: Free the spacebar prompt, it is only ever shown once.
+        PARAMETER(S): None.
+        RETURN: None. Drops the prompt image here and in the asset manager.
+        """
+
+        self.spaceBarImg = None
+        assetMngr.release(TUTORIAL_IMAGE)
+
+    def update(self):
+        """
+        PURPOSE: Run one frame of the tutorial for new players, introducing game mechanics like gravity flipping.
+        PARAMETER(S): None. Guides the player through initial gameplay concepts.
+        RETURN: None. Switches to the game once the tutorial is completed or skipped.
+        """
+
+        game = self.game
+
+        # Handle one frame of the tutorial for first-time players.
+        tutorialDone = False
+
+        for event in game.pollEvents():
+
+            if event.type == pygame.QUIT:
+                game.running = False
+
+            if event.type == pygame.KEYDOWN:
+
+                if event.key == pygame.K_SPACE:
+
+                    if not self.promptShown:
+                        self.promptShown = True  # Hide prompt after first gravity flip.
+                        game.player.flipGravity()
+
+                    else:
+                        tutorialDone = True  # End tutorial on second space press.
+
+                if event.key == pygame.K_ESCAPE:
+                    tutorialDone = True  # Allow exiting the tutorial with ESC.
+
+        if tutorialDone:
+            game.sim.reset()  # Start the game from a fresh seed so the run can be recorded from its first tick.
+            game.scenes.switch(game.gameScene)  # Start the main game.
+
+            return
+
+        if self.promptShown:
+            # Regular gameplay during the tutorial.
+            game.player.update()
+            game.obstacleMngr.update()
+
+    def render(self):
+        """
+        PURPOSE: Draw one frame of the tutorial.
+        PARAMETER(S): None.
+        RETURN: None. Presents the frame.
+        """
+
+        game = self.game
+
+        if not self.promptShown:
+            # Display the spacebar prompt for gravity flipping, nothing moves so it is only drawn once.
+            game.renderer.beginStatic('tutorialPrompt', self.drawPrompt)
+
+        else:
+            game.renderer.beginFull()
+            game.bgMngr.draw(game.screen)  # Draw the background, which covers the whole screen.
+            game.player.draw(game.screen)
+            game.obstacleMngr.draw(game.screen)
+
+        game.renderer.present()  # Push the changed areas of the screen to the display.
+
+    def drawPrompt(self, surface):
+        """
+        PURPOSE: Draw the tutorial's spacebar prompt over the background.
+        PARAMETER(S): surface (pygame.Surface): The surface to draw onto.
+        RETURN: None. Draws the prompt screen onto the given surface.
+        """
+
+        self.game.bgMngr.draw(surface)  # Draw the background, which covers the whole surface.
+
+        # Display the spacebar prompt for gravity flipping.
+        surface.blit(self.spaceBarImg, view.px(SCREEN_WIDTH / 2 - 200, SCREEN_HEIGHT / 2 - 150))
+
+class GameScene(Scene):
+    """
+    GameScene CLASS FOR GAMEPLAY, THE GAME OVER SCREEN IS OPENED OVER IT
+    """
+    def __init__(self, game):
+        """
+        PURPOSE: DEFINES THE SESSION STATE AND THE SCORE STRIP, THE DIGITS AND SOUNDS ARE LOADED ONCE THEY HAVE STREAMED IN
+        PARAMETER(S): game (Game): The game whose state and resources the scene uses
+        RETURN: NONE
+        """
+
+        super().__init__(game)
+
+        self.pendingFlip = False  # A flip waiting for the next tick
+        self.scoreRecorded = False  # Flag to track score recording to prevent duplicate score entries
+
+        # The in-game score is drawn as one strip of digits, rebuilt only when the score changes
+        self.scoreBatch = BlitBatch()
+        self.scoreStrip = None
+        self.scoreStripValue = None
+        self.scoreStripX = 0
+
+    def loadAssets(self):
+        """
+        PURPOSE: Load the score digits and the gameplay sounds.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        # Load images for numbers 0-9 for score display.
+        self.numberImgs = [assetMngr.image(path, NUMBER_SIZE) for path in NUMBER_PATHS]
+        self.deathSound = audioMngr.cue('Assets/Music/death.wav')  # Load the death sound
+        self.pointSound = audioMngr.cue('Assets/Music/point.wav', voices=2, minGap=0.1)  # Scores can come a few frames apart
+
+    def enter(self):
+        """
+        PURPOSE: Finish loading the game, then start the run and preload the game over animations so the frame the player
+                 dies on never builds them.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        self.game.finishLoading()
+        self.game.gameOverScene.loadFrames()
+        self.start()
+
+    def exit(self):
+        """
+        PURPOSE: Release the game over animations once the player leaves for the menu.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        self.game.gameOverScene.releaseFrames()
+
+    def start(self):
+        """
+        PURPOSE: Start a play session on the current run.
+        PARAMETER(S): None.
+        RETURN: None. Restarts the timestep, allows the score to be recorded and plays the game music.
+        """
+
+        self.game.resetTimestep()
+        self.pendingFlip = False
+        self.scoreRecorded = False  # Allow score recording for the new session.
+        self.game.playGameMusic()  # Play game music.
+
+    def update(self):
+        """
+        PURPOSE: Run one frame of gameplay, stepping the simulation in fixed ticks.
+        PARAMETER(S): None. Uses the length of the last frame measured by the main loop.
+        RETURN: None. Opens the game over screen once the player dies.
+        """
+
+        game = self.game
+        game.tickAccumulator += game.frameTime
+
+        with profiler.span('events'):
+            for event in game.pollEvents():
+
+                if event.type == pygame.QUIT:
+                    game.running = False
+
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                    self.pendingFlip = not self.pendingFlip  # Flip gravity on the next tick.
+
+        # Step the simulation in fixed ticks, the same logic the headless runner uses, however long the frame took.
+        with profiler.span('simulate'):
+            while game.tickAccumulator >= TICK_TIME and not game.sim.dead:
+                game.tickAccumulator -= TICK_TIME
+                game.bgMngr.update(TICK_TIME)
+                scored = game.sim.step(self.pendingFlip)
+                self.pendingFlip = False
+
+                if scored:
+                    self.pointSound.play()  # Play sound on score update.
+
+        # Handle game over state once the simulation reports a collision.
+        if game.sim.dead:
+
+            if not self.scoreRecorded:  # Record score once per game session.
+                game.updateScoreRecord(game.score)
+                game.saveReplay()
+                self.scoreRecorded = True
+
+            self.deathSound.play()  # Play death sound.
+            audioMngr.stopMusic()  # Fade out game music.
+            game.scenes.push(game.gameOverScene)  # Show game over screen over the finished run.
+
+    def render(self):
+        """
+        PURPOSE: Draw one frame of gameplay, interpolated between the last two ticks.
+        PARAMETER(S): None.
+        RETURN: None. Presents the frame.
+        """
+
+        game = self.game
+
+        # Fraction of a tick that has elapsed since the last one, used to interpolate drawing.
+        alpha = game.tickAccumulator / TICK_TIME
+
+        # Scrolling layers cover the whole screen, so every gameplay frame is a full redraw.
+        game.renderer.beginFull()
+
+        with profiler.span('background.draw'):
+            game.bgMngr.draw(game.screen, alpha)  # Draw the background, which covers the whole screen.
+
+        with profiler.span('player.draw'):
+            game.player.draw(game.screen, alpha)  # Draw the player.
+
+        with profiler.span('obstacles.draw'):
+            game.obstacleMngr.draw(game.screen, alpha)  # Draw obstacles.
+
+        with profiler.span('score.draw'):
+            self.drawScore()  # Display the score.
+
+        game.renderer.present()  # Update the full display Surface to the screen.
+
+    def drawScore(self):
+        """
+        PURPOSE: Draw the current game score on the screen.
+        PARAMETER(S): None. Uses the game's current score to display.
+        RETURN: None. Renders the score on the game screen using number images.
+        """
+
+        # Display the current score on the screen using number images, composited into one strip per score.
+        if self.scoreStripValue != self.game.score:
+            self.scoreStripX, self.scoreStrip = self.renderScoreStrip(self.game.score)
+            self.scoreStripValue = self.game.score
+
+        self.game.screen.blit(self.scoreStrip, (self.scoreStripX, view.px(10)))
+
+    def renderScoreStrip(self, score):
+        """
+        PURPOSE: Composite the digits of a score into a single image.
+        PARAMETER(S): score (int): The score to render.
+        RETURN: Tuple (int, pygame.Surface). Returns the x the strip is drawn at to centre it, and the digits side by
+                side on a transparent strip.
+        """
+
+        scoreStr = str(score)  # Convert score to string.
+        digitWidth = view.px(NUMBER_SIZE[0])  # Width of each digit at the render resolution.
+        totalWidth = digitWidth * len(scoreStr)  # Total width needed.
+        startX = view.width / 2 - totalWidth / 2  # Calculate starting X position.
+
+        # A spare column for rounding, and rows padded to whole 16 byte blocks, which the alpha blitter is much faster on
+        stripWidth = (math.ceil(totalWidth) + 1 + 3) // 4 * 4
+        strip = pygame.Surface((stripWidth, self.numberImgs[0].get_height()), pygame.SRCALPHA)
+
+        # Each digit lands on the same whole pixel it would if it were drawn straight onto the screen
+        self.scoreBatch.resize(len(scoreStr))
+
+        for i, digit in enumerate(scoreStr):
+            self.scoreBatch.set(i, self.numberImgs[int(digit)], int(startX + i * digitWidth) - int(startX), 0)
+
+        self.scoreBatch.draw(strip)
+
+        # Converted to the display format so the one blit a frame stays on the fast path
+        return int(startX), strip.convert_alpha()
+
+class GameOverScene(Scene):
+    """
+    GameOverScene CLASS FOR THE GAME OVER SCREEN, OPENED OVER THE FINISHED RUN
+    """
+    def __init__(self, game):
+        """
+        PURPOSE: DEFINES THE RESULT TEXT AND THE STATE OF THE ANIMATIONS, THE BUTTONS ARE LOADED ONCE THEY HAVE STREAMED IN
+        PARAMETER(S): game (Game): The game whose state and resources the scene uses
+        RETURN: NONE
+        """
+
+        super().__init__(game)
+
+        self.font = fontMngr.font('firacodenerdfontpropomed', view.fontSize(28))  # Best score and rank text
+        self.headingFont = fontMngr.font('firacodenerdfontpropomed', view.fontSize(78))  # Game over message
+
+        # Result shown on the game over screen
+        self.message = ""
+        self.color = RED
+
+        # Animation phases for buttons, their frames are built while a run is being played
+        self.retryButtonAnimPhase = 0
+        self.homeButtonAnimPhase = 0
+        self.retryButtonFrames = None
+        self.homeButtonFrames = None
+        self.numberFrames = None
+        self.hoverSoundPlayed = False  # Flag to track if the hover sound has been played
+
+        # The animated score's digits are drawn in one batch, laid out again only when the score changes
+        self.animatedScoreBatch = BlitBatch()
+        self.animatedScoreCenters = []  # Centre of each digit of the animated score
+        self.animatedScoreValue = None
+
+    def loadAssets(self):
+        """
+        PURPOSE: Load the game over screen's buttons and trophy.
+        PARAMETER(S): None.
+        RETURN: None. Initializes the images and their bounding rectangles.
+        """
+
+        self.retryButtonImg = assetMngr.image('Assets/Buttons/retryButton.png', BUTTON_SIZE)
+        self.retryButtonRect = self.retryButtonImg.get_rect(center=view.px(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 100))
+        self.homeButtonImg = assetMngr.image('Assets/Buttons/homeButton.png', (BUTTON_SIZE[0]/1.5, BUTTON_SIZE[1]/1.5))
+        self.homeButtonRect = self.homeButtonImg.get_rect(center=view.px(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + BUTTON_SIZE[1] * 1.5))
+
+        # Logic to display trophies on game over screen when high score beat
+        self.trophyImg = assetMngr.image('Assets/Buttons/trophy.png', (100, 100))
+
+    def loadFrames(self):
+        """
+        PURPOSE: Precompute every frame of the game over animations so the game over screen only blits cached surfaces.
+        PARAMETER(S): None. Uses the button and number settings of the game over screen.
+        RETURN: None. Initializes the frame lists for the pulsing buttons and pulsing digits.
+        """
+
+        # Pulsing buttons, scale factor = base + amplitude * sin(phase).
+        self.retryButtonFrames = assetMngr.pulseFrames('Assets/Buttons/retryButton.png', BUTTON_SIZE, 1.15, 0.10)
+        self.homeButtonFrames = assetMngr.pulseFrames('Assets/Buttons/homeButton.png', self.homeButtonImg.get_size(), 1.05, 0.05)
+
+        # Pulsing digits for the game over score.
+        self.numberFrames = [assetMngr.pulseFrames(path, NUMBER_SIZE, 1.05, 0.05) for path in NUMBER_PATHS]
+
+    def releaseFrames(self):
+        """
+        PURPOSE: Free the game over animations once the player has gone back to the menu.
+        PARAMETER(S): None.
+        RETURN: None. Drops the frame lists here and in the asset manager.
+        """
+
+        self.retryButtonFrames = self.homeButtonFrames = self.numberFrames = None
+        assetMngr.releaseFrames('Assets/Buttons/retryButton.png', 'Assets/Buttons/homeButton.png', *NUMBER_PATHS)
+
+    def enter(self):
+        """
+        PURPOSE: Work out the game over message once, when the game over screen opens.
+        PARAMETER(S): None. Uses the finished run's score and the best score.
+        RETURN: None. Sets the message and its colour.
+        """
+
+        game = self.game
+
+        # Determine if a new high score has been set
+        if game.score >= game.bestScore:
+            game.bestScore = game.score
+            self.message = "NEW HIGH SCORE!"
+            self.color = (0, 255, 0)  # Gold color for the high score message
+
+        else:
+            self.message = "You Died!"
+            self.color = RED
+
+    def update(self):
+        """
+        PURPOSE: Handle one frame of input on the game over screen, with options to retry or return to the main menu.
+        PARAMETER(S): None. Uses the mouse position and the event queue.
+        RETURN: None. Restarts the run or switches to the start menu based on selection.
+        """
+
+        game = self.game
+        mx, my = pygame.mouse.get_pos()
+
+        # Handle user input on the game over screen.
+        for event in game.pollEvents():
+
+            if event.type == pygame.QUIT:
+                game.running = False
+
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+
+                if self.retryButtonRect.collidepoint((mx, my)):
+                    game.selectSound.play()
+                    self.retry()  # Restart the game when retry is clicked.
+
+                    return
+
+                elif self.homeButtonRect.collidepoint((mx, my)):
+                    game.selectSound.play()
+                    game.sim.reset()  # Reset player, obstacles and score.
+                    game.scenes.switch(game.startMenuScene)  # Go back to the start menu, which plays the menu music.
+
+                    return
+
+    def retry(self):
+        """
+        PURPOSE: Start a new session straight from the game over screen, without going back to the menu.
+        PARAMETER(S): None.
+        RETURN: None. Closes the game over screen and restarts the run underneath it.
+        """
+
+        game = self.game
+
+        # The game scene underneath stays entered, so only the run and the session state are reset.
+        game.scenes.pop()  # Close the game over screen, returning to the game scene underneath.
+        game.sim.reset()  # Reset player, obstacles and score in place.
+        game.gameScene.start()
+
+    def render(self):
+        """
+        PURPOSE: Draw one frame of the game over screen, showing the final score, the best score and the buttons.
+        PARAMETER(S): None. Uses the game's current state and score information.
+        RETURN: None. Presents the frame.
+        """
+
+        game = self.game
+        renderer = game.renderer
+        mx, my = pygame.mouse.get_pos()
+
+        # The static layers are composited once per result, only the animated parts are redrawn each frame.
+        renderer.beginStatic(('gameOver', self.message, game.bestScore, game.percentBeaten), self.drawBackground)
+
+        homeButtonYOffset = self.retryButtonRect.bottom + view.px(50)  # 50 design pixels below the retry button
+
+        # Logic for animating and positioning the retry button
+        if self.retryButtonRect.collidepoint((mx, my)):
+
+            if not self.hoverSoundPlayed:
+                game.hoverSound.play()
+                self.hoverSoundPlayed = True
+
+            renderer.blit(self.retryButtonImg, self.retryButtonRect)
+
+        elif self.homeButtonRect.collidepoint((mx, my)):
+
+            if not self.hoverSoundPlayed:
+                game.hoverSound.play()
+                self.hoverSoundPlayed = True
+
+            renderer.blit(self.homeButtonImg, self.homeButtonRect.move(0, homeButtonYOffset - self.homeButtonRect.top))
+
+        else:
+            animButtonRetry = phaseFrame(self.retryButtonFrames, self.retryButtonAnimPhase)
+            animRectRetry = animButtonRetry.get_rect(center=self.retryButtonRect.center)
+
+            renderer.blit(animButtonRetry, animRectRetry)
+            self.retryButtonAnimPhase += 0.015
+            self.hoverSoundPlayed = False  # Reset flag when not hovering
+
+            animButtonHome = phaseFrame(self.homeButtonFrames, self.homeButtonAnimPhase)  # Smaller pulse for home button
+            animRectHome = animButtonHome.get_rect(center=(self.homeButtonRect.centerx, homeButtonYOffset + self.homeButtonImg.get_height() / 2))
+
+            renderer.blit(animButtonHome, animRectHome)
+            self.homeButtonAnimPhase += 0.015
+
+        # Display the animated score on the game over screen.
+        self.drawAnimatedScore(game.score, SCREEN_HEIGHT / 2 - 250, self.retryButtonAnimPhase - 1)
+
+        renderer.present()  # Push the changed areas of the screen to the display.
+
+    def drawBackground(self, surface):
+        """
+        PURPOSE: Draw the static layers of the game over screen: the overlay, the message, the trophies and the best score.
+        PARAMETER(S): surface (pygame.Surface): The surface to draw onto.
+        RETURN: None. Draws the static layers onto the given surface.
+        """
+
+        game = self.game
+        surface.fill(BLACK)
+
+        s = pygame.Surface(view.px(800, 600), pygame.SRCALPHA)   # Semi-transparent overlay
+        s.fill((0, 0, 0, 180))
+        surface.blit(s, view.px(SCREEN_WIDTH / 2 - 400, SCREEN_HEIGHT / 2 - 300))
+
+        text = fontMngr.render(self.message, self.headingFont, self.color)
+        textRect = text.get_rect(center=view.px(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 400))
+        surface.blit(text, textRect)
+
+        # Display trophies on both sides of the message if a new high score has been set
+        if game.score >= game.bestScore:
+            trophyLeftRect = self.trophyImg.get_rect(midright=(textRect.left - view.px(20), textRect.centery))
+            trophyRightRect = self.trophyImg.get_rect(midleft=(textRect.right + view.px(20), textRect.centery))
+            surface.blit(self.trophyImg, trophyLeftRect)
+            surface.blit(self.trophyImg, trophyRightRect)
+
+        # Display the best score text, only rendered again when the best score changes.
+        bestScoreStr = f"Best Score: {game.bestScore}"
+        bestScoreText = fontMngr.render(bestScoreStr, self.font, WHITE)
+
+        surface.blit(bestScoreText, (view.width / 2 - bestScoreText.get_width() / 2, view.px(SCREEN_HEIGHT / 2 - 150)))
+
+        # Display how this run ranks against the earlier ones.
+        if game.percentBeaten is not None:
+            rankText = fontMngr.render(f"Better than {game.percentBeaten:.0f}% of your runs", self.font, WHITE)
+            surface.blit(rankText, (view.width / 2 - rankText.get_width() / 2, view.px(SCREEN_HEIGHT / 2 - 110)))
+
+    def drawAnimatedScore(self, score, yPosition, animationPhase):
+        """
+        PURPOSE: Draw the current score with animation effects.
+        PARAMETER(S): score (int): The current score to display.
+                      yPosition (int): The vertical position on the screen to draw the score, in design pixels.
+                      animationPhase (float): The phase of the animation for dynamic effect.
+        RETURN: None. Draws the animated score on the screen.
+        """
+
+        # Lay the digits out again only when the score or its position changes.
+        if self.animatedScoreValue != (score, yPosition):
+            scoreStr = str(score)  # Convert score to string for individual digit processing.
+            digitWidth = view.px(NUMBER_SIZE[0])  # Width of each digit at the render resolution.
+            totalWidth = digitWidth * len(scoreStr)  # Calculate total width needed for the score.
+            startX = view.width / 2 - totalWidth / 2  # Calculate starting X position.
+            centerY = int(view.px(yPosition) + 0.5)  # Centres are rounded the way a Rect rounds them.
+            self.animatedScoreCenters = [(int(digit), int(startX + i * digitWidth + digitWidth // 2 + 0.5), centerY) for i, digit in enumerate(scoreStr)]
+            self.animatedScoreBatch.resize(len(scoreStr))
+            self.animatedScoreValue = (score, yPosition)
+
+        # Pick the precomputed frame of each digit for this phase, centred on its place, and draw them all at once.
+        for i, (digit, centerX, centerY) in enumerate(self.animatedScoreCenters):
+            animImg = phaseFrame(self.numberFrames[digit], animationPhase)
+            self.animatedScoreBatch.set(i, animImg, centerX - animImg.get_width() // 2, centerY - animImg.get_height() // 2)
+
+        self.game.renderer.blits(self.animatedScoreBatch)
+
+class ReplayScene(Scene):
+    """
+    ReplayScene CLASS TO PLAY BACK A RECORDED RUN AT ANY SPEED, RETURNING TO THE START MENU WHEN IT ENDS
+    """
+    def __init__(self, game):
+        """
+        PURPOSE: DEFINES THE RUN BEING PLAYED BACK, ITS FLIP POLICY AND HOW MANY TIMES FASTER THAN REAL TIME IT PLAYS
+        PARAMETER(S): game (Game): The game whose state and resources the scene uses
+        RETURN: NONE
+        """
+
+        super().__init__(game)
+
+        self.replay = None
+        self.policy = None
+        self.speed = 1.0
+
+    def setReplay(self, replay, speed=1.0):
+        """
+        PURPOSE: Choose the run the scene plays back the next time it is entered.
+        PARAMETER(S): replay (Replay): The run to play back.
+                      speed (float): How many times faster than real time to play it.
+        RETURN: None.
+        """
+
+        self.replay = replay
+        self.speed = max(0.01, float(speed))
+
+    def enter(self):
+        """
+        PURPOSE: Finish loading the game, then rewind the simulation to the start of the recorded run.
+        PARAMETER(S): None.
+        RETURN: None. Resets the simulation to the replay's seed and plays the game music.
+        """
+
+        self.game.finishLoading()
+        self.game.sim.reset(self.replay.seed)
+        self.policy = self.replay.policy()
+        self.game.resetTimestep()
+        self.game.playGameMusic()
+
+    def update(self):
+        """
+        PURPOSE: Run one frame of a replay, stepping the simulation with the recorded flips.
+        PARAMETER(S): None. Uses the length of the last frame, scaled by the replay speed.
+        RETURN: None. Returns to the start menu once the run ends or escape is pressed.
+        """
+
+        game = self.game
+        game.tickAccumulator += game.frameTime * self.speed
+        finished = False
+
+        for event in game.pollEvents():
+
+            if event.type == pygame.QUIT:
+                game.running = False
+
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                finished = True  # Stop watching early.
+
+        # Same fixed ticks as gameplay, only the flips come from the recording instead of the keyboard.
+        while game.tickAccumulator >= TICK_TIME and not game.sim.dead and game.sim.frame < self.replay.frames:
+            game.tickAccumulator -= TICK_TIME
+            game.bgMngr.update(TICK_TIME)
+            game.sim.step(self.policy(game.sim))
+
+        if finished or game.sim.dead or game.sim.frame >= self.replay.frames:
+            game.sim.reset()  # Reset player, obstacles and score.
+            game.scenes.switch(game.startMenuScene)  # Back to the start menu, which plays the menu music.
+
+    def render(self):
+        """
+        PURPOSE: Draw the interpolated run, exactly as gameplay is drawn.
+        PARAMETER(S): None.
+        RETURN: None.
+        """
+
+        self.game.gameScene.render()
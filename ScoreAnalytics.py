@@ -0,0 +1,237 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Import statements
+import bisect
+from collections import deque
+
+# Constants
+TOP_SCORES = 10         # Number of highest scores kept for the leaderboard
+ROLLING_WINDOW = 20     # Number of most recent scores the rolling mean and median cover
+HISTOGRAM_SIZE = 64     # Scores the histogram covers before it first has to grow
+
+class FenwickTree:
+    """
+    FenwickTree CLASS TO COUNT SCORES BY VALUE, ANSWERING "HOW MANY SCORES ARE BELOW X" IN LOGARITHMIC TIME
+    """
+    def __init__(self, size):
+        """
+        PURPOSE: DEFINES AN EMPTY TREE OVER THE VALUES 0 TO size - 1
+        PARAMETER(S): size (int): The number of values the tree covers
+        RETURN: NONE
+        """
+
+        self.tree = [0] * (size + 1)  # One-based partial sums
+
+    def add(self, index, delta):
+        """
+        PURPOSE: Add to the count of one value.
+        PARAMETER(S): index (int): The value to count, within the tree's size.
+                      delta (int): How much to add to its count.
+        RETURN: None. Updates the partial sums covering the value.
+        """
+
+        i = index + 1
+
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix(self, index):
+        """
+        PURPOSE: Count every value from 0 up to and including index.
+        PARAMETER(S): index (int): The highest value to include, -1 counts nothing.
+        RETURN: int. Returns the total count.
+        """
+
+        total = 0
+        i = min(index + 1, len(self.tree) - 1)
+
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+
+        return total
+
+class ScoreAnalytics:
+    """
+    ScoreAnalytics CLASS TO KEEP LEADERBOARD AND SUMMARY STATISTICS OF EVERY SCORE, UPDATED ONE SCORE AT A TIME
+    """
+    def __init__(self, topCount=TOP_SCORES, window=ROLLING_WINDOW):
+        """
+        PURPOSE: DEFINES THE EMPTY AGGREGATES
+        PARAMETER(S): topCount (int): How many of the highest scores the leaderboard keeps
+                      window (int): How many recent scores the rolling statistics cover
+        RETURN: NONE
+        """
+
+        self.topCount = topCount
+        self.window = window
+
+        self.best = 0
+        self.count = 0
+        self.top = []       # Highest scores, best first
+
+        # Count of runs per score, with a Fenwick tree over the same counts for percentile ranks
+        self.histogram = [0] * HISTOGRAM_SIZE
+        self.ranks = FenwickTree(HISTOGRAM_SIZE)
+
+        # Most recent scores, oldest first, the same scores kept sorted and their running sum
+        self.recent = deque(maxlen=window)
+        self.recentSorted = []
+        self.recentSum = 0
+
+    def add(self, score):
+        """
+        PURPOSE: Fold one new score into every aggregate.
+        PARAMETER(S): score (int): The score of a finished run.
+        RETURN: None. Updates the leaderboard, histogram and rolling statistics.
+        """
+
+        score = max(0, int(score))
+
+        self.count += 1
+        self.best = max(self.best, score)
+
+        # Top scores are kept best first, so insert against the negated order
+        if len(self.top) < self.topCount or score > self.top[-1]:
+            position = bisect.bisect_left([-s for s in self.top], -score)
+            self.top.insert(position, score)
+            del self.top[self.topCount:]
+
+        # Double the histogram whenever a score lands past its end, the tree is rebuilt from the counts
+        if score >= len(self.histogram):
+            size = len(self.histogram)
+
+            while score >= size:
+                size *= 2
+
+            self.histogram.extend([0] * (size - len(self.histogram)))
+            self.rebuildRanks()
+
+        self.histogram[score] += 1
+        self.ranks.add(score, 1)
+
+        # The oldest score drops out of the rolling window once it is full
+        if len(self.recent) == self.window:
+            oldest = self.recent[0]
+            self.recentSum -= oldest
+            del self.recentSorted[bisect.bisect_left(self.recentSorted, oldest)]
+
+        self.recent.append(score)
+        self.recentSum += score
+        bisect.insort(self.recentSorted, score)
+
+    def rebuildRanks(self):
+        """
+        PURPOSE: Rebuild the Fenwick tree from the histogram after it grows or is loaded.
+        PARAMETER(S): None.
+        RETURN: None. Replaces the tree with one matching the histogram.
+        """
+
+        # Filled in before it replaces the old tree, so a rank is never taken from a half built one
+        ranks = FenwickTree(len(self.histogram))
+
+        for score, runs in enumerate(self.histogram):
+            if runs:
+                ranks.add(score, runs)
+
+        self.ranks = ranks
+
+    def percentileRank(self, score):
+        """
+        PURPOSE: Work out the share of recorded runs that scored lower than a score.
+        PARAMETER(S): score (int): The score to rank.
+        RETURN: float. Returns the percentage of runs beaten, 0 when there are none yet.
+        """
+
+        if self.count == 0:
+            return 0.0
+
+        return 100 * self.ranks.prefix(int(score) - 1) / self.count
+
+    def rollingMean(self):
+        """
+        PURPOSE: Average of the most recent scores.
+        PARAMETER(S): None.
+        RETURN: float. Returns the mean of the rolling window, 0 when it is empty.
+        """
+
+        return self.recentSum / len(self.recent) if self.recent else 0.0
+
+    def rollingMedian(self):
+        """
+        PURPOSE: Median of the most recent scores.
+        PARAMETER(S): None.
+        RETURN: float. Returns the median of the rolling window, 0 when it is empty.
+        """
+
+        n = len(self.recentSorted)
+
+        if n == 0:
+            return 0.0
+
+        if n % 2:
+            return float(self.recentSorted[n // 2])
+
+        return (self.recentSorted[n // 2 - 1] + self.recentSorted[n // 2]) / 2
+
+    def topScores(self, n=TOP_SCORES):
+        """
+        PURPOSE: Leaderboard of the highest scores.
+        PARAMETER(S): n (int): How many scores to return, at most the number kept.
+        RETURN: List[int]. Returns the highest scores, best first.
+        """
+
+        return self.top[:n]
+
+    def bucketHistogram(self, bucketSize=1):
+        """
+        PURPOSE: Count runs in score ranges of equal width.
+        PARAMETER(S): bucketSize (int): How many consecutive scores each bucket covers.
+        RETURN: List[int]. Returns the run count of each bucket, up to the bucket holding the best score.
+        """
+
+        buckets = [0] * (self.best // bucketSize + 1)
+
+        for score in range(min(len(self.histogram), self.best + 1)):
+            buckets[score // bucketSize] += self.histogram[score]
+
+        return buckets
+
+    def state(self):
+        """
+        PURPOSE: Snapshot of the aggregates for saving in the score index.
+        PARAMETER(S): None.
+        RETURN: dict. Returns copies of the aggregates as plain JSON values, later scores never change a snapshot.
+        """
+
+        return {'best': self.best, 'count': self.count, 'top': list(self.top),
+                'histogram': self.histogram[:self.best + 1], 'recent': list(self.recent)}
+
+    def loadState(self, state):
+        """
+        PURPOSE: Restore the aggregates from a snapshot saved by state().
+        PARAMETER(S): state (dict): The saved aggregates.
+        RETURN: None. Replaces every aggregate, raising KeyError if the snapshot is incomplete.
+        """
+
+        histogram = list(state['histogram'])
+        size = HISTOGRAM_SIZE
+
+        while size < len(histogram):
+            size *= 2
+
+        self.best, self.count, self.top = state['best'], state['count'], list(state['top'])
+
+        self.histogram = histogram + [0] * (size - len(histogram))
+        self.rebuildRanks()
+
+        self.recent = deque(state['recent'], maxlen=self.window)
+        self.recentSorted = sorted(self.recent)
+        self.recentSum = sum(self.recent)
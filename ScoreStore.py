@@ -0,0 +1,235 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Import statements
+import json
+import os
+from ScoreAnalytics import ScoreAnalytics, TOP_SCORES
+
+class ScoreStore:
+    """
+    ScoreStore CLASS TO KEEP EVERY SCORE IN AN APPEND-ONLY LOG WITH A SMALL INDEX OF THE SCORE ANALYTICS
+    """
+    def __init__(self, directory='Extras', topCount=TOP_SCORES):
+        """
+        PURPOSE: DEFINES THE STORE FILES AND LOADS THE INDEX, MIGRATING THE OLD JSON SCORE LIST THE FIRST TIME
+        PARAMETER(S): directory (str): The folder holding the score files
+                      topCount (int): How many of the highest scores the index keeps
+        RETURN: NONE
+        """
+
+        self.logPath = os.path.join(directory, 'scoreLog.jsonl')       # One score per line, only ever appended to
+        self.indexPath = os.path.join(directory, 'scoreIndex.json')    # Summary of the log, rewritten atomically
+        self.legacyPath = os.path.join(directory, 'scoreRecords.json') # Old format, a JSON list rewritten on every game
+        self.topCount = topCount
+
+        # Summary of every score in the log
+        self.analytics = ScoreAnalytics(topCount)
+        self.logSize = 0    # Bytes of the log covered by the index
+
+        os.makedirs(directory, exist_ok=True)
+
+        if not os.path.exists(self.logPath) and os.path.exists(self.legacyPath):
+            try:
+                self.migrate()
+
+            except (OSError, ValueError, TypeError) as e:
+                print(f"Error migrating score records: {e}")
+
+        self.loadIndex()
+
+    def migrate(self):
+        """
+        PURPOSE: Copy the scores from the old JSON list into the log, once, leaving the old file untouched.
+        PARAMETER(S): None.
+        RETURN: None. Writes the log and its index.
+        """
+
+        with open(self.legacyPath, 'r') as file:
+            scores = json.load(file)
+
+        # Write the whole log under a temporary name so a crash never leaves half a migration behind
+        tempPath = self.logPath + '.tmp'
+
+        try:
+            with open(tempPath, 'w') as file:
+                file.writelines(f"{int(score)}\n" for score in scores)
+                file.flush()
+                os.fsync(file.fileno())
+
+            os.replace(tempPath, self.logPath)
+
+        except (OSError, ValueError, TypeError):
+            # A score that isn't a number leaves a partial temporary log, which is removed before the error is reported
+            if os.path.exists(tempPath):
+                os.remove(tempPath)
+
+            raise
+
+        for score in scores:
+            self.record(int(score))
+
+        self.logSize = os.path.getsize(self.logPath)
+        self.saveIndex()
+
+    def loadIndex(self):
+        """
+        PURPOSE: Load the index, catching up on any scores appended to the log after it was last written.
+        PARAMETER(S): None.
+        RETURN: None. Fills in the summary from the index and the unindexed tail of the log.
+        """
+
+        if os.path.exists(self.indexPath):
+            try:
+                with open(self.indexPath, 'r') as file:
+                    index = json.load(file)
+
+                self.analytics.loadState(index)
+                self.logSize = index['logSize']
+
+            except (ValueError, KeyError, TypeError):
+                # A damaged or older index is rebuilt from the log
+                self.analytics = ScoreAnalytics(self.topCount)
+                self.logSize = 0
+
+        logSize = os.path.getsize(self.logPath) if os.path.exists(self.logPath) else 0
+
+        if logSize < self.logSize:
+            self.analytics = ScoreAnalytics(self.topCount)  # The log was replaced, start over
+            self.logSize = 0
+
+        if logSize > self.logSize:
+            # Only the scores written since the index was saved need reading
+            with open(self.logPath, 'rb') as file:
+                file.seek(self.logSize)
+
+                for line in file:
+                    if line.endswith(b'\n'):
+                        try:
+                            self.record(int(line))
+
+                        except ValueError:
+                            pass  # Skip a damaged line
+
+                        self.logSize += len(line)
+
+            # A crash while appending can leave a torn last line, cut it off so the next score starts on a fresh line
+            if logSize > self.logSize:
+                try:
+                    os.truncate(self.logPath, self.logSize)
+
+                except OSError as e:
+                    print(f"Error repairing score log: {e}")
+
+            self.saveIndex()
+
+    @property
+    def best(self):
+        """
+        PURPOSE: Highest score in the log.
+        PARAMETER(S): None.
+        RETURN: int. Returns the best score, 0 if there are none.
+        """
+
+        return self.analytics.best
+
+    @property
+    def count(self):
+        """
+        PURPOSE: Number of scores in the log.
+        PARAMETER(S): None.
+        RETURN: int. Returns the number of finished games.
+        """
+
+        return self.analytics.count
+
+    @property
+    def top(self):
+        """
+        PURPOSE: Highest scores in the log.
+        PARAMETER(S): None.
+        RETURN: List[int]. Returns the top scores, best first.
+        """
+
+        return self.analytics.top
+
+    def record(self, score):
+        """
+        PURPOSE: Fold one score into the in-memory summary.
+        PARAMETER(S): score (int): The score to add.
+        RETURN: None. Updates the score analytics.
+        """
+
+        self.analytics.add(score)
+
+    def add(self, score):
+        """
+        PURPOSE: Append a score to the log and update the index, without reading back any history.
+        PARAMETER(S): score (int): The score achieved in the finished game.
+        RETURN: None. Appends to the log and atomically rewrites the index.
+        """
+
+        self.addMany([score])
+
+    def addMany(self, scores):
+        """
+        PURPOSE: Fold a batch of scores into the summary, then append them to the log and update the index.
+        PARAMETER(S): scores (List[int]): The scores to add, oldest first.
+        RETURN: None. Appends to the log and atomically rewrites the index.
+        """
+
+        for score in scores:
+            self.record(int(score))
+
+        self.append(scores, self.analytics.state())
+
+    def append(self, scores, state):
+        """
+        PURPOSE: Append scores already folded into the summary to the log with a single sync, then save the index once.
+        PARAMETER(S): scores (List[int]): The scores to append, oldest first.
+                      state (dict): Snapshot of the analytics from ScoreAnalytics.state(), covering exactly the scores
+                      in the log once these are appended.
+        RETURN: None. Only touches the files, so the writer thread can call it while the game reads the analytics.
+        """
+
+        lines = b''.join(f"{int(score)}\n".encode() for score in scores)
+
+        with open(self.logPath, 'ab+') as file:
+            # Never glue a score onto a torn last line, cut the partial line off before appending
+            if file.seek(0, os.SEEK_END) > self.logSize:
+                file.seek(self.logSize)
+                tail = file.read()
+
+                if not tail.endswith(b'\n'):
+                    file.truncate(self.logSize + tail.rfind(b'\n') + 1)
+
+            file.write(lines)
+            file.flush()
+            os.fsync(file.fileno())
+
+            # The index covers the whole file as it now is, so its size can't drift from the log's
+            logSize = file.tell()
+
+        self.logSize = logSize
+        self.saveIndex(state)
+
+    def saveIndex(self, state=None):
+        """
+        PURPOSE: Write the index next to the log, replacing the old one in a single step.
+        PARAMETER(S): state (dict): Snapshot of the analytics to save, None takes one now.
+        RETURN: None. Writes the index file atomically.
+        """
+
+        tempPath = self.indexPath + '.tmp'
+
+        with open(tempPath, 'w') as file:
+            json.dump(dict(state or self.analytics.state(), logSize=self.logSize), file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(tempPath, self.indexPath)
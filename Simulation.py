@@ -0,0 +1,94 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Import statements
+import random
+from array import array
+
+# Star imports from other game files
+from ObstacleManager import *
+from Player import *
+
+class Simulation:
+    """
+    Simulation CLASS TO STEP THE PLAYER PHYSICS, OBSTACLES AND SCORING WITHOUT ANY DISPLAY, MIXER OR FRAME CAP
+    """
+    def __init__(self, seed=None):
+        """
+        PURPOSE: DEFINES THE PLAYER, OBSTACLES AND RUN STATE THAT MAKE UP ONE GAME SESSION
+        PARAMETER(S): seed (int): Seed for the first run's obstacles, None picks a new one
+        RETURN: NONE
+        """
+
+        # Entities driven by every tick
+        self.player = Player()
+        self.obstacleMngr = ObstacleManager()
+
+        # Ticks gravity was flipped on this run, together with the seed this is enough to replay it
+        self.flipFrames = array('L')
+
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """
+        PURPOSE: Start a fresh run with the player back at the start and an empty obstacle field.
+        PARAMETER(S): seed (int): Seed for the run's obstacles, None picks a new one.
+        RETURN: None. Resets the simulation state in place, reusing the existing player and obstacle slots.
+        """
+
+        # Run state
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.score = 0      # Pairs of obstacles passed this run
+        self.frame = 0      # Number of ticks simulated this run
+        self.dead = False   # Set once the player hits an obstacle or the screen edge
+        del self.flipFrames[:]
+
+        self.player.reset()
+        self.obstacleMngr.reset(self.seed)
+
+    def step(self, flip=False):
+        """
+        PURPOSE: Advance the run by a single fixed-length tick of animation, physics, obstacle movement, scoring and collision.
+        PARAMETER(S): flip (bool): Whether the player flips gravity at the start of this tick.
+        RETURN: int. Returns the number of points scored during this tick.
+        """
+
+        if flip:
+            self.player.flipGravity()
+            self.flipFrames.append(self.frame)
+
+        # Animate and move the player, then move the obstacles
+        self.player.updateAnimation()
+        self.player.updatePhysics()
+        self.obstacleMngr.update()
+
+        # Score any pairs the player has cleared
+        previousScore = self.score
+        self.score = self.obstacleMngr.updateScore(self.player.spriteRect, self.score)
+
+        # The run ends on contact with an obstacle or either edge of the screen
+        playerRect = self.player.spriteRect
+        if self.obstacleMngr.checkCollision(playerRect, self.player.spriteMask) or playerRect.top <= 0 or playerRect.bottom >= SCREEN_HEIGHT:
+            self.dead = True
+
+        self.frame += 1
+
+        return self.score - previousScore
+
+    def run(self, policy, maxFrames):
+        """
+        PURPOSE: Simulate a whole run as fast as possible, asking a policy each tick whether to flip gravity.
+        PARAMETER(S): policy (callable): Called with the simulation each tick, returns True to flip gravity.
+                      maxFrames (int): The maximum number of ticks to simulate before stopping.
+        RETURN: int. Returns the final score of the run.
+        """
+
+        while not self.dead and self.frame < maxFrames:
+            self.step(policy(self))
+
+        return self.score
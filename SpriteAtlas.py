@@ -0,0 +1,104 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+
+# Import statements
+import pygame
+
+class SpriteAtlas:
+    """
+    SpriteAtlas CLASS TO PACK THE FRAMES OF AN ANIMATION AND THEIR UPSIDE DOWN COPIES INTO ONE SHEET, HANDING OUT VIEWS OF IT
+    """
+    def __init__(self, images, height):
+        """
+        PURPOSE: DEFINES THE SHEET, ONE ROW OF UPRIGHT FRAMES ABOVE ONE ROW OF FLIPPED FRAMES, AND A VIEW OF EACH FRAME
+        PARAMETER(S): images (List[pygame.Surface]): The frames of the animation, in order
+                      height (int): The height every frame is scaled to, keeping the first frame's proportions
+        RETURN: NONE
+        """
+
+        width = int(images[0].get_width() * height / images[0].get_height())
+        self.frameSize = (width, height)
+
+        # One transparent sheet in the display format, so every frame blits without a conversion
+        self.sheet = pygame.Surface((width * len(images), height * 2), pygame.SRCALPHA)
+
+        if pygame.display.get_surface() is not None:
+            self.sheet = self.sheet.convert_alpha()
+
+        # Scale each frame straight into its cell, the flipped copy goes in the cell below it. Taking the maximum against
+        # the cleared sheet copies pixels exactly, a normal blit would darken the semi-transparent edges
+        for i, img in enumerate(images):
+            scaled = pygame.transform.scale(img, self.frameSize)
+            self.sheet.blit(scaled, (i * width, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.sheet.blit(pygame.transform.flip(scaled, False, True), (i * width, height), special_flags=pygame.BLEND_RGBA_MAX)
+
+        self.makeViews(len(images))
+
+    @classmethod
+    def fromSheet(cls, sheet, frameCount):
+        """
+        PURPOSE: Wrap a sheet packed earlier, such as one kept in the on-disk asset cache.
+        PARAMETER(S): sheet (pygame.Surface): The packed sheet, upright frames above flipped ones.
+                      frameCount (int): The number of frames in each row.
+        RETURN: SpriteAtlas. Returns the atlas of the sheet.
+        """
+
+        atlas = cls.__new__(cls)
+        atlas.sheet = sheet
+        atlas.frameSize = (sheet.get_width() // frameCount, sheet.get_height() // 2)
+        atlas.makeViews(frameCount)
+
+        return atlas
+
+    def makeViews(self, frameCount):
+        """
+        PURPOSE: Make a view of each frame's cell in the sheet.
+        PARAMETER(S): frameCount (int): The number of frames in each row.
+        RETURN: None.
+        """
+
+        width, height = self.frameSize
+
+        # Views share the sheet's pixels, so the frames cost no memory of their own
+        self.frames = [self.sheet.subsurface((i * width, 0, width, height)) for i in range(frameCount)]
+        self.flippedFrames = [self.sheet.subsurface((i * width, height, width, height)) for i in range(frameCount)]
+
+    def frame(self, index, flipped=False):
+        """
+        PURPOSE: Get one frame of the animation.
+        PARAMETER(S): index (int): The frame number.
+                      flipped (bool): Whether to get the upside down copy.
+        RETURN: pygame.Surface. Returns a view of the frame's cell in the sheet.
+        """
+
+        return (self.flippedFrames if flipped else self.frames)[index]
+
+class Timeline:
+    """
+    Timeline CLASS TO PICK THE FRAME OF A LOOPING ANIMATION FROM HOW LONG IT HAS BEEN PLAYING, WHATEVER THE FRAME RATE
+    """
+    def __init__(self, frameCount, fps):
+        """
+        PURPOSE: DEFINES THE LENGTH AND SPEED OF THE ANIMATION
+        PARAMETER(S): frameCount (int): The number of frames in one loop
+                      fps (float): The number of frames shown per second
+        RETURN: NONE
+        """
+
+        self.frameCount = frameCount
+        self.fps = fps
+
+    def frameAt(self, elapsed):
+        """
+        PURPOSE: Work out which frame is showing at a point in the animation.
+        PARAMETER(S): elapsed (float): Seconds since the animation started.
+        RETURN: int. Returns the frame number.
+        """
+
+        # The small nudge stops a time landing exactly on a frame boundary from rounding down to the frame before
+        return int(elapsed * self.fps + 1e-6) % self.frameCount
@@ -0,0 +1,365 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+# Import statements
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+# Run without a window or an audio device
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Star import the game file
+from Game import *
+
+# Constants
+RESULTS_VERSION = 1                                     # Bumped whenever the results file layout changes
+OBSTACLE_COUNTS = [2, 4, 8, 16]                         # Obstacle pairs on screen for the obstacle and gameplay cases
+RESOLUTIONS = list(RESOLUTION_TIERS)                    # Render resolutions a whole gameplay frame is timed at
+REGRESSION_THRESHOLD = 0.10                             # Slowdown of the median beyond which a case counts as a regression
+NOISE_FLOOR_US = 1.0                                    # Slowdowns smaller than this many microseconds are never regressions
+STARTUP_RUNS = 5                                        # Fresh game processes started to time startup
+
+# --------------------------------------------------------------------------------------------------------------------------------------------------------------------
+def timeCall(fn, duration, warmup=20):
+    """
+    PURPOSE: Time single calls of a function until a time budget is used up.
+    PARAMETER(S): fn (callable): The call to time, taking no arguments.
+                  duration (float): Seconds to spend timing it.
+                  warmup (int): Calls made first and not timed, so caches and lazy loads are settled.
+    RETURN: dict. Returns the number of timed calls and their mean, median, 95th percentile and fastest time in microseconds.
+    """
+
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    clock = time.perf_counter_ns
+    end = clock() + int(duration * 1e9)
+
+    # Always take a handful of samples, even for calls slower than the whole budget
+    while len(samples) < 5 or clock() < end:
+        start = clock()
+        fn()
+        samples.append(clock() - start)
+
+    return summarise(samples)
+
+def summarise(samples):
+    """
+    PURPOSE: Summarise a list of timings.
+    PARAMETER(S): samples (List[int]): The timings in nanoseconds.
+    RETURN: dict. Returns the number of timings and their mean, median, 95th percentile and fastest time in microseconds.
+    """
+
+    samples = sorted(samples)
+    n = len(samples)
+
+    return {'calls': n,
+            'meanUs': sum(samples) / n / 1000,
+            'medianUs': samples[n // 2] / 1000,
+            'p95Us': samples[min(n - 1, int(n * 0.95))] / 1000,
+            'minUs': samples[0] / 1000}
+
+def measureStartup(runs, resolution=DEFAULT_RESOLUTION):
+    """
+    PURPOSE: Time how long a freshly started game takes to show its first frame and to finish loading.
+    PARAMETER(S): runs (int): The number of game processes to start, one after another.
+                  resolution (str): The RESOLUTION_TIERS entry the games render at.
+    RETURN: dict. Returns the timings of both, keyed by case name, from launch including importing the game.
+    """
+
+    firstFrames, loads = [], []
+
+    # The games inherit the dummy video and audio drivers set above
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, 'main.py', '--startup-report', '--resolution', resolution], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+
+        # The report is the last line, after anything pygame prints on import
+        report = json.loads(output.strip().splitlines()[-1])
+        firstFrames.append(report['firstFrameMs'] * 1e6)
+        loads.append(report['loadedMs'] * 1e6)
+
+    return {'startup.firstFrame': summarise(firstFrames), 'startup.loaded': summarise(loads)}
+
+def fillObstacles(obstacleMngr, count):
+    """
+    PURPOSE: Place a fixed number of obstacle pairs evenly across the screen.
+    PARAMETER(S): obstacleMngr (ObstacleManager): The obstacle field to fill, it is reset first.
+                  count (int): The number of pairs to place.
+    RETURN: Tuple. Returns the field's ring buffer position, so each timed call can start from the same field.
+    """
+
+    obstacleMngr.reset(0)
+
+    # Each pair spawns at the right edge, scrolling between spawns spreads them over the whole width
+    for _ in range(count):
+        obstacleMngr.addObstacle()
+        obstacleMngr.scrollX -= SCREEN_WIDTH / count
+
+    return obstacleMngr.head, obstacleMngr.count, obstacleMngr.scrollX, obstacleMngr.scoredCount
+
+def restoreObstacles(obstacleMngr, state):
+    """
+    PURPOSE: Put an obstacle field back where fillObstacles left it.
+    PARAMETER(S): obstacleMngr (ObstacleManager): The obstacle field to restore.
+                  state (Tuple): The position returned by fillObstacles.
+    RETURN: None.
+    """
+
+    obstacleMngr.head, obstacleMngr.count, obstacleMngr.scrollX, obstacleMngr.scoredCount = state
+
+def measureResolutions(resolutions, duration, obstacles, only=None):
+    """
+    PURPOSE: Time a whole gameplay frame at each render resolution.
+    PARAMETER(S): resolutions (List[str]): The RESOLUTION_TIERS entries to time.
+                  duration (float): Seconds to spend on each case.
+                  obstacles (int): Obstacle pairs on screen.
+                  only (str): Only run cases whose name contains this text, None runs every case.
+    RETURN: dict. Returns the timing of each case, keyed by its name.
+    """
+
+    results = {}
+    frameCase = f'frame.game[obstacles={obstacles}]'
+
+    # Images are scaled once for the resolution a game starts at, so each one is timed in a fresh benchmark process
+    for resolution in resolutions:
+        name = f'frame.game[{resolution},obstacles={obstacles}]'
+
+        if only and only not in name:
+            continue
+
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), '--resolution', resolution, '--only', frameCase, '--obstacles', str(obstacles),
+                                 '--duration', str(duration), '--startup-runs', '0', '--resolutions'], capture_output=True, text=True, check=True,
+                                env=dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT='1'), cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+
+        # The report is the only output, starting at its opening brace
+        results[name] = json.loads(output[output.index('{'):])['results'][frameCase]
+        print(f"{name:<48} {results[name]['medianUs']:>10.1f} us", file=sys.stderr)
+
+    return results
+
+def gitCommit():
+    """
+    PURPOSE: Name the commit being benchmarked, so result files can be told apart.
+    PARAMETER(S): None.
+    RETURN: str. Returns the short commit hash, or None outside a git checkout.
+    """
+
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# --------------------------------------------------------------------------------------------------------------------------------------------------------------------
+def runBenchmarks(game, duration, obstacleCounts, only=None):
+    """
+    PURPOSE: Time every subsystem, screen and gameplay frame of a game.
+    PARAMETER(S): game (Game): The game to measure, it is left on the start menu's resources.
+                  duration (float): Seconds to spend on each case.
+                  obstacleCounts (List[int]): Obstacle pair counts to sweep the obstacle and gameplay cases over.
+                  only (str): Only run cases whose name contains this text, None runs every case.
+    RETURN: dict. Returns the timing of each case, keyed by its name.
+    """
+
+    results = {}
+
+    def measure(name, fn):
+        if only and only not in name:
+            return
+
+        results[name] = timeCall(fn, duration)
+        print(f"{name:<48} {results[name]['medianUs']:>10.1f} us", file=sys.stderr)
+
+    def countBackground(name):
+        # Blits and pixels the background pushed in the case's last call, they don't change from call to call
+        if name in results:
+            results[name]['bgBlits'] = game.bgMngr.frameBlits
+            results[name]['bgPixels'] = game.bgMngr.framePixels
+
+    screen = game.screen
+    sim = game.sim
+    player = sim.player
+    obstacleMngr = sim.obstacleMngr
+
+    # Player, its physics clamp it to the screen so it can be stepped forever
+    sim.reset(0)
+    measure('Player.update', player.update)
+    measure('Player.draw', lambda: player.draw(screen, 0.5))
+
+    # Background
+    measure('BackgroundManager.update', lambda: game.bgMngr.update(TICK_TIME))
+    measure('BackgroundManager.draw', lambda: game.bgMngr.draw(screen, 0.5))
+    countBackground('BackgroundManager.draw')
+
+    # Obstacles and a whole gameplay frame, starting every call from the same field of pairs
+    for count in obstacleCounts:
+        state = fillObstacles(obstacleMngr, count)
+
+        def updateObstacles():
+            restoreObstacles(obstacleMngr, state)
+            obstacleMngr.update()
+
+        def scoreObstacles():
+            restoreObstacles(obstacleMngr, state)
+            obstacleMngr.updateScore(player.spriteRect, 0)
+
+        def gameFrame():
+            restoreObstacles(obstacleMngr, state)
+            game.bgMngr.update(TICK_TIME)
+            sim.step(False)
+            game.tickAccumulator = TICK_TIME / 2
+            game.gameScene.render()
+
+        measure(f'ObstacleManager.update[obstacles={count}]', updateObstacles)
+        measure(f'ObstacleManager.draw[obstacles={count}]', lambda: obstacleMngr.draw(screen, 0.5))
+        measure(f'ObstacleManager.checkCollision[obstacles={count}]', lambda: obstacleMngr.checkCollision(player.spriteRect, player.spriteMask))
+        measure(f'ObstacleManager.updateScore[obstacles={count}]', scoreObstacles)
+        measure(f'frame.game[obstacles={count}]', gameFrame)
+        countBackground(f'frame.game[obstacles={count}]')
+
+    sim.reset(0)
+
+    # Score drawing, a long score is the worst case
+    sim.score = 1234567
+
+    def animatedScore():
+        game.gameOverScene.drawAnimatedScore(sim.score, SCREEN_HEIGHT / 2, 0.5)
+        game.renderer.dirtyRects.clear()  # Only present() clears these, and nothing is presented here
+
+    measure('GameScene.drawScore', game.gameScene.drawScore)
+    game.gameOverScene.loadFrames()
+    measure('GameOverScene.drawAnimatedScore', animatedScore)
+
+    # Every menu screen as one full frame of input handling and drawing
+    def measureScreen(name, scene):
+        measure(name, lambda: (scene.update(), scene.render()))
+
+    measureScreen('screen.startMenu', game.startMenuScene)
+    measureScreen('screen.settings', game.settingsScene)
+
+    game.tutorialScene.enter()
+    measureScreen('screen.tutorial', game.tutorialScene)
+    game.tutorialScene.exit()
+
+    sim.score = 12
+    game.gameOverScene.enter()
+    measureScreen('screen.gameOver', game.gameOverScene)
+    game.gameOverScene.releaseFrames()
+
+    sim.reset()
+
+    return results
+
+def compareResults(results, baseline, threshold):
+    """
+    PURPOSE: Compare the median time of every case against a stored baseline and print the differences.
+    PARAMETER(S): results (dict): The timings just measured, keyed by case name.
+                  baseline (dict): The stored timings, keyed the same way.
+                  threshold (float): Fractional slowdown beyond which a case counts as a regression.
+    RETURN: List[str]. Returns the names of the regressed cases.
+    """
+
+    regressions = []
+
+    print(f"{'case':<48} {'baseline':>10} {'current':>10} {'change':>8}")
+
+    for name, stats in results.items():
+        if name not in baseline:
+            print(f"{name:<48} {'-':>10} {stats['medianUs']:>10.1f} {'new':>8}")
+
+            continue
+
+        before, after = baseline[name]['medianUs'], stats['medianUs']
+        change = (after - before) / before if before else 0.0
+
+        # Tiny cases jitter by more than the threshold, so a regression must also cost real time
+        regressed = change > threshold and after - before > NOISE_FLOOR_US
+
+        if regressed:
+            regressions.append(name)
+
+        print(f"{name:<48} {before:>10.1f} {after:>10.1f} {change:>+7.1%}{'  REGRESSION' if regressed else ''}")
+
+    for name in baseline:
+        if name not in results:
+            print(f"{name:<48} {baseline[name]['medianUs']:>10.1f} {'-':>10} {'gone':>8}")
+
+    return regressions
+
+# --------------------------------------------------------------------------------------------------------------------------------------------------------------------
+# Time every subsystem and compare against a stored baseline
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the frame time cost of every Flip Ninja subsystem without a display.')
+    parser.add_argument('--duration', type=float, default=0.5, help='seconds spent timing each case')
+    parser.add_argument('--obstacles', type=int, nargs='+', default=OBSTACLE_COUNTS, help='obstacle pair counts to sweep')
+    parser.add_argument('--resolution', choices=RESOLUTION_TIERS, default=DEFAULT_RESOLUTION, help='resolution every case renders at')
+    parser.add_argument('--resolutions', nargs='*', choices=RESOLUTION_TIERS, default=RESOLUTIONS, help='resolutions to time a whole gameplay frame at, with the most obstacles')
+    parser.add_argument('--only', help='only run cases whose name contains this text')
+    parser.add_argument('--output', metavar='FILE', help='write the results as JSON to FILE')
+    parser.add_argument('--baseline', metavar='FILE', help='compare against results saved earlier with --output')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD, help='slowdown of a median that counts as a regression, 0.1 is 10%%')
+
+    parser.add_argument('--startup-runs', type=int, default=STARTUP_RUNS, help='fresh game processes to time startup with, 0 skips startup')
+    args = parser.parse_args()
+
+    results = {}
+
+    # Startup first, before this process has warmed the disk cache any further
+    if args.startup_runs > 0 and (not args.only or args.only in 'startup.firstFrame' or args.only in 'startup.loaded'):
+        for name, stats in measureStartup(args.startup_runs, args.resolution).items():
+            if not args.only or args.only in name:
+                results[name] = stats
+                print(f"{name:<48} {stats['medianUs']:>10.1f} us", file=sys.stderr)
+
+    game = Game(resolution=args.resolution)
+    game.finishLoading()  # Nothing runs the game's loop here, so load everything up front
+    results.update(runBenchmarks(game, args.duration, args.obstacles, args.only))
+    game.writer.close()
+
+    results.update(measureResolutions(args.resolutions, args.duration, max(args.obstacles), args.only))
+
+    report = {'version': RESULTS_VERSION,
+              'meta': {'commit': gitCommit(),
+                       'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                       'python': platform.python_version(),
+                       'pygame': pygame.version.ver,
+                       'sdl': '.'.join(map(str, pygame.get_sdl_version())),
+                       'platform': platform.platform(),
+                       'videoDriver': pygame.display.get_driver(),
+                       'resolution': args.resolution,
+                       'resolutions': args.resolutions,
+                       'duration': args.duration},
+              'results': results}
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as file:
+            baseline = json.load(file)['results']
+
+        # Cases filtered out of this run are left out of the comparison rather than reported missing
+        if args.only:
+            baseline = {name: stats for name, stats in baseline.items() if args.only in name}
+
+        regressions = compareResults(results, baseline, args.threshold)
+
+        print(f"Cases: {len(results)}  Regressions: {len(regressions)}")
+        sys.exit(1 if regressions else 0)
+
+    if not args.output:
+        json.dump(report, sys.stdout, indent=2)
+        print()
@@ -0,0 +1,174 @@
+"""
+AUTHOR: ARFAA MUMTAZ
+PROJECT: CMPT 230 GAME
+DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIGATE THROUGH OBSTACLES
+             IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
+             LAST TIME.
+"""
+# Import statements
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Run without a window or an audio device
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Star import the simulation file
+from Simulation import *
+from Replay import Replay
+
+# --------------------------------------------------------------------------------------------------------------------------------------------------------------------
+def gapPolicy(sim):
+    """
+    PURPOSE: Bot that flips gravity whenever it is pulling the player away from the centre of the next gap.
+    PARAMETER(S): sim (Simulation): The simulation being played.
+    RETURN: bool. Returns True to flip gravity this tick.
+    """
+
+    gap = sim.obstacleMngr.nextGap(sim.player.spriteRect)
+    target = SCREEN_HEIGHT / 2 if gap is None else (gap[0] + gap[1]) / 2
+
+    # Gravity pulls down unless flipped, so flip when it pulls away from the target
+    if sim.player.spriteRect.centery < target:
+        return sim.player.gravFlipped
+
+    return not sim.player.gravFlipped
+
+def randomPolicy(rate):
+    """
+    PURPOSE: Build a bot that flips gravity at random.
+    PARAMETER(S): rate (float): The chance of flipping on any given tick.
+    RETURN: callable. Returns a policy usable with Simulation.run.
+    """
+
+    return lambda sim: random.random() < rate
+
+def checkAllocations(sim, policy, frames, warmupFrames=600):
+    """
+    PURPOSE: Measure the memory the simulation keeps hold of while it runs, which should be none once it is warmed up.
+    PARAMETER(S): sim (Simulation): The simulation to step.
+                  policy (callable): The bot deciding when to flip, its own allocations are not counted.
+                  frames (int): The number of ticks to measure.
+                  warmupFrames (int): Ticks run first so the obstacle store reaches its steady-state size.
+    RETURN: List[tracemalloc.StatisticDiff]. Returns the simulation source lines that kept allocating.
+    """
+
+    def stepFrames(count):
+        for _ in range(count):
+            if sim.dead:
+                sim.reset()  # Runs are recycled in place, so restarting must not allocate either
+
+            sim.step(policy(sim))
+
+    sim.reset()
+    stepFrames(warmupFrames)
+
+    # Only count memory allocated by the simulation modules
+    simFiles = [tracemalloc.Filter(True, f'*{os.sep}{name}.py') for name in ['Simulation', 'Player', 'ObstacleManager', 'Collision']]
+
+    # Trace one batch of ticks before the measured one, so values that are simply replaced each tick appear in both snapshots
+    tracemalloc.start()
+    stepFrames(frames)
+    before = tracemalloc.take_snapshot().filter_traces(simFiles)
+    stepFrames(frames)
+    after = tracemalloc.take_snapshot().filter_traces(simFiles)
+    tracemalloc.stop()
+
+    # A single extra block is just the current value of a counter or velocity, anything more is memory piling up
+    return [stat for stat in after.compare_to(before, 'lineno') if stat.count_diff > 1]
+
+def verifyReplays(sim, paths):
+    """
+    PURPOSE: Re-simulate recorded runs and report every one that doesn't end as recorded.
+    PARAMETER(S): sim (Simulation): The simulation to replay on.
+                  paths (List[str]): Replay files, or folders of them.
+    RETURN: Tuple[int, int, int]. Returns the number of replays checked, the number that failed and the ticks simulated.
+    """
+
+    files = []
+
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith('.rpl'))
+
+        else:
+            files.append(path)
+
+    failed = totalFrames = 0
+
+    for path in files:
+        try:
+            replay = Replay.load(path)
+
+        except (OSError, ValueError) as e:
+            print(f"{path}: {e}")
+            failed += 1
+
+            continue
+
+        if not replay.verify(sim):
+            print(f"{path}: recorded score {replay.score} in {replay.frames} ticks, replayed score {sim.score} in {sim.frame} ticks")
+            failed += 1
+
+        totalFrames += sim.frame
+
+    return len(files), failed, totalFrames
+
+# --------------------------------------------------------------------------------------------------------------------------------------------------------------------
+# Simulate bot runs and report the throughput
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run Flip Ninja without a display, as fast as possible.')
+    parser.add_argument('--runs', type=int, default=100, help='number of runs to simulate')
+    parser.add_argument('--max-frames', type=int, default=100000, help='tick limit per run')
+    parser.add_argument('--policy', choices=['gap', 'random'], default='gap', help='bot used to play each run')
+    parser.add_argument('--seed', type=int, default=None, help='seed for obstacle placement and the random bot')
+    parser.add_argument('--check-allocs', type=int, default=0, metavar='TICKS', help='instead of benchmarking, check that TICKS ticks allocate no memory')
+    parser.add_argument('--record', metavar='DIR', help='save a replay of every run into DIR')
+    parser.add_argument('--verify', nargs='+', metavar='PATH', help='instead of benchmarking, replay these files or folders of .rpl files and check each ends as recorded')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    policy = gapPolicy if args.policy == 'gap' else randomPolicy(0.05)
+
+    sim = Simulation()
+
+    if args.check_allocs:
+        growth = checkAllocations(sim, policy, args.check_allocs)
+
+        for stat in growth:
+            print(stat)
+
+        print(f"Ticks: {args.check_allocs}  Memory kept by the simulation: {sum(stat.size_diff for stat in growth)} bytes")
+        sys.exit(1 if growth else 0)
+
+    if args.verify:
+        startTime = time.perf_counter()
+        checked, failed, totalFrames = verifyReplays(sim, args.verify)
+        elapsed = time.perf_counter() - startTime
+
+        print(f"Replays: {checked}  Failed: {failed}  Ticks: {totalFrames}  Time: {elapsed:.2f}s  Ticks/s: {totalFrames / max(elapsed, 1e-9):,.0f}")
+        sys.exit(1 if failed else 0)
+
+    if args.record:
+        os.makedirs(args.record, exist_ok=True)
+
+    scores = []
+    totalFrames = 0
+    startTime = time.perf_counter()
+
+    for run in range(args.runs):
+        sim.reset()
+        scores.append(sim.run(policy, args.max_frames))
+        totalFrames += sim.frame
+
+        if args.record:
+            Replay.fromSimulation(sim).save(os.path.join(args.record, f'run{run:05d}.rpl'))
+
+    elapsed = time.perf_counter() - startTime
+
+    print(f"Runs: {args.runs}  Ticks: {totalFrames}  Time: {elapsed:.2f}s  Ticks/s: {totalFrames / elapsed:,.0f}")
+    print(f"Best score: {max(scores)}  Mean score: {sum(scores) / len(scores):.2f}")
@@ -5,14 +5,53 @@ DESCRIPTION: A GAME REVOLVING A NINJA THAT CAN FLIP HIS GRAVITY AND HAS OT NAVIG
              IN A JOURNEY TOWARDS SELF-IMPROVEMENT BECAUSE HE IS ALWAYS TRYING TO DO BETTER THAN HE DID
              LAST TIME.
 """
+# Note the launch time before anything else is imported, so startup times include importing the game
+import time
+LAUNCH_TIME = time.perf_counter()
+
 # Import asyncio
 import asyncio
+import argparse
+import json
 
 # Star import the game file
 from Game import *
 
+async def reportStartup(game):
+    """
+    PURPOSE: Run the game until it has shown its first frame and loaded every asset, then print its startup times and quit.
+    PARAMETER(S): game (Game): The game to start.
+    RETURN: None. Prints the times in milliseconds as one line of JSON.
+    """
+
+    async def watch():
+        while game.firstFrameTime is None or game.loadedTime is None:
+            await asyncio.sleep(0.001)
+
+        print(json.dumps({'firstFrameMs': game.firstFrameTime * 1000, 'loadedMs': game.loadedTime * 1000}))
+        game.running = False
+
+    watcher = asyncio.get_running_loop().create_task(watch())
+    await game.run()
+
 # --------------------------------------------------------------------------------------------------------------------------------------------------------------------
 # Create an instance of the game
 if __name__ == '__main__':
-    game = Game()
-    asyncio.run(game.run())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Flip Ninja')
+    parser.add_argument('--replay', metavar='FILE', help='watch a recorded run instead of playing')
+    parser.add_argument('--speed', type=float, default=1.0, help='how many times faster than real time to play the replay')
+    parser.add_argument('--profile', action='store_true', help='start with the profiler overlay shown, F3 toggles it and F4 captures a trace')
+    parser.add_argument('--startup-report', action='store_true', help='quit once everything has loaded, printing the startup times as JSON')
+    parser.add_argument('--resolution', choices=RESOLUTION_TIERS, help=f'resolution to render at, the frame is scaled to the window; defaults to {DEFAULT_RESOLUTION}')
+    parser.add_argument('--fullscreen', action='store_true', help='fill the whole display')
+    args = parser.parse_args()
+
+    game = Game(LAUNCH_TIME, args.resolution, args.fullscreen)
+
+    if args.profile:
+        game.toggleProfiler()
+
+    if args.replay:
+        game.playReplay(Replay.load(args.replay), args.speed)
+
+    asyncio.run(reportStartup(game) if args.startup_report else game.run())